@@ -19,6 +19,7 @@ sys.path.append(str(Path(__file__).parent))
 from api.routes import transcription, health, youtube, style_analysis
 from core.config import settings
 from core.redis_client import redis_client
+from services.process_pool import shutdown_process_pool
 
 # Load environment variables
 load_dotenv("../.env")
@@ -64,6 +65,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("👋 Shutting down Transcription Service...")
     await redis_client.close()
+    shutdown_process_pool()
 
 # Create FastAPI application
 app = FastAPI(
@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers shared by the services package
+"""
+
+import sys
+
+# dataclass(slots=True) requires Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
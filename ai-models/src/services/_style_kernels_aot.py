@@ -0,0 +1,61 @@
+"""
+Style Kernels (AOT build)
+Numeric kernels for the style detector, compiled ahead of time with numba.pycc
+
+Running this module writes the `style_kernels` extension next to it:
+
+    cd ai-models/src && python -m services._style_kernels_aot
+
+style_detector imports the compiled extension when present and otherwise
+JIT-compiles the same Python functions with numba (or uses NumPy).
+"""
+
+import os
+
+import numpy as np
+
+
+def interval_sim(a, b):
+    """Pearson correlation of two 12-bin interval histograms in one fused pass"""
+    if a.shape[0] == 0 or b.shape[0] == 0:
+        return 0.0
+
+    # One bin per interval class (semitones mod 12), same axis for both inputs
+    hist1 = np.zeros(12)
+    hist2 = np.zeros(12)
+    for i in range(a.shape[0]):
+        hist1[abs(a[i]) % 12] += 1.0
+    for i in range(b.shape[0]):
+        hist2[abs(b[i]) % 12] += 1.0
+
+    s1 = 0.0
+    s2 = 0.0
+    sq1 = 0.0
+    sq2 = 0.0
+    dot = 0.0
+    for i in range(12):
+        s1 += hist1[i]
+        s2 += hist2[i]
+        sq1 += hist1[i] * hist1[i]
+        sq2 += hist2[i] * hist2[i]
+        dot += hist1[i] * hist2[i]
+
+    denom = np.sqrt((12 * sq1 - s1 * s1) * (12 * sq2 - s2 * s2))
+    if denom == 0.0:
+        # Constant histogram: treat as uncorrelated instead of returning NaN
+        return 0.0
+    return (12 * dot - s1 * s2) / denom
+
+
+def build():
+    """Compile the kernels into the style_kernels extension module"""
+    from numba.pycc import CC
+
+    cc = CC('style_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('interval_sim', 'f8(i8[:], i8[:])')(interval_sim)
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
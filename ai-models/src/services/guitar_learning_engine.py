@@ -4,46 +4,81 @@ Guitar Learning Engine
 """
 
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, replace
+import functools
+from enum import IntEnum
+import logging
+import re
+import sys
 import numpy as np
 import json
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    logging.info("numba not installed. Performance evaluation runs in pure Python.")
 
-class GuitarTechnique(Enum):
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# 테크닉 문자열 레이블 (GuitarTechnique 값 순서와 일치)
+_TECHNIQUE_NAMES: Tuple[str, ...] = (
+    "alternate_picking", "economy_picking", "sweep_picking", "hybrid_picking", "fingerpicking",
+    "hammer_on", "pull_off", "slide", "bend", "vibrato", "tapping",
+    "legato", "string_skipping", "tremolo_picking", "harmonics", "palm_muting", "rake",
+)
+
+_POSITION_NAMES: Tuple[str, ...] = ("open", "first", "fifth", "seventh", "twelfth", "fifteenth")
+
+
+class GuitarTechnique(IntEnum):
     """기타 테크닉 분류"""
     # Picking Techniques
-    ALTERNATE_PICKING = "alternate_picking"
-    ECONOMY_PICKING = "economy_picking"
-    SWEEP_PICKING = "sweep_picking"
-    HYBRID_PICKING = "hybrid_picking"
-    FINGERPICKING = "fingerpicking"
+    ALTERNATE_PICKING = 0
+    ECONOMY_PICKING = 1
+    SWEEP_PICKING = 2
+    HYBRID_PICKING = 3
+    FINGERPICKING = 4
     
     # Fretting Techniques
-    HAMMER_ON = "hammer_on"
-    PULL_OFF = "pull_off"
-    SLIDE = "slide"
-    BEND = "bend"
-    VIBRATO = "vibrato"
-    TAPPING = "tapping"
+    HAMMER_ON = 5
+    PULL_OFF = 6
+    SLIDE = 7
+    BEND = 8
+    VIBRATO = 9
+    TAPPING = 10
     
     # Advanced Techniques
-    LEGATO = "legato"
-    STRING_SKIPPING = "string_skipping"
-    TREMOLO_PICKING = "tremolo_picking"
-    HARMONICS = "harmonics"
-    PALM_MUTING = "palm_muting"
-    RAKE = "rake"
+    LEGATO = 11
+    STRING_SKIPPING = 12
+    TREMOLO_PICKING = 13
+    HARMONICS = 14
+    PALM_MUTING = 15
+    RAKE = 16
+
+    @property
+    def label(self) -> str:
+        return _TECHNIQUE_NAMES[self]
 
 
-class FretboardPosition(Enum):
+class FretboardPosition(IntEnum):
     """프렛보드 포지션"""
-    OPEN = "open"  # 0-3 fret
-    FIRST = "first"  # 1-5 fret
-    FIFTH = "fifth"  # 5-9 fret
-    SEVENTH = "seventh"  # 7-12 fret
-    TWELFTH = "twelfth"  # 12-17 fret
-    FIFTEENTH = "fifteenth"  # 15-19 fret
+    OPEN = 0  # 0-3 fret
+    FIRST = 1  # 1-5 fret
+    FIFTH = 2  # 5-9 fret
+    SEVENTH = 3  # 7-12 fret
+    TWELFTH = 4  # 12-17 fret
+    FIFTEENTH = 5  # 15-19 fret
+
+    @property
+    def label(self) -> str:
+        return _POSITION_NAMES[self]
 
 
 @dataclass
@@ -57,7 +92,7 @@ class GuitarExercise:
     tab_notation: str
     fingering: List[int]
     position: FretboardPosition
-    tips: List[str]
+    tips: Tuple[str, ...]
 
 
 @dataclass 
@@ -68,14 +103,131 @@ class Fingering:
     finger: int  # 1=index, 2=middle, 3=ring, 4=pinky, 0=open
     position: FretboardPosition
 
+    # 노트당 4바이트 구조화 레코드 (내부 파이프라인용)
+    ARRAY_DTYPE = np.dtype([('string', 'i1'), ('fret', 'i1'), ('finger', 'i1'), ('pos', 'i1')])
+
+    @classmethod
+    def from_record(cls, rec) -> "Fingering":
+        """구조화 배열 레코드를 Fingering으로 변환"""
+        return cls(
+            fret=int(rec['fret']),
+            string=int(rec['string']),
+            finger=int(rec['finger']),
+            position=FretboardPosition(rec['pos'])
+        )
+
+    @staticmethod
+    def to_array(fingerings: List["Fingering"]) -> np.ndarray:
+        """Fingering 목록을 구조화 배열로 변환"""
+        arr = np.empty(len(fingerings), dtype=Fingering.ARRAY_DTYPE)
+        for i, f in enumerate(fingerings):
+            arr[i] = (f.string, f.fret, f.finger, f.position)
+        return arr
+
+
+# 음이름 <-> 반음 테이블
+_SEMI_TO_NOTE: Tuple[str, ...] = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+NOTE_TO_SEMI: Dict[str, int] = {note: semi for semi, note in enumerate(_SEMI_TO_NOTE)}
+
+# 표준 튜닝 개방현 반음 (6번줄 low E부터) 및 프렛 수
+_STANDARD_TUNING_SEMIS = np.array([NOTE_TO_SEMI[n] for n in ('E', 'A', 'D', 'G', 'B', 'E')], dtype=np.int8)
+_NUM_FRETS = 25  # 0-24 frets
+_SEARCH_FRETS = 20  # 운지 탐색은 20프렛까지만
+
+# 표준 튜닝 개방현 MIDI 피치 (1번줄=high E ... 6번줄=low E)
+_OPEN_STRING_MIDI = {'e': 64, 'B': 59, 'G': 55, 'D': 50, 'A': 45, 'E': 40}
+_TAB_FRET_PATTERN = re.compile(r'\d+')
+
+# 평가 커널용 테크닉 코드
+TECHNIQUE_PICKED = 0
+TECHNIQUE_LEGATO = 1
+_LEGATO_TECHNIQUES = frozenset({
+    GuitarTechnique.LEGATO,
+    GuitarTechnique.HAMMER_ON,
+    GuitarTechnique.PULL_OFF,
+    GuitarTechnique.TAPPING,
+})
+
+
+@njit(cache=True)
+def _evaluate_all(recorded: np.ndarray,
+                  target_times: np.ndarray,
+                  target_pitches: np.ndarray,
+                  technique: int) -> Tuple[float, float, float]:
+    """음정/타이밍/테크닉 평가를 한 번의 순회로 계산
+
+    recorded: (N, 3) float64 배열 [onset(초), MIDI 피치, velocity], onset 순 정렬
+    target_times / target_pitches: 목표 노트의 onset과 피치, onset 순 정렬
+    """
+    n = recorded.shape[0]
+    m = target_times.shape[0]
+    if n == 0 or m == 0:
+        return 0.0, 0.0, 0.0
+
+    spacing = target_times[1] - target_times[0] if m > 1 else 1.0
+    if spacing <= 0.0:
+        spacing = 1.0
+
+    pitch_hits = 0
+    timing_error = 0.0
+    legato_transitions = 0
+    vel_sum = 0.0
+    vel_sq_sum = 0.0
+    j = 0
+
+    for i in range(n):
+        onset = recorded[i, 0]
+        pitch = recorded[i, 1]
+        velocity = recorded[i, 2]
+
+        # 가장 가까운 목표 onset (양쪽 모두 정렬되어 있으므로 포인터만 전진)
+        while j + 1 < m and abs(target_times[j + 1] - onset) <= abs(target_times[j] - onset):
+            j += 1
+
+        error = abs(target_times[j] - onset) / spacing
+        timing_error += error if error < 1.0 else 1.0
+
+        if round(pitch) == target_pitches[j]:
+            pitch_hits += 1
+
+        if i > 0 and velocity < recorded[i - 1, 2]:
+            legato_transitions += 1
+        vel_sum += velocity
+        vel_sq_sum += velocity * velocity
+
+    pitch_acc = pitch_hits / max(n, m)
+    timing_acc = 1.0 - timing_error / n
+
+    if technique == TECHNIQUE_LEGATO:
+        # 피킹하지 않은 노트는 직전 노트보다 약하게 울림
+        technique_score = legato_transitions / (n - 1) if n > 1 else 0.0
+    else:
+        # 피킹 테크닉은 다이내믹 균일성으로 평가
+        mean = vel_sum / n
+        if mean > 0.0:
+            variance = vel_sq_sum / n - mean * mean
+            cv = np.sqrt(variance) / mean if variance > 0.0 else 0.0
+            technique_score = 1.0 - cv if cv < 1.0 else 0.0
+        else:
+            technique_score = 0.0
+
+    return pitch_acc, timing_acc, technique_score
+
 
 class GuitarLearningEngine:
     """기타 학습 엔진"""
     
     def __init__(self):
         self.techniques_db = self._load_techniques_database()
+        self.fretboard_np = self._initialize_fretboard_np()
         self.fretboard = self._initialize_fretboard()
-        self.exercises_bank = self._load_exercise_bank()
+        self._tips_pool: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self.exercises_bank = [self._intern_exercise(ex) for ex in self._load_exercise_bank()]
+        # 난이도 범위 질의용 정렬 인덱스 (stable 정렬로 뱅크 내 순서 유지)
+        self._exercises_sorted = sorted(self.exercises_bank, key=lambda e: e.difficulty)
+        self._difficulties = np.fromiter(
+            (e.difficulty for e in self._exercises_sorted), dtype=np.int8, count=len(self._exercises_sorted)
+        )
         self.legendary_licks = self._load_legendary_licks()
         
     def _load_techniques_database(self) -> Dict:
@@ -143,23 +295,17 @@ class GuitarLearningEngine:
             }
         }
     
+    def _initialize_fretboard_np(self) -> np.ndarray:
+        """프렛보드 반음 테이블 (6 x 25, 행 = 줄 번호 - 1)"""
+        frets = np.arange(_NUM_FRETS, dtype=np.int8)
+        return (_STANDARD_TUNING_SEMIS[:, None] + frets[None, :]) % 12
+    
     def _initialize_fretboard(self) -> Dict:
-        """프렛보드 노트 맵 초기화"""
-        standard_tuning = ['E', 'A', 'D', 'G', 'B', 'E']
-        chromatic = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        
-        fretboard = {}
-        for string_num, open_note in enumerate(standard_tuning, 1):
-            string_notes = []
-            start_index = chromatic.index(open_note)
-            
-            for fret in range(25):  # 0-24 frets
-                note_index = (start_index + fret) % 12
-                string_notes.append(chromatic[note_index])
-            
-            fretboard[string_num] = string_notes
-            
-        return fretboard
+        """프렛보드 노트 맵 초기화 (fretboard_np에서 파생)"""
+        return {
+            i + 1: [_SEMI_TO_NOTE[semi] for semi in row]
+            for i, row in enumerate(self.fretboard_np.tolist())
+        }
     
     def _load_exercise_bank(self) -> List[GuitarExercise]:
         """연습 문제 은행"""
@@ -173,7 +319,7 @@ class GuitarLearningEngine:
                 tab_notation="e|--1-2-3-4-5-4-3-2--|\nB|--1-2-3-4-5-4-3-2--|",
                 fingering=[1, 2, 3, 4],
                 position=FretboardPosition.FIRST,
-                tips=["Keep fingers close to frets", "Maintain steady tempo"]
+                tips=("Keep fingers close to frets", "Maintain steady tempo")
             ),
             GuitarExercise(
                 name="Minor Pentatonic Pattern 1",
@@ -184,7 +330,7 @@ class GuitarLearningEngine:
                 tab_notation="e|--------5-8--------|\nB|------5-8----------|\nG|----5-7------------|",
                 fingering=[1, 4, 1, 3],
                 position=FretboardPosition.FIFTH,
-                tips=["Start with downstroke", "Keep pick angle consistent"]
+                tips=("Start with downstroke", "Keep pick angle consistent")
             ),
             GuitarExercise(
                 name="Sweep Arpeggio Am",
@@ -195,7 +341,7 @@ class GuitarLearningEngine:
                 tab_notation="e|--------12-17-------|\nB|-----13-------13----|\nG|--14-----------14---|",
                 fingering=[1, 2, 4],
                 position=FretboardPosition.TWELFTH,
-                tips=["One continuous motion", "Roll fingers for clean notes"]
+                tips=("One continuous motion", "Roll fingers for clean notes")
             ),
             GuitarExercise(
                 name="Legato Exercise",
@@ -206,12 +352,21 @@ class GuitarLearningEngine:
                 tab_notation="e|--5h7p5h8p5h7p5--|\nB|-----------------|",
                 fingering=[1, 3, 1, 4, 1, 3, 1],
                 position=FretboardPosition.FIFTH,
-                tips=["Strong hammer-ons", "Light pull-offs", "Minimal picking"]
+                tips=("Strong hammer-ons", "Light pull-offs", "Minimal picking")
             )
         ]
         
         return exercises
     
+    def _intern_exercise(self, exercise: GuitarExercise) -> GuitarExercise:
+        """탭/팁 문자열을 intern하여 동일한 조각을 공유"""
+        tips = tuple(sys.intern(tip) for tip in exercise.tips)
+        return replace(
+            exercise,
+            tab_notation=sys.intern(exercise.tab_notation),
+            tips=self._tips_pool.setdefault(tips, tips)
+        )
+    
     def _load_legendary_licks(self) -> Dict:
         """전설적인 기타리스트들의 시그니처 릭"""
         return {
@@ -300,41 +455,44 @@ class GuitarLearningEngine:
     
     def generate_fingering(self, notes: List[str], position_preference: Optional[FretboardPosition] = None) -> List[Fingering]:
         """최적 운지법 생성"""
-        fingerings = []
+        records = self.generate_fingering_array(notes, position_preference)
+        return [Fingering.from_record(rec) for rec in records]
+    
+    def generate_fingering_array(self, notes: List[str], position_preference: Optional[FretboardPosition] = None) -> np.ndarray:
+        """최적 운지법 생성 (Fingering.ARRAY_DTYPE 구조화 배열 반환)"""
+        fingerings = np.empty(len(notes), dtype=Fingering.ARRAY_DTYPE)
+        last = None
         
-        for note in notes:
+        for i, note in enumerate(notes):
             possible_positions = self._find_note_positions(note)
             
-            if position_preference:
+            if position_preference is not None:
                 # 선호 포지션에서 찾기
-                preferred = [p for p in possible_positions if self._get_position(p[1]) == position_preference]
-                if preferred:
-                    possible_positions = preferred
+                mask = np.fromiter(
+                    (self._get_position(fret) == position_preference for fret in possible_positions[:, 1]),
+                    dtype=bool, count=len(possible_positions)
+                )
+                if mask.any():
+                    possible_positions = possible_positions[mask]
             
             # 가장 효율적인 포지션 선택
-            best_position = self._select_best_position(possible_positions, fingerings)
+            best_position = self._select_best_position(possible_positions, last)
             
-            fingering = Fingering(
-                fret=best_position[1],
-                string=best_position[0],
-                finger=self._assign_finger(best_position[1], position_preference),
-                position=self._get_position(best_position[1])
+            fingerings[i] = (
+                best_position[0],
+                best_position[1],
+                self._assign_finger(best_position[1], position_preference),
+                self._get_position(best_position[1])
             )
-            
-            fingerings.append(fingering)
+            last = best_position
         
         return fingerings
     
-    def _find_note_positions(self, note: str) -> List[Tuple[int, int]]:
-        """노트의 모든 가능한 포지션 찾기"""
-        positions = []
-        
-        for string_num, string_notes in self.fretboard.items():
-            for fret, fret_note in enumerate(string_notes[:20]):  # 20프렛까지만
-                if fret_note == note:
-                    positions.append((string_num, fret))
-        
-        return positions
+    def _find_note_positions(self, note: str) -> np.ndarray:
+        """노트의 모든 가능한 포지션 찾기 ((N, 2) int8 배열, 열 = [string, fret])"""
+        semi = NOTE_TO_SEMI.get(note, -1)
+        strings, frets = np.nonzero(self.fretboard_np[:, :_SEARCH_FRETS] == semi)
+        return np.column_stack((strings + 1, frets)).astype(np.int8)
     
     def _get_position(self, fret: int) -> FretboardPosition:
         """프렛 번호로 포지션 결정"""
@@ -351,15 +509,14 @@ class GuitarLearningEngine:
         else:
             return FretboardPosition.FIFTEENTH
     
-    def _select_best_position(self, positions: List[Tuple[int, int]], previous: List[Fingering]) -> Tuple[int, int]:
-        """가장 효율적인 포지션 선택"""
-        if not previous:
+    def _select_best_position(self, positions: np.ndarray, last: Optional[np.ndarray]) -> np.ndarray:
+        """가장 효율적인 포지션 선택 (last: 직전 (string, fret))"""
+        if last is None:
             # 중간 포지션 선호 (5-7 프렛)
             return min(positions, key=lambda p: abs(p[1] - 6))
         
-        last = previous[-1]
         # 이전 포지션과 가장 가까운 위치 선택
-        return min(positions, key=lambda p: abs(p[1] - last.fret) + abs(p[0] - last.string))
+        return min(positions, key=lambda p: abs(p[1] - last[1]) + abs(p[0] - last[0]))
     
     def _assign_finger(self, fret: int, position: Optional[FretboardPosition]) -> int:
         """프렛에 적절한 손가락 할당"""
@@ -382,14 +539,16 @@ class GuitarLearningEngine:
     
     def recommend_exercises(self, weakness: str, level: int) -> List[GuitarExercise]:
         """약점 기반 연습 추천"""
-        relevant_exercises = []
+        # 난이도가 적절한 범위를 이진 탐색으로 추출
+        lo = np.searchsorted(self._difficulties, level - 1, side='left')
+        hi = np.searchsorted(self._difficulties, level + 1, side='right')
         
-        for exercise in self.exercises_bank:
-            # 난이도가 적절한 범위인지 확인
-            if level - 1 <= exercise.difficulty <= level + 1:
-                # 약점과 관련된 테크닉인지 확인
-                if weakness.lower() in exercise.technique.value:
-                    relevant_exercises.append(exercise)
+        # 약점과 관련된 테크닉인지 확인
+        weakness = weakness.lower()
+        relevant_exercises = [
+            exercise for exercise in self._exercises_sorted[lo:hi]
+            if weakness in exercise.technique.label
+        ]
         
         return relevant_exercises[:3]  # 상위 3개 추천
     
@@ -408,19 +567,19 @@ class GuitarLearningEngine:
         # 테크닉별 연습 패턴 생성
         if technique == GuitarTechnique.ALTERNATE_PICKING:
             tab = self._generate_picking_pattern(difficulty)
-            tips = ["Focus on pick angle", "Minimize motion", "Stay relaxed"]
+            tips = ("Focus on pick angle", "Minimize motion", "Stay relaxed")
         elif technique == GuitarTechnique.LEGATO:
             tab = self._generate_legato_pattern(difficulty)
-            tips = ["Strong hammer-ons", "Smooth pull-offs", "Minimal picking"]
+            tips = ("Strong hammer-ons", "Smooth pull-offs", "Minimal picking")
         elif technique == GuitarTechnique.SWEEP_PICKING:
             tab = self._generate_sweep_pattern(difficulty)
-            tips = ["Continuous motion", "Proper muting", "Even timing"]
+            tips = ("Continuous motion", "Proper muting", "Even timing")
         else:
             tab = "e|--5-7-8-7-5--|"
-            tips = ["Practice slowly", "Focus on accuracy"]
+            tips = ("Practice slowly", "Focus on accuracy")
         
         return GuitarExercise(
-            name=f"Custom {technique.value} Exercise",
+            name=f"Custom {technique.label} Exercise",
             technique=technique,
             difficulty=difficulty,
             tempo_bpm=base_tempo,
@@ -470,17 +629,16 @@ class GuitarLearningEngine:
             "score": 0
         }
         
-        # 음정 정확도 계산
-        pitch_accuracy = self._calculate_pitch_accuracy(recorded_notes, target_exercise)
-        evaluation["overall_accuracy"] = pitch_accuracy
-        
-        # 타이밍 정확도 계산  
-        timing_accuracy = self._calculate_timing_accuracy(recorded_notes, target_exercise.tempo_bpm)
-        evaluation["timing_accuracy"] = timing_accuracy
-        
-        # 테크닉 품질 평가
-        technique_score = self._evaluate_technique_quality(recorded_notes, target_exercise.technique)
-        evaluation["technique_quality"] = technique_score
+        # 음정/타이밍/테크닉을 단일 패스로 평가
+        recorded = self._recorded_to_array(recorded_notes)
+        target_times, target_pitches = self._exercise_targets(target_exercise)
+        technique_code = TECHNIQUE_LEGATO if target_exercise.technique in _LEGATO_TECHNIQUES else TECHNIQUE_PICKED
+        pitch_accuracy, timing_accuracy, technique_score = _evaluate_all(
+            recorded, target_times, target_pitches, technique_code
+        )
+        evaluation["overall_accuracy"] = float(pitch_accuracy)
+        evaluation["timing_accuracy"] = float(timing_accuracy)
+        evaluation["technique_quality"] = float(technique_score)
         
         # 종합 점수
         evaluation["score"] = int((pitch_accuracy + timing_accuracy + technique_score) / 3 * 100)
@@ -495,31 +653,47 @@ class GuitarLearningEngine:
             evaluation["improvement_areas"].append("Timing consistency")
         
         if technique_score < 0.7:
-            evaluation["specific_feedback"].append(f"Practice {target_exercise.technique.value} isolation exercises")
+            evaluation["specific_feedback"].append(f"Practice {target_exercise.technique.label} isolation exercises")
             evaluation["improvement_areas"].append("Technique refinement")
         
         return evaluation
     
-    def _calculate_pitch_accuracy(self, recorded: List[Dict], exercise: GuitarExercise) -> float:
-        """음정 정확도 계산"""
-        # 실제 구현에서는 오디오 분석 수행
-        # 여기서는 시뮬레이션
-        return np.random.uniform(0.7, 1.0)
-    
-    def _calculate_timing_accuracy(self, recorded: List[Dict], target_bpm: int) -> float:
-        """타이밍 정확도 계산"""
-        # 실제 구현에서는 onset detection 수행
-        return np.random.uniform(0.6, 0.95)
-    
-    def _evaluate_technique_quality(self, recorded: List[Dict], technique: GuitarTechnique) -> float:
-        """테크닉 품질 평가"""
-        # 실제 구현에서는 테크닉별 특징 분석
-        return np.random.uniform(0.65, 0.9)
+    def _recorded_to_array(self, recorded: List[Dict]) -> np.ndarray:
+        """녹음된 노트를 (N, 3) [onset, pitch, velocity] 배열로 변환"""
+        arr = np.empty((len(recorded), 3), dtype=np.float64)
+        for i, note in enumerate(recorded):
+            arr[i, 0] = note.get("time", 0.0)
+            arr[i, 1] = note.get("pitch", 0)
+            arr[i, 2] = note.get("velocity", 100)
+        return arr[np.argsort(arr[:, 0], kind="stable")]
+    
+    def _exercise_targets(self, exercise: GuitarExercise) -> Tuple[np.ndarray, np.ndarray]:
+        """탭 악보에서 목표 onset과 MIDI 피치 추출 (한 칸 = 한 박)"""
+        events = []
+        for line in exercise.tab_notation.splitlines():
+            label, _, body = line.partition('|')
+            open_midi = _OPEN_STRING_MIDI.get(label.strip())
+            if open_midi is None:
+                continue
+            for match in _TAB_FRET_PATTERN.finditer(body):
+                events.append((match.start(), open_midi + int(match.group())))
+        events.sort()
+        
+        beat = 60.0 / exercise.tempo_bpm
+        target_times = np.arange(len(events), dtype=np.float64) * beat
+        target_pitches = np.array([pitch for _, pitch in events], dtype=np.float64)
+        return target_times, target_pitches
+
+
+@functools.cache
+def get_engine() -> GuitarLearningEngine:
+    """공유 엔진 인스턴스 (초기화 후 읽기 전용)"""
+    return GuitarLearningEngine()
 
 
 # 사용 예시
 if __name__ == "__main__":
-    engine = GuitarLearningEngine()
+    engine = get_engine()
     
     # 연주 스타일 분석
     audio_features = {
@@ -532,7 +706,7 @@ if __name__ == "__main__":
     
     style = engine.analyze_playing_style(audio_features)
     print("Playing Style Analysis:")
-    print(f"  Primary Technique: {style['primary_technique'].value}")
+    print(f"  Primary Technique: {style['primary_technique'].label}")
     print(f"  Genre Affinity: {style['genre_affinity']}")
     
     # 운지법 생성
@@ -15,7 +15,7 @@ Features:
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
@@ -25,6 +25,20 @@ import pretty_midi
 from music21 import stream, note, chord, tempo, meter, key
 from music21.analysis import discrete
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from ._compat import DATACLASS_SLOTS
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,14 +47,42 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Common chord patterns (intervals from root)
+CHORD_PATTERNS: Dict[str, Tuple[int, ...]] = {
+    'major': (0, 4, 7),
+    'minor': (0, 3, 7),
+    '7': (0, 4, 7, 10),
+    'maj7': (0, 4, 7, 11),
+    'm7': (0, 3, 7, 10),
+    'sus2': (0, 2, 7),
+    'sus4': (0, 5, 7),
+    'dim': (0, 3, 6),
+    'aug': (0, 4, 8)
+}
+
+# Velocity drop (prev - curr) that marks an unpicked hammer-on/pull-off
+HAMMER_VEL_DROP = 10
+
+# Pitch-class names indexed by pitch % 12
+_NOTE_NAMES: Tuple[str, ...] = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+
+# Shared empty result for chords without known shapes
+_NO_SHAPES: Dict[str, FrozenSet[Tuple[int, int]]] = {}
+
+# Root-position chord templates as 12-bit pitch-class masks (bit i = interval i)
+CHORD_MASKS: Tuple[Tuple[str, int], ...] = tuple(
+    (name, sum(1 << i for i in intervals)) for name, intervals in CHORD_PATTERNS.items()
+)
+
+
 class Tuning(Enum):
     """기타 튜닝 프리셋"""
-    STANDARD = [40, 45, 50, 55, 59, 64]  # E-A-D-G-B-E
-    DROP_D = [38, 45, 50, 55, 59, 64]    # D-A-D-G-B-E
-    HALF_STEP_DOWN = [39, 44, 49, 54, 58, 63]  # Eb-Ab-Db-Gb-Bb-Eb
-    OPEN_G = [38, 43, 50, 55, 59, 62]    # D-G-D-G-B-D
-    OPEN_D = [38, 45, 50, 54, 57, 62]    # D-A-D-F#-A-D
-    DADGAD = [38, 45, 50, 55, 57, 62]    # D-A-D-G-A-D
+    STANDARD = (40, 45, 50, 55, 59, 64)  # E-A-D-G-B-E
+    DROP_D = (38, 45, 50, 55, 59, 64)    # D-A-D-G-B-E
+    HALF_STEP_DOWN = (39, 44, 49, 54, 58, 63)  # Eb-Ab-Db-Gb-Bb-Eb
+    OPEN_G = (38, 43, 50, 55, 59, 62)    # D-G-D-G-B-D
+    OPEN_D = (38, 45, 50, 54, 57, 62)    # D-A-D-F#-A-D
+    DADGAD = (38, 45, 50, 55, 57, 62)    # D-A-D-G-A-D
 
 
 class Technique(Enum):
@@ -58,65 +100,136 @@ class Technique(Enum):
     TAP = "t"
 
 
-@dataclass
+@njit(cache=True, fastmath=True)
+def _cost_kernel(positions, prev_s, prev_f, max_span, low_pos, melodic):
+    """(K, 2) 후보 포지션 중 이동 비용이 최소인 인덱스"""
+    best_i, best_c = 0, 1e18
+    for i in range(positions.shape[0]):
+        ds = abs(positions[i, 0] - prev_s)
+        df = abs(positions[i, 1] - prev_f)
+        
+        # Base cost: minimize movement
+        c = ds * 3.0 + df
+        
+        # Penalize large stretches
+        if df > max_span:
+            c += (df - max_span) * 5
+        
+        # Prefer staying on same string for melodic lines
+        if melodic:
+            c += ds * 2
+        
+        # Consider hand position
+        if low_pos and positions[i, 1] > 12:
+            c += (positions[i, 1] - 12) * 0.5
+        
+        if c < best_c:
+            best_c, best_i = c, i
+    return best_i
+
+
+# Technique <-> int8 code used in TAB_NOTE_DTYPE
+_TECHNIQUES: Tuple[Technique, ...] = tuple(Technique)
+TECHNIQUE_CODES: Dict[Technique, int] = {t: i for i, t in enumerate(_TECHNIQUES)}
+
+# Structure-of-arrays layout for tab notes (one row per note)
+TAB_NOTE_DTYPE = np.dtype([
+    ('string', 'i1'),     # 1-6 (high to low)
+    ('fret', 'i1'),       # 0-24
+    ('start', 'f8'),
+    ('duration', 'f8'),
+    ('technique', 'i1'),  # TECHNIQUE_CODES
+    ('velocity', 'i1'),
+])
+
+
 class TabNote:
-    """탭 노트 데이터"""
-    string: int  # 1-6 (high to low)
-    fret: int    # 0-24
-    start_time: float
-    duration: float
-    technique: Technique = Technique.NORMAL
-    velocity: int = 80
-    alternatives: List[Tuple[int, int]] = field(default_factory=list)  # (string, fret) alternatives
+    """탭 노트 뷰 (TAB_NOTE_DTYPE 배열의 한 행)"""
+    
+    __slots__ = ('_data', '_index', 'alternatives')
+    
+    def __init__(self, data: np.ndarray, index: int, alternatives: Tuple[Tuple[int, int], ...] = ()):
+        self._data = data
+        self._index = index
+        self.alternatives = list(alternatives)  # (string, fret) alternatives
+    
+    @property
+    def string(self) -> int:
+        return int(self._data['string'][self._index])
+    
+    @property
+    def fret(self) -> int:
+        return int(self._data['fret'][self._index])
+    
+    @property
+    def start_time(self) -> float:
+        return float(self._data['start'][self._index])
+    
+    @property
+    def duration(self) -> float:
+        return float(self._data['duration'][self._index])
+    
+    @property
+    def technique(self) -> Technique:
+        return _TECHNIQUES[self._data['technique'][self._index]]
+    
+    @property
+    def velocity(self) -> int:
+        return int(self._data['velocity'][self._index])
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TabMeasure:
     """탭 마디 데이터"""
     measure_number: int
     time_signature: Tuple[int, int]
     tempo: float
-    notes: List[TabNote]
+    notes: np.ndarray  # TAB_NOTE_DTYPE slice, time-ordered
     chords: List[Dict[str, Any]]
+    alternatives: List[Tuple[Tuple[int, int], ...]] = field(default_factory=list)  # per note row
+    
+    def iter_notes(self):
+        """노트 행을 TabNote 뷰로 순회"""
+        for i in range(len(self.notes)):
+            alternatives = self.alternatives[i] if i < len(self.alternatives) else ()
+            yield TabNote(self.notes, i, alternatives)
     
     def get_tab_strings(self, string_count: int = 6) -> List[str]:
         """마디를 탭 문자열로 변환"""
-        # Initialize tab lines
-        tab_lines = [[] for _ in range(string_count)]
-        
-        # Sort notes by time
-        sorted_notes = sorted(self.notes, key=lambda n: n.start_time)
-        
-        # Convert to tab format
-        for note in sorted_notes:
-            for string_idx in range(string_count):
-                if string_idx + 1 == note.string:
-                    # Add fret number with technique
-                    fret_str = str(note.fret)
-                    if note.technique != Technique.NORMAL:
-                        fret_str += note.technique.value
-                    tab_lines[string_idx].append(fret_str)
-                else:
-                    # Add dashes for spacing
-                    tab_lines[string_idx].append("-" * len(str(note.fret)))
-        
-        # Join and format
-        formatted_lines = []
-        for line in tab_lines:
-            formatted_lines.append("-".join(line) if line else "")
-        
-        return formatted_lines
-
-
-@dataclass 
+        if len(self.notes) == 0:
+            return [""] * string_count
+        
+        # Notes are already time-ordered (see MidiToTabConverter._organize_measures)
+        # Fret number with technique suffix for every note column
+        cells = [
+            (str(fret) + _TECHNIQUES[code].value).encode('ascii')
+            for fret, code in zip(self.notes['fret'].tolist(), self.notes['technique'].tolist())
+        ]
+        
+        # Column start offsets (columns separated by a single dash)
+        widths = np.fromiter((len(c) for c in cells), dtype=np.int64, count=len(cells))
+        col_starts = np.concatenate(([0], np.cumsum(widths + 1)[:-1]))
+        line_length = int(widths.sum()) + len(cells) - 1
+        
+        # One dash-filled buffer per string; overwrite only the active string
+        tab_lines = [bytearray(b'-' * line_length) for _ in range(string_count)]
+        for string, start, cell in zip(self.notes['string'].tolist(), col_starts.tolist(), cells):
+            if 1 <= string <= string_count:
+                tab_lines[string - 1][start:start + len(cell)] = cell
+        
+        return [line.decode('ascii') for line in tab_lines]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TabConfig:
     """탭 변환 설정"""
-    tuning: List[int] = field(default_factory=lambda: Tuning.STANDARD.value)
+    tuning: Tuple[int, ...] = Tuning.STANDARD.value
     capo: int = 0
     max_fret_span: int = 4  # Maximum frets hand can span
     prefer_low_positions: bool = True  # Prefer lower fret positions
     detect_chords: bool = True
     detect_techniques: bool = True
+    hammer_vel_drop: int = HAMMER_VEL_DROP  # Min velocity drop for hammer-on/pull-off
     quantize_timing: bool = True
     quantize_resolution: int = 16  # 16th notes
     include_rhythm_notation: bool = True
@@ -126,17 +239,26 @@ class TabConfig:
 class MidiToTabConverter:
     """MIDI to Tab 변환기"""
     
+    # Upper bound for memoized position selections (FIFO eviction)
+    POSITION_CACHE_SIZE = 50000
+    
     def __init__(self, config: Optional[TabConfig] = None):
         self.config = config or TabConfig()
-        self.tuning = [note + self.config.capo for note in self.config.tuning]
+        self.tuning_arr = np.asarray(self.config.tuning, dtype=np.int8) + self.config.capo
+        self.tuning = self.tuning_arr.tolist()
         self.num_strings = len(self.tuning)
         self.max_fret = 24
         
         # Cache for optimization
-        self.position_cache = {}
+        # (pitch, prev_string, prev_fret, melodic) -> (optimal position, alternatives)
+        self.position_cache: Dict[Tuple[int, int, int, bool], Tuple[Tuple[int, int], Tuple[Tuple[int, int], ...]]] = {}
         self.chord_shapes = self._load_chord_shapes()
+        
+        if HAS_NUMBA:
+            # Warm up the JIT so the first conversion doesn't pay compile latency
+            _cost_kernel(np.zeros((1, 2), dtype=np.int64), 0, 0, 4, True, False)
     
-    async def convert_midi_to_tab(
+    def convert_midi_to_tab(
         self, 
         midi_data: Union[str, Path, pretty_midi.PrettyMIDI]
     ) -> Dict[str, Any]:
@@ -150,7 +272,7 @@ class MidiToTabConverter:
         notes, timing_info = self._extract_midi_data(midi_data)
         
         # Convert to tab notes
-        tab_notes = await self._convert_to_tab_notes(notes)
+        tab_notes, alternatives = self._convert_to_tab_notes(notes)
         
         # Detect chords if enabled
         chords = []
@@ -162,7 +284,7 @@ class MidiToTabConverter:
             tab_notes = self._detect_techniques(tab_notes)
         
         # Organize into measures
-        measures = self._organize_measures(tab_notes, chords, timing_info)
+        measures = self._organize_measures(tab_notes, alternatives, chords, timing_info)
         
         # Generate tab notation
         tab_notation = self._generate_tab_notation(measures)
@@ -171,7 +293,7 @@ class MidiToTabConverter:
         result = {
             'tab_notation': tab_notation,
             'measures': [self._measure_to_dict(m) for m in measures],
-            'tuning': self.config.tuning,
+            'tuning': [int(p) for p in self.config.tuning],
             'capo': self.config.capo,
             'timing_info': timing_info,
             'statistics': {
@@ -184,22 +306,39 @@ class MidiToTabConverter:
         
         return result
     
-    def _extract_midi_data(self, midi_data: pretty_midi.PrettyMIDI) -> Tuple[List, Dict]:
-        """MIDI에서 노트와 타이밍 정보 추출"""
-        notes = []
+    async def convert_midi_to_tab_async(
+        self, 
+        midi_data: Union[str, Path, pretty_midi.PrettyMIDI]
+    ) -> Dict[str, Any]:
+        """convert_midi_to_tab을 워커 스레드에서 실행 (이벤트 루프 비차단)"""
+        return await asyncio.to_thread(self.convert_midi_to_tab, midi_data)
+    
+    def _extract_midi_data(self, midi_data: pretty_midi.PrettyMIDI) -> Tuple[Dict[str, np.ndarray], Dict]:
+        """MIDI에서 노트와 타이밍 정보 추출 (노트는 필드별 병렬 배열)"""
+        total = sum(len(instrument.notes) for instrument in midi_data.instruments)
+        pitches = np.empty(total, dtype=np.int16)
+        starts = np.empty(total, dtype=np.float64)
+        ends = np.empty(total, dtype=np.float64)
+        velocities = np.empty(total, dtype=np.int16)
         
         # Extract notes from all instruments
+        i = 0
         for instrument in midi_data.instruments:
             for note in instrument.notes:
-                notes.append({
-                    'pitch': note.pitch,
-                    'start': note.start,
-                    'end': note.end,
-                    'velocity': note.velocity
-                })
+                pitches[i] = note.pitch
+                starts[i] = note.start
+                ends[i] = note.end
+                velocities[i] = note.velocity
+                i += 1
         
         # Sort by start time
-        notes.sort(key=lambda n: n['start'])
+        order = np.argsort(starts, kind='stable')
+        notes = {
+            'pitch': pitches[order],
+            'start': starts[order],
+            'end': ends[order],
+            'velocity': velocities[order]
+        }
         
         # Extract timing info
         timing_info = {
@@ -219,58 +358,86 @@ class MidiToTabConverter:
                 for ts in midi_data.time_signature_changes
             ]
         
-        logger.info(f"Extracted {len(notes)} notes, tempo: {timing_info['tempo']}")
+        logger.info(f"Extracted {total} notes, tempo: {timing_info['tempo']}")
         
         return notes, timing_info
     
-    async def _convert_to_tab_notes(self, midi_notes: List[Dict]) -> List[TabNote]:
-        """MIDI 노트를 탭 노트로 변환"""
-        tab_notes = []
+    def _convert_to_tab_notes(
+        self, 
+        midi_notes: Dict[str, np.ndarray]
+    ) -> Tuple[np.ndarray, List[Tuple[Tuple[int, int], ...]]]:
+        """MIDI 노트를 탭 노트로 변환 (TAB_NOTE_DTYPE 배열, 행별 대체 포지션)
+        
+        midi_notes: _extract_midi_data의 병렬 배열 ('pitch', 'start', 'end', 'velocity',
+        선택적으로 'melodic')
+        """
+        pitches = midi_notes['pitch']
+        melodic_flags = midi_notes.get('melodic')
+        
+        kept = []
+        chosen = []
+        note_alternatives = []
         previous_position = None
         
-        for midi_note in midi_notes:
-            pitch = midi_note['pitch']
-            
-            # Find possible positions
-            positions = self._get_fret_positions(pitch)
-            
-            if not positions:
-                logger.warning(f"Note {pitch} out of range for guitar")
-                continue
-            
-            # Select optimal position
-            optimal_pos = self._select_optimal_position(
-                positions, 
-                previous_position,
-                midi_note.get('context', {})
-            )
+        # Find possible positions for all notes at once
+        all_frets, all_valid = self._get_fret_positions_batch(pitches)
+        
+        for i, pitch in enumerate(pitches.tolist()):
+            melodic = bool(melodic_flags[i]) if melodic_flags is not None else False
+            context = {'melodic': melodic}
+            prev_string, prev_fret = previous_position or (-1, -1)
+            cache_key = (pitch, prev_string, prev_fret, melodic)
             
-            # Create tab note
-            tab_note = TabNote(
-                string=optimal_pos[0],
-                fret=optimal_pos[1],
-                start_time=midi_note['start'],
-                duration=midi_note['end'] - midi_note['start'],
-                velocity=midi_note['velocity'],
-                alternatives=[p for p in positions if p != optimal_pos]
-            )
+            cached = self.position_cache.get(cache_key)
+            if cached is not None:
+                optimal_pos, alternatives = cached
+            else:
+                positions = [(int(s) + 1, int(all_frets[i, s])) for s in np.flatnonzero(all_valid[i])]
+                
+                if not positions:
+                    logger.warning(f"Note {pitch} out of range for guitar")
+                    continue
+                
+                # Select optimal position
+                optimal_pos = self._select_optimal_position(
+                    positions, 
+                    previous_position,
+                    context
+                )
+                alternatives = tuple(p for p in positions if p != optimal_pos)
+                
+                if len(self.position_cache) >= self.POSITION_CACHE_SIZE:
+                    del self.position_cache[next(iter(self.position_cache))]
+                self.position_cache[cache_key] = (optimal_pos, alternatives)
             
-            tab_notes.append(tab_note)
+            kept.append(i)
+            chosen.append(optimal_pos)
+            note_alternatives.append(alternatives)
             previous_position = optimal_pos
         
-        return tab_notes
+        # Create tab notes
+        tab_notes = np.zeros(len(kept), dtype=TAB_NOTE_DTYPE)
+        if kept:
+            positions_arr = np.array(chosen, dtype=np.int8)
+            tab_notes['string'] = positions_arr[:, 0]
+            tab_notes['fret'] = positions_arr[:, 1]
+            tab_notes['start'] = midi_notes['start'][kept]
+            tab_notes['duration'] = midi_notes['end'][kept] - midi_notes['start'][kept]
+            tab_notes['technique'] = TECHNIQUE_CODES[Technique.NORMAL]
+            tab_notes['velocity'] = midi_notes['velocity'][kept]
+        
+        return tab_notes, note_alternatives
     
     def _get_fret_positions(self, midi_pitch: int) -> List[Tuple[int, int]]:
         """주어진 피치에 대한 가능한 (string, fret) 포지션"""
-        positions = []
-        
-        for string_idx, open_pitch in enumerate(self.tuning):
-            fret = midi_pitch - open_pitch
-            
-            if 0 <= fret <= self.max_fret:
-                positions.append((string_idx + 1, fret))
-        
-        return positions
+        frets, valid = self._get_fret_positions_batch(np.array([midi_pitch], dtype=np.int16))
+        return [(int(s) + 1, int(frets[0, s])) for s in np.flatnonzero(valid[0])]
+    
+    def _get_fret_positions_batch(self, pitches: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """여러 피치의 (N, strings) 프렛 행렬과 유효 마스크를 한 번에 계산"""
+        frets = pitches[:, None] - self.tuning_arr[None, :]
+        valid = (frets >= 0) & (frets <= self.max_fret)
+        return frets.astype(np.int8), valid
     
     def _select_optimal_position(
         self, 
@@ -293,93 +460,63 @@ class MidiToTabConverter:
                 return positions[len(positions) // 2]
         
         # Calculate costs for each position
-        position_costs = []
-        
-        for pos in positions:
-            string_diff = abs(pos[0] - previous[0])
-            fret_diff = abs(pos[1] - previous[1])
-            
-            # Base cost: minimize movement
-            cost = string_diff * 3 + fret_diff
-            
-            # Penalize large stretches
-            if fret_diff > self.config.max_fret_span:
-                cost += (fret_diff - self.config.max_fret_span) * 5
-            
-            # Prefer staying on same string for melodic lines
-            if context.get('melodic', False):
-                cost += string_diff * 2
-            
-            # Consider hand position
-            if self.config.prefer_low_positions and pos[1] > 12:
-                cost += (pos[1] - 12) * 0.5
-            
-            position_costs.append((pos, cost))
-        
-        # Return position with minimum cost
-        return min(position_costs, key=lambda x: x[1])[0]
+        best = _cost_kernel(
+            np.asarray(positions, dtype=np.int64),
+            previous[0],
+            previous[1],
+            self.config.max_fret_span,
+            self.config.prefer_low_positions,
+            bool(context.get('melodic', False))
+        )
+        return positions[best]
     
-    def _detect_chords(self, tab_notes: List[TabNote]) -> List[Dict]:
+    def _detect_chords(self, tab_notes: np.ndarray) -> List[Dict]:
         """코드 검출"""
         chords = []
         
         # Group simultaneous notes
         time_threshold = 0.05  # 50ms
-        note_groups = []
-        current_group = []
+        gaps = np.diff(tab_notes['start'])
         
-        for note in sorted(tab_notes, key=lambda n: n.start_time):
-            if not current_group or abs(note.start_time - current_group[-1].start_time) < time_threshold:
-                current_group.append(note)
-            else:
-                if len(current_group) >= 3:  # Minimum for a chord
-                    note_groups.append(current_group)
-                current_group = [note]
+        # tab_notes inherit start-time order from _extract_midi_data
+        if __debug__:
+            assert not (gaps < 0).any(), "tab_notes must be sorted by start_time"
         
-        if len(current_group) >= 3:
-            note_groups.append(current_group)
+        # Split wherever consecutive onsets are at least the threshold apart
+        splits = np.flatnonzero(gaps >= time_threshold) + 1
+        group_indices = np.split(np.arange(len(tab_notes)), splits)
+        
+        # Only keep chord-sized groups (minimum 3 notes)
+        note_groups = [tab_notes[g[0]:g[-1] + 1] for g in group_indices if g.size >= 3]
         
         # Analyze each group
         for group in note_groups:
-            pitches = [self.tuning[n.string - 1] + n.fret for n in group]
+            strings = group['string']
+            frets = group['fret'].astype(np.int16)
+            pitches = self.tuning_arr[strings - 1] + frets
+            pcs_mask = int(np.bitwise_or.reduce(1 << (pitches % 12)))
             
             # Try to identify chord
-            chord_info = self._identify_chord(pitches, group)
+            chord_info = self._identify_chord(pcs_mask, pitches.tolist(), group)
             if chord_info:
                 chords.append({
-                    'time': group[0].start_time,
-                    'duration': max(n.duration for n in group),
+                    'time': float(group['start'][0]),
+                    'duration': float(group['duration'].max()),
                     'chord': chord_info,
-                    'tab_positions': [(n.string, n.fret) for n in group]
+                    'tab_positions': list(zip(strings.tolist(), group['fret'].tolist()))
                 })
         
         return chords
     
-    def _identify_chord(self, pitches: List[int], tab_notes: List[TabNote]) -> Optional[Dict]:
-        """코드 식별"""
-        # Convert to pitch classes
-        pitch_classes = sorted(set(p % 12 for p in pitches))
-        
-        # Common chord patterns (intervals from root)
-        chord_patterns = {
-            'major': [0, 4, 7],
-            'minor': [0, 3, 7],
-            '7': [0, 4, 7, 10],
-            'maj7': [0, 4, 7, 11],
-            'm7': [0, 3, 7, 10],
-            'sus2': [0, 2, 7],
-            'sus4': [0, 5, 7],
-            'dim': [0, 3, 6],
-            'aug': [0, 4, 8]
-        }
-        
-        # Try to match pattern
+    def _identify_chord(self, pcs_mask: int, pitches: List[int], tab_notes: np.ndarray) -> Optional[Dict]:
+        """코드 식별 (pcs_mask: pitch-class 12비트 마스크)"""
+        # Templates rotated to the current root; try lowest root first
+        rotated = [mask for _, mask in CHORD_MASKS]
         for root_pc in range(12):
-            for chord_type, pattern in chord_patterns.items():
-                test_pattern = [(root_pc + interval) % 12 for interval in pattern]
-                if set(test_pattern).issubset(set(pitch_classes)):
-                    root_name = ['C', 'C#', 'D', 'D#', 'E', 'F', 
-                                'F#', 'G', 'G#', 'A', 'A#', 'B'][root_pc]
+            for i, (chord_type, _) in enumerate(CHORD_MASKS):
+                m = rotated[i]
+                if (m & pcs_mask) == m:
+                    root_name = _NOTE_NAMES[root_pc]
                     
                     # Check for common chord shape
                     shape = self._find_chord_shape(tab_notes, root_name, chord_type)
@@ -390,62 +527,57 @@ class MidiToTabConverter:
                         'shape': shape,
                         'pitches': pitches
                     }
+                rotated[i] = ((m << 1) | (m >> 11)) & 0xFFF
         
         return None
     
-    def _find_chord_shape(self, tab_notes: List[TabNote], root: str, chord_type: str) -> Optional[str]:
+    def _find_chord_shape(self, tab_notes: np.ndarray, root: str, chord_type: str) -> Optional[str]:
         """코드 shape 찾기"""
         # Common open chord shapes
-        positions = [(n.string, n.fret) for n in tab_notes]
-        positions_set = set(positions)
+        positions_set = frozenset(zip(tab_notes['string'].tolist(), tab_notes['fret'].tolist()))
         
         # Check against known shapes
-        for shape_name, shape_positions in self.chord_shapes.get(f"{root}{chord_type}", {}).items():
-            if set(shape_positions).issubset(positions_set):
+        for shape_name, shape_positions in self.chord_shapes.get((root, chord_type), _NO_SHAPES).items():
+            if shape_positions.issubset(positions_set):
                 return shape_name
         
         # Check for barre chord patterns
-        frets = [n.fret for n in tab_notes if n.fret > 0]
-        if frets and min(frets) == max(frets):
-            return f"Barre {min(frets)}"
+        frets = tab_notes['fret'][tab_notes['fret'] > 0]
+        if frets.size and frets.min() == frets.max():
+            return f"Barre {int(frets.min())}"
         
         return None
     
-    def _detect_techniques(self, tab_notes: List[TabNote]) -> List[TabNote]:
+    def _detect_techniques(self, tab_notes: np.ndarray) -> np.ndarray:
         """특수 기법 검출"""
         
-        for i in range(len(tab_notes)):
-            if i == 0:
-                continue
-            
-            prev_note = tab_notes[i - 1]
-            curr_note = tab_notes[i]
-            
-            # Same string techniques
-            if prev_note.string == curr_note.string:
-                time_diff = curr_note.start_time - prev_note.start_time
-                fret_diff = curr_note.fret - prev_note.fret
-                
-                # Hammer-on detection
-                if fret_diff > 0 and time_diff < 0.1 and curr_note.velocity < prev_note.velocity:
-                    curr_note.technique = Technique.HAMMER_ON
-                
-                # Pull-off detection
-                elif fret_diff < 0 and time_diff < 0.1 and curr_note.velocity < prev_note.velocity:
-                    curr_note.technique = Technique.PULL_OFF
-                
-                # Slide detection
-                elif abs(fret_diff) > 1 and time_diff < 0.2:
-                    if fret_diff > 0:
-                        curr_note.technique = Technique.SLIDE_UP
-                    else:
-                        curr_note.technique = Technique.SLIDE_DOWN
+        if len(tab_notes) < 2:
+            return tab_notes
+        
+        # Differences between each note and its predecessor
+        same_string = np.diff(tab_notes['string']) == 0
+        fret_diff = np.diff(tab_notes['fret'])
+        time_diff = np.diff(tab_notes['start'])
+        softer = -np.diff(tab_notes['velocity'].astype(np.int16)) >= self.config.hammer_vel_drop
+        
+        # Same string techniques (priority: hammer-on > pull-off > slide)
+        legato = same_string & (time_diff < 0.1) & softer
+        hammer = legato & (fret_diff > 0)
+        pull = legato & (fret_diff < 0)
+        slide = same_string & (np.abs(fret_diff) > 1) & (time_diff < 0.2) & ~hammer & ~pull
+        
+        technique = tab_notes['technique'][1:]
+        technique[hammer] = TECHNIQUE_CODES[Technique.HAMMER_ON]
+        technique[pull] = TECHNIQUE_CODES[Technique.PULL_OFF]
+        technique[slide & (fret_diff > 0)] = TECHNIQUE_CODES[Technique.SLIDE_UP]
+        technique[slide & (fret_diff < 0)] = TECHNIQUE_CODES[Technique.SLIDE_DOWN]
         
         return tab_notes
     
     def _organize_measures(
         self, 
-        tab_notes: List[TabNote], 
+        tab_notes: np.ndarray, 
+        alternatives: List[Tuple[Tuple[int, int], ...]],
         chords: List[Dict],
         timing_info: Dict
     ) -> List[TabMeasure]:
@@ -460,39 +592,30 @@ class MidiToTabConverter:
         beat_duration = 60.0 / tempo
         measure_duration = beats_per_measure * beat_duration
         
-        # Group notes into measures
-        current_measure_notes = []
-        current_measure_chords = []
-        measure_start = 0
-        measure_num = 1
+        if len(tab_notes) == 0:
+            return measures
         
-        for note in tab_notes:
-            if note.start_time < measure_start + measure_duration:
-                current_measure_notes.append(note)
-            else:
-                # Create measure
-                measures.append(TabMeasure(
-                    measure_number=measure_num,
-                    time_signature=time_sig,
-                    tempo=tempo,
-                    notes=current_measure_notes,
-                    chords=[c for c in chords 
-                           if measure_start <= c['time'] < measure_start + measure_duration]
-                ))
-                
-                # Start new measure
-                measure_num += 1
-                measure_start += measure_duration
-                current_measure_notes = [note]
+        # Measure index per note (notes are time-ordered, so indices are non-decreasing)
+        note_idx = (tab_notes['start'] / measure_duration).astype(np.int64)
+        num_measures = int(note_idx[-1]) + 1
+        splits = np.searchsorted(note_idx, np.arange(num_measures + 1), side='left')
         
-        # Add final measure
-        if current_measure_notes:
+        # Bucket chords by measure index
+        measure_chords: List[List[Dict]] = [[] for _ in range(num_measures)]
+        for c in chords:
+            chord_idx = int(c['time'] / measure_duration)
+            if 0 <= chord_idx < num_measures:
+                measure_chords[chord_idx].append(c)
+        
+        # Empty measures in between are kept as rests
+        for i in range(num_measures):
             measures.append(TabMeasure(
-                measure_number=measure_num,
+                measure_number=i + 1,
                 time_signature=time_sig,
                 tempo=tempo,
-                notes=current_measure_notes,
-                chords=[c for c in chords if c['time'] >= measure_start]
+                notes=tab_notes[splits[i]:splits[i + 1]],
+                chords=measure_chords[i],
+                alternatives=alternatives[splits[i]:splits[i + 1]]
             ))
         
         return measures
@@ -531,12 +654,9 @@ class MidiToTabConverter:
     
     def _tuning_to_string(self) -> str:
         """튜닝을 문자열로 변환"""
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 
-                     'F#', 'G', 'G#', 'A', 'A#', 'B']
-        
         tuning_notes = []
         for pitch in self.config.tuning:
-            note_name = note_names[pitch % 12]
+            note_name = _NOTE_NAMES[pitch % 12]
             octave = pitch // 12 - 1
             tuning_notes.append(f"{note_name}{octave}")
         
@@ -557,47 +677,47 @@ class MidiToTabConverter:
                     'technique': n.technique.name,
                     'alternatives': n.alternatives
                 }
-                for n in measure.notes
+                for n in measure.iter_notes()
             ],
             'chords': measure.chords
         }
     
-    def _load_chord_shapes(self) -> Dict:
+    def _load_chord_shapes(self) -> Dict[Tuple[str, str], Dict[str, FrozenSet[Tuple[int, int]]]]:
         """코드 shape 데이터베이스 로드"""
         # Common open chord shapes (simplified)
         return {
-            'Cmajor': {
-                'open': [(2, 3), (3, 2), (5, 1)],
+            ('C', 'major'): {
+                'open': frozenset([(2, 3), (3, 2), (5, 1)]),
             },
-            'Gmajor': {
-                'open': [(1, 3), (2, 3), (6, 3)],
+            ('G', 'major'): {
+                'open': frozenset([(1, 3), (2, 3), (6, 3)]),
             },
-            'Dmajor': {
-                'open': [(1, 2), (2, 3), (3, 2)],
+            ('D', 'major'): {
+                'open': frozenset([(1, 2), (2, 3), (3, 2)]),
             },
-            'Aminor': {
-                'open': [(2, 2), (3, 2), (4, 1)],
+            ('A', 'minor'): {
+                'open': frozenset([(2, 2), (3, 2), (4, 1)]),
             },
-            'Eminor': {
-                'open': [(3, 2), (4, 2)],
+            ('E', 'minor'): {
+                'open': frozenset([(3, 2), (4, 2)]),
             },
             # Add more chord shapes as needed
         }
 
 
 # Convenience function
-async def convert_midi_file(
+def convert_midi_file(
     midi_path: Union[str, Path],
     config: Optional[TabConfig] = None
 ) -> Dict[str, Any]:
     """MIDI 파일을 탭으로 변환하는 헬퍼 함수"""
     converter = MidiToTabConverter(config)
-    return await converter.convert_midi_to_tab(midi_path)
+    return converter.convert_midi_to_tab(midi_path)
 
 
 # Test code
 if __name__ == "__main__":
-    async def test_conversion():
+    def test_conversion():
         """테스트 함수"""
         test_midi = "test_guitar.mid"
         
@@ -608,7 +728,7 @@ if __name__ == "__main__":
         )
         
         try:
-            result = await convert_midi_file(test_midi, config)
+            result = convert_midi_file(test_midi, config)
             
             print("Tab Conversion Complete!")
             print(f"Total notes: {result['statistics']['total_notes']}")
@@ -623,4 +743,4 @@ if __name__ == "__main__":
             traceback.print_exc()
     
     # Run test
-    asyncio.run(test_conversion())
\ No newline at end of file
+    test_conversion()
\ No newline at end of file
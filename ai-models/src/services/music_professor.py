@@ -3,12 +3,17 @@ Music Professor AI Service
 세계 최고 실용음악과 교수진의 교육 방식을 구현한 AI 교육 시스템
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import functools
 from enum import Enum
 from dataclasses import dataclass
-import numpy as np
 from datetime import datetime
-import json
+from types import MappingProxyType
+import re
+import time
+
+from ._compat import DATACLASS_SLOTS
+
 
 class ProfessorType(Enum):
     """가상 교수 타입"""
@@ -26,194 +31,355 @@ class Difficulty(Enum):
     PROFESSIONAL = 4
 
 
-@dataclass
+# 스타일 키워드 -> 교수 (키 순서가 우선순위)
+_PROFESSOR_MAP = MappingProxyType({
+    "jazz": ProfessorType.JAZZ,
+    "rock": ProfessorType.ROCK,
+    "metal": ProfessorType.ROCK,
+    "classical": ProfessorType.CLASSICAL,
+    "fusion": ProfessorType.FUSION,
+    "modern": ProfessorType.FUSION
+})
+
+# 스타일 키워드를 한 번의 스캔으로 찾기 위한 정규식
+_STYLE_PATTERN = re.compile("|".join(map(re.escape, _PROFESSOR_MAP)))
+
+# 여러 키워드가 있으면 문자열 위치가 아니라 _PROFESSOR_MAP 순서로 선택
+_STYLE_PRIORITY = MappingProxyType({keyword: i for i, keyword in enumerate(_PROFESSOR_MAP)})
+
+# 주차별 핵심 주제
+_WEEKLY_TOPICS = MappingProxyType({
+    1: "Foundation & Assessment",
+    2: "Technique Development", 
+    3: "Theory Application",
+    4: "Performance & Review"
+})
+
+# 레벨별 기본 토픽
+_BASE_TOPICS = MappingProxyType({
+    Difficulty.BEGINNER: (
+        "Open Chords", "Strumming Patterns", "Major Scale", "Timing Basics"
+    ),
+    Difficulty.INTERMEDIATE: (
+        "Barre Chords", "Pentatonic Patterns", "7th Chords", "Improvisation Basics"
+    ),
+    Difficulty.ADVANCED: (
+        "Extended Chords", "Modal Playing", "Advanced Techniques", "Jazz Standards"
+    ),
+    Difficulty.PROFESSIONAL: (
+        "Composition", "Arrangement", "Advanced Theory", "Style Development"
+    )
+})
+
+# 약점별 보완 토픽 (추가 순서 고정)
+_WEAKNESS_TOPICS: Tuple[Tuple[str, str], ...] = (
+    ("technique", "Technique Drills"),
+    ("theory", "Theory Deep Dive"),
+    ("rhythm", "Rhythm Exercises")
+)
+
+# 기본 워밍업 연습
+_WARM_UP_BEGINNER = {
+    "type": "warm_up",
+    "name": "Chromatic Warm-up",
+    "tempo": 60,
+    "duration_minutes": 10
+}
+_WARM_UP_DEFAULT = {**_WARM_UP_BEGINNER, "tempo": 120}
+
+# 약점별 보완 연습
+_EXERCISE_BY_WEAKNESS = MappingProxyType({
+    "technique": {
+        "type": "technique",
+        "name": "Alternate Picking Pattern",
+        "tempo": 80,
+        "duration_minutes": 15
+    },
+    "theory": {
+        "type": "theory",
+        "name": "Chord Progression Analysis",
+        "key": "C Major",
+        "duration_minutes": 20
+    },
+    "rhythm": {
+        "type": "rhythm",
+        "name": "Subdivision Exercise",
+        "time_signature": "4/4",
+        "duration_minutes": 15
+    }
+})
+
+# 레벨별 숙제 템플릿
+_HOMEWORK_TEMPLATES = MappingProxyType({
+    Difficulty.BEGINNER: (
+        "Practice chord changes for 15 minutes daily",
+        "Learn one new scale pattern",
+        "Record yourself playing the weekly piece"
+    ),
+    Difficulty.INTERMEDIATE: (
+        "Transcribe 8 bars of a solo",
+        "Practice improvisation over backing track",
+        "Analyze chord progression of favorite song"
+    ),
+    Difficulty.ADVANCED: (
+        "Compose 16-bar progression using learned concepts",
+        "Master the weekly etude at performance tempo",
+        "Prepare two contrasting pieces for review"
+    ),
+    Difficulty.PROFESSIONAL: (
+        "Arrange a standard in personal style",
+        "Record professional-quality demo",
+        "Analyze and replicate master's technique"
+    )
+})
+
+_DEFAULT_HOMEWORK = ("Practice daily for 30 minutes",)
+
+# 교수별 피드백 코멘트
+_PROFESSOR_COMMENTS = MappingProxyType({
+    ProfessorType.JAZZ: "훌륭한 진전이에요! 스윙 필링을 더 살려보세요. Charlie Parker가 말했듯이, '먼저 악기를 마스터하고, 그 다음 음악을 마스터하고, 그리고 모든 것을 잊고 그냥 연주하세요.'",
+    ProfessorType.ROCK: "Rock on! 파워코드가 훨씬 단단해졌네요. 다음엔 palm muting을 더 타이트하게 해봅시다. Remember: Attitude is everything!",
+    ProfessorType.CLASSICAL: "Molto bene! 프레이징이 개선되었습니다. 다이나믹 대비를 더 극대화하면 곡의 드라마가 살아날 것입니다.",
+    ProfessorType.FUSION: "Sick playing! 리듬 디스플레이스먼트 아이디어가 창의적이에요. 다음엔 odd time signatures를 탐험해볼까요?"
+})
+
+# 진도 기록 템플릿 (호출마다 얕은 복사 후 필드만 갱신)
+_PROGRESS_TEMPLATE = MappingProxyType({
+    "student_id": None,
+    "date": None,
+    "lessons_completed": 0,
+    "current_level": "beginner",
+    "skill_improvements": {
+        "technique": "+15%",
+        "theory": "+20%",
+        "sight_reading": "+10%",
+        "improvisation": "+25%"
+    },
+    "achievements_unlocked": [
+        "First Solo",
+        "Theory Novice",
+        "Practice Streak 7 Days"
+    ],
+    "next_milestone": "Complete Level 1 Certification"
+})
+
+# 초 단위로 캐시한 ISO 타임스탬프
+_last_sec = -1
+_last_iso = ""
+
+
+def _now_iso() -> str:
+    """현재 시각의 ISO 문자열 (같은 초 안에서는 재포맷하지 않음)"""
+    global _last_sec, _last_iso
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_iso = datetime.fromtimestamp(sec).isoformat()
+        _last_sec = sec
+    return _last_iso
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Lesson:
     """레슨 데이터 구조"""
     title: str
     professor: ProfessorType
     difficulty: Difficulty
     duration_minutes: int
-    topics: List[str]
+    topics: Tuple[str, ...]
     exercises: List[Dict]
-    homework: Optional[List[str]] = None
+    homework: Optional[Tuple[str, ...]] = None
 
 
-class MusicProfessorAI:
-    """AI 음악 교수 시스템"""
-    
-    def __init__(self):
-        self.professors = self._initialize_professors()
-        self.curriculum = self._load_curriculum()
-        self.teaching_methods = self._initialize_teaching_methods()
-        
-    def _initialize_professors(self) -> Dict:
-        """교수진 페르소나 초기화"""
-        return {
-            ProfessorType.JAZZ: {
-                "name": "Dr. Jazz",
-                "specialties": ["Jazz Harmony", "Improvisation", "Chord Melody"],
-                "teaching_style": "이론과 실전의 균형, 즉흥연주 중심",
-                "references": ["Pat Metheny", "Joe Pass", "George Benson"],
-                "signature_lessons": [
-                    "ii-V-I Mastery",
-                    "Bebop Scales",
-                    "Jazz Standards Repertoire",
-                    "Comping Patterns"
-                ]
-            },
-            ProfessorType.ROCK: {
-                "name": "Professor Rock",
-                "specialties": ["Shred Techniques", "Power Chords", "Stage Performance"],
-                "teaching_style": "테크닉 집중, 실전 퍼포먼스",
-                "references": ["Paul Gilbert", "John Petrucci", "Steve Vai"],
-                "signature_lessons": [
-                    "Alternate Picking Bootcamp",
-                    "Sweep Picking Mastery",
-                    "Pentatonic Fury",
-                    "Metal Riffing"
-                ]
-            },
-            ProfessorType.CLASSICAL: {
-                "name": "Maestro Classical",
-                "specialties": ["Classical Technique", "Music Theory", "Sight Reading"],
-                "teaching_style": "정확성과 표현력, 악보 중심",
-                "references": ["Andrés Segovia", "John Williams", "Julian Bream"],
-                "signature_lessons": [
-                    "Fingerstyle Fundamentals",
-                    "Bach Studies",
-                    "Villa-Lobos Etudes",
-                    "Rest Stroke Technique"
-                ]
-            },
-            ProfessorType.FUSION: {
-                "name": "Coach Fusion",
-                "specialties": ["Modern Techniques", "Genre Blending", "Effects"],
-                "teaching_style": "혁신적 접근, 장르 융합",
-                "references": ["Guthrie Govan", "Tosin Abasi", "Tim Henson"],
-                "signature_lessons": [
-                    "Hybrid Picking",
-                    "Percussive Techniques",
-                    "Modern Chord Voicings",
-                    "Ambient Soundscapes"
-                ]
-            }
+@functools.lru_cache(maxsize=1)
+def _build_professors() -> Dict:
+    """교수진 페르소나 초기화"""
+    return {
+        ProfessorType.JAZZ: {
+            "name": "Dr. Jazz",
+            "specialties": ["Jazz Harmony", "Improvisation", "Chord Melody"],
+            "teaching_style": "이론과 실전의 균형, 즉흥연주 중심",
+            "references": ["Pat Metheny", "Joe Pass", "George Benson"],
+            "signature_lessons": [
+                "ii-V-I Mastery",
+                "Bebop Scales",
+                "Jazz Standards Repertoire",
+                "Comping Patterns"
+            ]
+        },
+        ProfessorType.ROCK: {
+            "name": "Professor Rock",
+            "specialties": ["Shred Techniques", "Power Chords", "Stage Performance"],
+            "teaching_style": "테크닉 집중, 실전 퍼포먼스",
+            "references": ["Paul Gilbert", "John Petrucci", "Steve Vai"],
+            "signature_lessons": [
+                "Alternate Picking Bootcamp",
+                "Sweep Picking Mastery",
+                "Pentatonic Fury",
+                "Metal Riffing"
+            ]
+        },
+        ProfessorType.CLASSICAL: {
+            "name": "Maestro Classical",
+            "specialties": ["Classical Technique", "Music Theory", "Sight Reading"],
+            "teaching_style": "정확성과 표현력, 악보 중심",
+            "references": ["Andrés Segovia", "John Williams", "Julian Bream"],
+            "signature_lessons": [
+                "Fingerstyle Fundamentals",
+                "Bach Studies",
+                "Villa-Lobos Etudes",
+                "Rest Stroke Technique"
+            ]
+        },
+        ProfessorType.FUSION: {
+            "name": "Coach Fusion",
+            "specialties": ["Modern Techniques", "Genre Blending", "Effects"],
+            "teaching_style": "혁신적 접근, 장르 융합",
+            "references": ["Guthrie Govan", "Tosin Abasi", "Tim Henson"],
+            "signature_lessons": [
+                "Hybrid Picking",
+                "Percussive Techniques",
+                "Modern Chord Voicings",
+                "Ambient Soundscapes"
+            ]
         }
-    
-    def _load_curriculum(self) -> Dict:
-        """Berklee/MI 기반 커리큘럼 로드"""
-        return {
-            "level_1_foundation": {
-                "duration_months": 6,
-                "modules": [
-                    {
-                        "name": "Music Fundamentals",
-                        "topics": [
-                            "Major/Minor Scales",
-                            "Intervals",
-                            "Circle of Fifths",
-                            "Basic Rhythm",
-                            "Triads"
-                        ]
-                    },
-                    {
-                        "name": "Guitar Basics",
-                        "topics": [
-                            "CAGED System",
-                            "Alternate Picking",
-                            "Basic Chords",
-                            "Strumming Patterns",
-                            "Tuning & Setup"
-                        ]
-                    }
-                ]
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _build_curriculum() -> Dict:
+    """Berklee/MI 기반 커리큘럼 로드"""
+    return {
+        "level_1_foundation": {
+            "duration_months": 6,
+            "modules": [
+                {
+                    "name": "Music Fundamentals",
+                    "topics": [
+                        "Major/Minor Scales",
+                        "Intervals",
+                        "Circle of Fifths",
+                        "Basic Rhythm",
+                        "Triads"
+                    ]
+                },
+                {
+                    "name": "Guitar Basics",
+                    "topics": [
+                        "CAGED System",
+                        "Alternate Picking",
+                        "Basic Chords",
+                        "Strumming Patterns",
+                        "Tuning & Setup"
+                    ]
+                }
+            ]
+        },
+        "level_2_intermediate": {
+            "duration_months": 6,
+            "modules": [
+                {
+                    "name": "Advanced Harmony",
+                    "topics": [
+                        "7th Chords",
+                        "Extended Chords",
+                        "Voice Leading",
+                        "Modal Theory",
+                        "Chord Substitutions"
+                    ]
+                },
+                {
+                    "name": "Lead Techniques",
+                    "topics": [
+                        "Legato Playing",
+                        "Bending & Vibrato",
+                        "Phrasing",
+                        "Scale Sequences",
+                        "Arpeggios"
+                    ]
+                }
+            ]
+        },
+        "level_3_advanced": {
+            "duration_months": 12,
+            "modules": [
+                {
+                    "name": "Jazz Theory",
+                    "topics": [
+                        "Altered Scales",
+                        "Tritone Substitution",
+                        "Coltrane Changes",
+                        "Quartal Harmony",
+                        "Outside Playing"
+                    ]
+                },
+                {
+                    "name": "Virtuoso Techniques",
+                    "topics": [
+                        "Sweep Picking",
+                        "8-Finger Tapping",
+                        "String Skipping",
+                        "Hybrid Picking",
+                        "Advanced Legato"
+                    ]
+                }
+            ]
+        }
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _build_teaching_methods() -> Dict:
+    """교육 방법론 초기화"""
+    return {
+        "berklee_method": {
+            "daily_practice": {
+                "technical_studies": 30,  # minutes
+                "sight_reading": 20,
+                "improvisation": 30,
+                "repertoire": 40,
+                "ear_training": 20
             },
-            "level_2_intermediate": {
-                "duration_months": 6,
-                "modules": [
-                    {
-                        "name": "Advanced Harmony",
-                        "topics": [
-                            "7th Chords",
-                            "Extended Chords",
-                            "Voice Leading",
-                            "Modal Theory",
-                            "Chord Substitutions"
-                        ]
-                    },
-                    {
-                        "name": "Lead Techniques",
-                        "topics": [
-                            "Legato Playing",
-                            "Bending & Vibrato",
-                            "Phrasing",
-                            "Scale Sequences",
-                            "Arpeggios"
-                        ]
-                    }
-                ]
+            "assessment": ["performance", "theory", "improvisation", "ensemble"]
+        },
+        "mi_method": {
+            "technique_focus": {
+                "speed_development": True,
+                "accuracy_drills": True,
+                "endurance_training": True
             },
-            "level_3_advanced": {
-                "duration_months": 12,
-                "modules": [
-                    {
-                        "name": "Jazz Theory",
-                        "topics": [
-                            "Altered Scales",
-                            "Tritone Substitution",
-                            "Coltrane Changes",
-                            "Quartal Harmony",
-                            "Outside Playing"
-                        ]
-                    },
-                    {
-                        "name": "Virtuoso Techniques",
-                        "topics": [
-                            "Sweep Picking",
-                            "8-Finger Tapping",
-                            "String Skipping",
-                            "Hybrid Picking",
-                            "Advanced Legato"
-                        ]
-                    }
-                ]
-            }
+            "practice_approach": "slow-to-fast",
+            "metronome_essential": True
         }
+    }
+
+
+class MusicProfessorAI:
+    """AI 음악 교수 시스템"""
     
-    def _initialize_teaching_methods(self) -> Dict:
-        """교육 방법론 초기화"""
-        return {
-            "berklee_method": {
-                "daily_practice": {
-                    "technical_studies": 30,  # minutes
-                    "sight_reading": 20,
-                    "improvisation": 30,
-                    "repertoire": 40,
-                    "ear_training": 20
-                },
-                "assessment": ["performance", "theory", "improvisation", "ensemble"]
-            },
-            "mi_method": {
-                "technique_focus": {
-                    "speed_development": True,
-                    "accuracy_drills": True,
-                    "endurance_training": True
-                },
-                "practice_approach": "slow-to-fast",
-                "metronome_essential": True
-            }
-        }
+    @functools.cached_property
+    def professors(self) -> Dict:
+        """교수진 페르소나 (첫 접근 시 생성, 인스턴스 간 공유)"""
+        return _build_professors()
+    
+    @functools.cached_property
+    def curriculum(self) -> Dict:
+        """Berklee/MI 기반 커리큘럼"""
+        return _build_curriculum()
+    
+    @functools.cached_property
+    def teaching_methods(self) -> Dict:
+        """교육 방법론"""
+        return _build_teaching_methods()
     
     def analyze_student_level(self, performance_data: Dict) -> Tuple[Difficulty, List[str]]:
         """학생 실력 분석 및 레벨 판정"""
         # 실제 구현에서는 ML 모델 사용
-        scores = {
-            "technique": performance_data.get("technique_score", 0),
-            "theory": performance_data.get("theory_score", 0),
-            "rhythm": performance_data.get("rhythm_score", 0),
-            "musicality": performance_data.get("musicality_score", 0)
-        }
+        technique = performance_data.get("technique_score", 0.0)
+        theory = performance_data.get("theory_score", 0.0)
+        rhythm = performance_data.get("rhythm_score", 0.0)
+        musicality = performance_data.get("musicality_score", 0.0)
         
-        avg_score = np.mean(list(scores.values()))
+        avg_score = (technique + theory + rhythm + musicality) * 0.25
         
         if avg_score < 0.3:
             level = Difficulty.BEGINNER
@@ -225,28 +391,24 @@ class MusicProfessorAI:
             level = Difficulty.PROFESSIONAL
             
         # 약점 분석
-        weaknesses = [k for k, v in scores.items() if v < avg_score - 0.1]
+        threshold = avg_score - 0.1
+        weaknesses = [k for k, v in (
+            ("technique", technique),
+            ("theory", theory),
+            ("rhythm", rhythm),
+            ("musicality", musicality)
+        ) if v < threshold]
         
         return level, weaknesses
     
     def select_professor(self, style_preference: str, learning_goal: str) -> ProfessorType:
         """학습 목표와 선호 스타일에 맞는 교수 선택"""
-        professor_map = {
-            "jazz": ProfessorType.JAZZ,
-            "rock": ProfessorType.ROCK,
-            "metal": ProfessorType.ROCK,
-            "classical": ProfessorType.CLASSICAL,
-            "fusion": ProfessorType.FUSION,
-            "modern": ProfessorType.FUSION
-        }
+        keywords = _STYLE_PATTERN.findall(style_preference.lower())
         
-        style_lower = style_preference.lower()
-        for key in professor_map:
-            if key in style_lower:
-                return professor_map[key]
-        
-        # 기본값
-        return ProfessorType.ROCK
+        # 기본값: ROCK
+        if not keywords:
+            return ProfessorType.ROCK
+        return _PROFESSOR_MAP[min(keywords, key=_STYLE_PRIORITY.__getitem__)]
     
     def generate_lesson_plan(self, 
                             student_level: Difficulty,
@@ -254,130 +416,54 @@ class MusicProfessorAI:
                             professor: ProfessorType,
                             duration_weeks: int = 4) -> List[Lesson]:
         """맞춤형 레슨 계획 생성"""
-        lessons = []
+        # 주차와 무관한 연습/숙제는 한 번만 생성 (연습 목록은 주차별 사본, 숙제는 불변 튜플)
+        exercises = self._generate_exercises(student_level, weaknesses)
+        homework = self._generate_homework(student_level)
+        weakness_set = frozenset(weaknesses)
         
         # 주차별 레슨 생성
-        for week in range(1, duration_weeks + 1):
-            lesson = Lesson(
+        return [
+            Lesson(
                 title=f"Week {week}: {self._get_weekly_topic(week, weaknesses)}",
                 professor=professor,
                 difficulty=student_level,
                 duration_minutes=60,
-                topics=self._generate_weekly_topics(week, student_level, weaknesses),
-                exercises=self._generate_exercises(student_level, weaknesses),
-                homework=self._generate_homework(student_level)
+                topics=self._generate_weekly_topics(week, student_level, weakness_set),
+                exercises=[dict(exercise) for exercise in exercises],
+                homework=homework
             )
-            lessons.append(lesson)
-        
-        return lessons
+            for week in range(1, duration_weeks + 1)
+        ]
     
     def _get_weekly_topic(self, week: int, weaknesses: List[str]) -> str:
         """주차별 핵심 주제 선정"""
-        topics = {
-            1: "Foundation & Assessment",
-            2: "Technique Development", 
-            3: "Theory Application",
-            4: "Performance & Review"
-        }
-        
         if weaknesses and week == 2:
             return f"Focus: {weaknesses[0].title()} Improvement"
         
-        return topics.get(week, "Comprehensive Training")
+        return _WEEKLY_TOPICS.get(week, "Comprehensive Training")
     
-    def _generate_weekly_topics(self, week: int, level: Difficulty, weaknesses: List[str]) -> List[str]:
+    def _generate_weekly_topics(self, week: int, level: Difficulty, weaknesses: FrozenSet[str]) -> Tuple[str, ...]:
         """주차별 세부 토픽 생성"""
-        base_topics = {
-            Difficulty.BEGINNER: [
-                "Open Chords", "Strumming Patterns", "Major Scale", "Timing Basics"
-            ],
-            Difficulty.INTERMEDIATE: [
-                "Barre Chords", "Pentatonic Patterns", "7th Chords", "Improvisation Basics"
-            ],
-            Difficulty.ADVANCED: [
-                "Extended Chords", "Modal Playing", "Advanced Techniques", "Jazz Standards"
-            ],
-            Difficulty.PROFESSIONAL: [
-                "Composition", "Arrangement", "Advanced Theory", "Style Development"
-            ]
-        }
-        
-        topics = base_topics.get(level, [])
-        
         # 약점 보완 토픽 추가
-        if "technique" in weaknesses:
-            topics.append("Technique Drills")
-        if "theory" in weaknesses:
-            topics.append("Theory Deep Dive")
-        if "rhythm" in weaknesses:
-            topics.append("Rhythm Exercises")
+        topics = _BASE_TOPICS.get(level, ()) + tuple(
+            topic for weakness, topic in _WEAKNESS_TOPICS if weakness in weaknesses
+        )
             
         return topics[:5]  # 주당 5개 토픽
     
     def _generate_exercises(self, level: Difficulty, weaknesses: List[str]) -> List[Dict]:
         """맞춤형 연습 생성"""
-        exercises = []
-        
         # 기본 연습
-        exercises.append({
-            "type": "warm_up",
-            "name": "Chromatic Warm-up",
-            "tempo": 60 if level == Difficulty.BEGINNER else 120,
-            "duration_minutes": 10
-        })
-        
-        # 약점 보완 연습
-        for weakness in weaknesses:
-            if weakness == "technique":
-                exercises.append({
-                    "type": "technique",
-                    "name": "Alternate Picking Pattern",
-                    "tempo": 80,
-                    "duration_minutes": 15
-                })
-            elif weakness == "theory":
-                exercises.append({
-                    "type": "theory",
-                    "name": "Chord Progression Analysis",
-                    "key": "C Major",
-                    "duration_minutes": 20
-                })
-            elif weakness == "rhythm":
-                exercises.append({
-                    "type": "rhythm",
-                    "name": "Subdivision Exercise",
-                    "time_signature": "4/4",
-                    "duration_minutes": 15
-                })
+        warm_up = _WARM_UP_BEGINNER if level == Difficulty.BEGINNER else _WARM_UP_DEFAULT
         
-        return exercises
+        # 약점 보완 연습 (공유 템플릿이 변경되지 않도록 사본 반환)
+        return [dict(warm_up)] + [
+            dict(_EXERCISE_BY_WEAKNESS[w]) for w in weaknesses if w in _EXERCISE_BY_WEAKNESS
+        ]
     
-    def _generate_homework(self, level: Difficulty) -> List[str]:
+    def _generate_homework(self, level: Difficulty) -> Tuple[str, ...]:
         """숙제 생성"""
-        homework_templates = {
-            Difficulty.BEGINNER: [
-                "Practice chord changes for 15 minutes daily",
-                "Learn one new scale pattern",
-                "Record yourself playing the weekly piece"
-            ],
-            Difficulty.INTERMEDIATE: [
-                "Transcribe 8 bars of a solo",
-                "Practice improvisation over backing track",
-                "Analyze chord progression of favorite song"
-            ],
-            Difficulty.ADVANCED: [
-                "Compose 16-bar progression using learned concepts",
-                "Master the weekly etude at performance tempo",
-                "Prepare two contrasting pieces for review"
-            ],
-            Difficulty.PROFESSIONAL: [
-                "Arrange a standard in personal style",
-                "Record professional-quality demo",
-                "Analyze and replicate master's technique"
-            ]
-        }
-        
-        return homework_templates.get(level, ["Practice daily for 30 minutes"])
+        return _HOMEWORK_TEMPLATES.get(level, _DEFAULT_HOMEWORK)
     
     def provide_feedback(self, performance_audio: bytes, lesson: Lesson) -> Dict:
         """연주에 대한 AI 피드백 제공"""
@@ -414,36 +500,22 @@ class MusicProfessorAI:
     
     def _generate_professor_comment(self, professor: ProfessorType) -> str:
         """교수별 특색있는 코멘트 생성"""
-        comments = {
-            ProfessorType.JAZZ: "훌륭한 진전이에요! 스윙 필링을 더 살려보세요. Charlie Parker가 말했듯이, '먼저 악기를 마스터하고, 그 다음 음악을 마스터하고, 그리고 모든 것을 잊고 그냥 연주하세요.'",
-            ProfessorType.ROCK: "Rock on! 파워코드가 훨씬 단단해졌네요. 다음엔 palm muting을 더 타이트하게 해봅시다. Remember: Attitude is everything!",
-            ProfessorType.CLASSICAL: "Molto bene! 프레이징이 개선되었습니다. 다이나믹 대비를 더 극대화하면 곡의 드라마가 살아날 것입니다.",
-            ProfessorType.FUSION: "Sick playing! 리듬 디스플레이스먼트 아이디어가 창의적이에요. 다음엔 odd time signatures를 탐험해볼까요?"
-        }
-        
-        return comments.get(professor, "Good progress! Keep practicing!")
+        return _PROFESSOR_COMMENTS.get(professor, "Good progress! Keep practicing!")
     
-    def track_progress(self, student_id: str, lesson_results: Dict) -> Dict:
-        """학습 진도 추적"""
+    def track_progress(self, student_id: str, lesson_results: Dict, now: Optional[str] = None) -> Dict:
+        """학습 진도 추적
+
+        배치 동기화 시에는 now에 공통 타임스탬프를 넘겨 재포맷을 생략한다.
+        """
         # 실제로는 데이터베이스에 저장
-        progress = {
-            "student_id": student_id,
-            "date": datetime.now().isoformat(),
-            "lessons_completed": lesson_results.get("completed", 0),
-            "current_level": lesson_results.get("level", "beginner"),
-            "skill_improvements": {
-                "technique": "+15%",
-                "theory": "+20%",
-                "sight_reading": "+10%",
-                "improvisation": "+25%"
-            },
-            "achievements_unlocked": [
-                "First Solo",
-                "Theory Novice",
-                "Practice Streak 7 Days"
-            ],
-            "next_milestone": "Complete Level 1 Certification"
-        }
+        progress = _PROGRESS_TEMPLATE.copy()
+        progress["student_id"] = student_id
+        progress["date"] = now if now is not None else _now_iso()
+        progress["lessons_completed"] = lesson_results.get("completed", 0)
+        progress["current_level"] = lesson_results.get("level", "beginner")
+        # 중첩 컨테이너는 호출자 수정이 템플릿에 번지지 않도록 복사
+        progress["skill_improvements"] = dict(_PROGRESS_TEMPLATE["skill_improvements"])
+        progress["achievements_unlocked"] = list(_PROGRESS_TEMPLATE["achievements_unlocked"])
         
         return progress
 
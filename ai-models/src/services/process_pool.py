@@ -0,0 +1,40 @@
+"""
+Process Pool
+Single process pool shared by the CPU-bound music21 analyses
+(transcription theory analysis and TheoryAnalyzer chord extraction)
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Shared pool (one worker per core), created on first use"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor()
+        return _pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next get_process_pool() starts a fresh one"""
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Stop the shared pool's workers (called on application shutdown)"""
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
@@ -4,10 +4,80 @@ Detects guitarist playing style based on audio features
 Specialized for 70-80s rock/metal guitarists
 """
 
+import asyncio
+import functools
+import threading
 import numpy as np
-from typing import Dict, List, Optional
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Mapping, Optional, Set, Tuple, TypedDict
 from dataclasses import dataclass
 from enum import Enum
+from operator import itemgetter
+from types import MappingProxyType
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Return the function unchanged when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from ._compat import DATACLASS_SLOTS
+from ._style_kernels_aot import interval_sim as interval_sim_kernel
+
+try:
+    from . import style_kernels  # built by `python -m services._style_kernels_aot`
+    HAS_AOT_KERNELS = True
+except ImportError:
+    HAS_AOT_KERNELS = False
+
+# Number of set bits for every byte value (popcount lookup table)
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Count set bits of each uint32 mask"""
+    return _POPCOUNT_TABLE[masks.view(np.uint8)].reshape(len(masks), -1).sum(axis=1)
+
+
+# Interval kernel: AOT-compiled extension if built, else numba JIT of the same source
+_interval_sim_nb = njit(cache=True, fastmath=True)(interval_sim_kernel)
+
+
+def _pearson(a: np.ndarray, b: np.ndarray) -> float:
+    """Pearson correlation of two vectors, 0.0 when either is constant"""
+    a = a - a.mean()
+    b = b - b.mean()
+    denom = np.sqrt((a * a).sum() * (b * b).sum())
+    return float((a * b).sum() / denom) if denom else 0.0
+
+
+def _bin12(intervals: np.ndarray) -> np.ndarray:
+    """Count intervals per interval class (semitones mod 12)"""
+    return np.bincount(np.abs(intervals) % 12, minlength=12).astype(np.float64)
+
+
+def _interval_sim_np(a: np.ndarray, b: np.ndarray) -> float:
+    """NumPy fallback for _interval_sim_nb when numba is unavailable"""
+    if a.shape[0] == 0 or b.shape[0] == 0:
+        return 0.0
+    return _pearson(_bin12(a), _bin12(b))
+
+
+if HAS_AOT_KERNELS:
+    _interval_sim = style_kernels.interval_sim
+elif HAS_NUMBA:
+    _interval_sim = _interval_sim_nb
+    # Compile on import so the first request does not pay the JIT cost
+    _interval_sim(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+else:
+    _interval_sim = _interval_sim_np
+
 
 class GuitaristStyle(Enum):
     YNGWIE_MALMSTEEN = "yngwie_malmsteen"
@@ -17,7 +87,8 @@ class GuitaristStyle(Enum):
     ERIC_CLAPTON = "eric_clapton"
     UNKNOWN = "unknown"
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class StyleFeatures:
     """Features that characterize a guitarist's style"""
     speed_bpm: float
@@ -31,85 +102,231 @@ class StyleFeatures:
     rhythm_complexity: float
     harmonic_complexity: float
 
+# Predefined style profiles for each guitarist
+_STYLE_PROFILES = MappingProxyType({
+    GuitaristStyle.YNGWIE_MALMSTEEN: StyleFeatures(
+        speed_bpm=180,  # Fast neoclassical runs
+        note_density=0.8,  # High note density
+        vibrato_rate=6.0,  # Fast, wide vibrato
+        bend_frequency=0.1,  # Less bending, more scales
+        palm_mute_ratio=0.1,  # Minimal palm muting
+        legato_ratio=0.3,  # Some legato, mostly picked
+        scale_patterns=['harmonic_minor', 'phrygian_dominant', 'diminished'],
+        common_intervals=[3, 4, 5, 7, 12],  # Thirds, fourths, fifths, octaves
+        rhythm_complexity=0.4,  # Focus on lead
+        harmonic_complexity=0.8  # Complex harmony
+    ),
+    
+    GuitaristStyle.RANDY_RHOADS: StyleFeatures(
+        speed_bpm=140,
+        note_density=0.6,
+        vibrato_rate=5.0,
+        bend_frequency=0.3,
+        palm_mute_ratio=0.3,
+        legato_ratio=0.4,
+        scale_patterns=['natural_minor', 'harmonic_minor', 'major'],
+        common_intervals=[3, 4, 5, 8, 12],
+        rhythm_complexity=0.6,
+        harmonic_complexity=0.7
+    ),
+    
+    GuitaristStyle.JAMES_HETFIELD: StyleFeatures(
+        speed_bpm=200,  # Fast downpicking
+        note_density=0.4,  # Lower for rhythm
+        vibrato_rate=2.0,  # Less vibrato
+        bend_frequency=0.1,
+        palm_mute_ratio=0.7,  # Heavy palm muting
+        legato_ratio=0.1,  # Mostly picked
+        scale_patterns=['pentatonic_minor', 'chromatic'],
+        common_intervals=[1, 2, 5, 7, 12],  # Power chords, chromatic
+        rhythm_complexity=0.9,  # Complex rhythms
+        harmonic_complexity=0.3  # Simple harmony (power chords)
+    ),
+    
+    GuitaristStyle.JOHN_PETRUCCI: StyleFeatures(
+        speed_bpm=160,
+        note_density=0.7,
+        vibrato_rate=5.5,
+        bend_frequency=0.2,
+        palm_mute_ratio=0.4,
+        legato_ratio=0.5,  # Balanced picking and legato
+        scale_patterns=['all'],  # Uses everything
+        common_intervals=[2, 3, 4, 5, 6, 7, 9, 11],  # Complex intervals
+        rhythm_complexity=0.9,  # Odd time signatures
+        harmonic_complexity=0.9  # Very complex
+    ),
+    
+    GuitaristStyle.ERIC_CLAPTON: StyleFeatures(
+        speed_bpm=100,
+        note_density=0.3,  # Sparse, bluesy
+        vibrato_rate=4.0,
+        bend_frequency=0.6,  # Lots of bending
+        palm_mute_ratio=0.2,
+        legato_ratio=0.5,
+        scale_patterns=['pentatonic_minor', 'blues', 'major_pentatonic'],
+        common_intervals=[3, 4, 5, 7],  # Blues intervals
+        rhythm_complexity=0.5,
+        harmonic_complexity=0.4  # Blues simplicity
+    )
+})
+
+# Practice recommendations per detected style
+_RECOMMENDATIONS = MappingProxyType({
+    GuitaristStyle.YNGWIE_MALMSTEEN.value: (
+        "Practice harmonic minor scales in all positions",
+        "Work on sweep picking arpeggios",
+        "Study Bach violin pieces",
+        "Focus on pedal point exercises"
+    ),
+    GuitaristStyle.RANDY_RHOADS.value: (
+        "Study classical guitar pieces",
+        "Practice natural and harmonic minor scales",
+        "Work on combining classical and rock techniques",
+        "Analyze modal progressions"
+    ),
+    GuitaristStyle.JAMES_HETFIELD.value: (
+        "Develop downpicking endurance",
+        "Practice palm muting techniques",
+        "Study chromatic riffs",
+        "Work on tight rhythm playing"
+    ),
+    GuitaristStyle.JOHN_PETRUCCI.value: (
+        "Practice odd time signatures",
+        "Study all modes and scales",
+        "Work on technical exercises",
+        "Analyze complex progressions"
+    ),
+    GuitaristStyle.ERIC_CLAPTON.value: (
+        "Master pentatonic scales",
+        "Practice string bending accuracy",
+        "Study blues turnarounds",
+        "Work on call-and-response phrasing"
+    )
+})
+_DEFAULT_RECOMMENDATIONS = ("Continue practicing fundamentals",)
+
+# Scalar feature vector layout shared by profiles and extracted features
+_SCALAR_FEATURES = (
+    'speed_bpm', 'note_density', 'vibrato_rate', 'bend_frequency',
+    'palm_mute_ratio', 'legato_ratio', 'rhythm_complexity'
+)
+_SPEED, _NOTE_DENSITY, _VIBRATO, _BENDING, _PALM_MUTE, _LEGATO, _RHYTHM = range(len(_SCALAR_FEATURES))
+
+
+class AudioFeatures(TypedDict, total=False):
+    """Audio analysis fields read by the detector"""
+    tempo: float
+    note_density: float
+    vibrato_rate: float
+    bend_frequency: float
+    palm_mute_ratio: float
+    legato_ratio: float
+    scale_patterns: List[str]
+    intervals: List[int]
+    rhythm_complexity: float
+    harmonic_complexity: float
+
+
+# Defaults for missing audio fields, merged once per call instead of per-field .get()
+_FEATURE_DEFAULTS = MappingProxyType({
+    'tempo': 120,
+    'note_density': 0.5,
+    'vibrato_rate': 4.0,
+    'bend_frequency': 0.3,
+    'palm_mute_ratio': 0.3,
+    'legato_ratio': 0.3,
+    'scale_patterns': (),
+    'intervals': (),
+    'rhythm_complexity': 0.5,
+    'harmonic_complexity': 0.5
+})
+
+# Audio field names in _SCALAR_FEATURES order
+_get_scalar_fields = itemgetter(
+    'tempo', 'note_density', 'vibrato_rate', 'bend_frequency',
+    'palm_mute_ratio', 'legato_ratio', 'rhythm_complexity'
+)
+
+# Similarity weights are multiples of 0.05, stored exactly as int8 quanta
+_WEIGHT_QUANTUM = 0.05
+_SCALAR_WEIGHTS_Q = np.array([3, 3, 2, 2, 2, 2, 1], dtype=np.int8)
+_SCALAR_WEIGHT_SUM_Q = int(_SCALAR_WEIGHTS_Q.sum())
+_SCALE_WEIGHT_Q = 3
+_INTERVAL_WEIGHT_Q = 2
+
+# Scores closer than this count as a tie (first profile in order wins)
+_TIE_TOLERANCE = 1e-9
+
+# Per-feature normalization denominators
+_SCALAR_NORMS = np.array([200, 1, 10, 1, 1, 1, 1], dtype=np.float64)
+_INV_NORMS = 1.0 / _SCALAR_NORMS
+
+# Technique rules: (feature index, lower, upper, technique, characteristic)
+# A rule fires when lower < value <= upper
+_TECHNIQUE_RULES = (
+    (_SPEED, 160, np.inf, "Fast alternate picking", None),
+    (_VIBRATO, 5, np.inf, None, "Wide, fast vibrato"),
+    (_VIBRATO, 3, 5, None, "Moderate vibrato"),
+    (_BENDING, 0.4, np.inf, "Frequent string bending", "Blues influence"),
+    (_PALM_MUTE, 0.5, np.inf, "Heavy palm muting", "Rhythm-focused"),
+    (_LEGATO, 0.6, np.inf, "Legato phrasing", None),
+)
+_RULE_FEATURES = np.array([rule[0] for rule in _TECHNIQUE_RULES], dtype=np.intp)
+_RULE_LOWER = np.array([rule[1] for rule in _TECHNIQUE_RULES], dtype=np.float64)
+_RULE_UPPER = np.array([rule[2] for rule in _TECHNIQUE_RULES], dtype=np.float64)
+
+# Extra technique implied by a detected technique for a specific style
+_STYLE_TECHNIQUES = MappingProxyType({
+    (GuitaristStyle.YNGWIE_MALMSTEEN, "Fast alternate picking"): "Sweep picking"
+})
+
 class StyleDetector:
+    # Detection result cache (LRU) and semantic near-hit window
+    RESULT_CACHE_SIZE = 1024
+    NEAR_HIT_WINDOW = 32
+    NEAR_HIT_DISTANCE = 0.05
+    
     def __init__(self):
         self.style_profiles = self._load_style_profiles()
+        self._build_profile_arrays()
+        self._result_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._recent_keys: Deque[Tuple[np.ndarray, Tuple]] = deque(maxlen=self.NEAR_HIT_WINDOW)
+        self._cache_lock = threading.Lock()  # detect runs in worker threads
         self.ready = True
     
     def is_ready(self) -> bool:
         """Check if service is ready"""
         return self.ready
     
-    def _load_style_profiles(self) -> Dict[GuitaristStyle, StyleFeatures]:
+    def _load_style_profiles(self) -> Mapping[GuitaristStyle, StyleFeatures]:
         """Load predefined style profiles for each guitarist"""
-        return {
-            GuitaristStyle.YNGWIE_MALMSTEEN: StyleFeatures(
-                speed_bpm=180,  # Fast neoclassical runs
-                note_density=0.8,  # High note density
-                vibrato_rate=6.0,  # Fast, wide vibrato
-                bend_frequency=0.1,  # Less bending, more scales
-                palm_mute_ratio=0.1,  # Minimal palm muting
-                legato_ratio=0.3,  # Some legato, mostly picked
-                scale_patterns=['harmonic_minor', 'phrygian_dominant', 'diminished'],
-                common_intervals=[3, 4, 5, 7, 12],  # Thirds, fourths, fifths, octaves
-                rhythm_complexity=0.4,  # Focus on lead
-                harmonic_complexity=0.8  # Complex harmony
-            ),
-            
-            GuitaristStyle.RANDY_RHOADS: StyleFeatures(
-                speed_bpm=140,
-                note_density=0.6,
-                vibrato_rate=5.0,
-                bend_frequency=0.3,
-                palm_mute_ratio=0.3,
-                legato_ratio=0.4,
-                scale_patterns=['natural_minor', 'harmonic_minor', 'major'],
-                common_intervals=[3, 4, 5, 8, 12],
-                rhythm_complexity=0.6,
-                harmonic_complexity=0.7
-            ),
-            
-            GuitaristStyle.JAMES_HETFIELD: StyleFeatures(
-                speed_bpm=200,  # Fast downpicking
-                note_density=0.4,  # Lower for rhythm
-                vibrato_rate=2.0,  # Less vibrato
-                bend_frequency=0.1,
-                palm_mute_ratio=0.7,  # Heavy palm muting
-                legato_ratio=0.1,  # Mostly picked
-                scale_patterns=['pentatonic_minor', 'chromatic'],
-                common_intervals=[1, 2, 5, 7, 12],  # Power chords, chromatic
-                rhythm_complexity=0.9,  # Complex rhythms
-                harmonic_complexity=0.3  # Simple harmony (power chords)
-            ),
-            
-            GuitaristStyle.JOHN_PETRUCCI: StyleFeatures(
-                speed_bpm=160,
-                note_density=0.7,
-                vibrato_rate=5.5,
-                bend_frequency=0.2,
-                palm_mute_ratio=0.4,
-                legato_ratio=0.5,  # Balanced picking and legato
-                scale_patterns=['all'],  # Uses everything
-                common_intervals=[2, 3, 4, 5, 6, 7, 9, 11],  # Complex intervals
-                rhythm_complexity=0.9,  # Odd time signatures
-                harmonic_complexity=0.9  # Very complex
-            ),
-            
-            GuitaristStyle.ERIC_CLAPTON: StyleFeatures(
-                speed_bpm=100,
-                note_density=0.3,  # Sparse, bluesy
-                vibrato_rate=4.0,
-                bend_frequency=0.6,  # Lots of bending
-                palm_mute_ratio=0.2,
-                legato_ratio=0.5,
-                scale_patterns=['pentatonic_minor', 'blues', 'major_pentatonic'],
-                common_intervals=[3, 4, 5, 7],  # Blues intervals
-                rhythm_complexity=0.5,
-                harmonic_complexity=0.4  # Blues simplicity
-            )
-        }
+        return _STYLE_PROFILES
     
-    async def detect(self, audio_features: Dict) -> Dict:
+    def _build_profile_arrays(self):
+        """Stack profile features into arrays for vectorized scoring"""
+        profiles = list(self.style_profiles.values())
+        self._style_names = [style.value for style in self.style_profiles]
+        
+        # (n_profiles, n_scalar_features) matrix in _SCALAR_FEATURES order
+        self._profile_mat = np.array(
+            [[getattr(p, attr) for attr in _SCALAR_FEATURES] for p in profiles],
+            dtype=np.float64
+        )
+        
+        # Scale names become bit indices; 'all' sets every bit
+        all_scales = {name for p in profiles for name in p.scale_patterns} - {'all'}
+        self._scale_bit = {name: 1 << i for i, name in enumerate(sorted(all_scales))}
+        self._all_scales_mask = (1 << len(self._scale_bit)) - 1
+        self._zero_sims = np.zeros(len(profiles))
+        self._zero_sims.flags.writeable = False
+        self._interval_arrays = [
+            np.asarray(p.common_intervals, dtype=np.int64) for p in profiles
+        ]
+        self._scale_masks = np.array(
+            [self._scale_mask(p.scale_patterns)[0] for p in profiles], dtype=np.uint32
+        )
+    
+    async def detect(self, audio_features: AudioFeatures) -> Dict:
         """
         Detect guitarist style from audio features
         
@@ -119,201 +336,228 @@ class StyleDetector:
         Returns:
             Style detection results
         """
+        # CPU-bound work runs in a worker thread so the event loop stays free
+        return await asyncio.to_thread(self._detect_sync, audio_features)
+    
+    def _detect_sync(self, audio_features: AudioFeatures) -> Dict:
+        """Synchronous body of detect"""
         try:
             # Extract style features from audio
-            extracted_features = self._extract_style_features(audio_features)
+            x, scales, intervals = self._extract_feature_vector(audio_features)
             
-            # Compare with known profiles
-            similarities = {}
-            for style, profile in self.style_profiles.items():
-                similarity = self._calculate_similarity(
-                    extracted_features,
-                    profile
-                )
-                similarities[style.value] = similarity
-            
-            # Find best match
-            best_match = max(similarities, key=similarities.get)
-            confidence = similarities[best_match]
-            
-            # Get detailed analysis
-            analysis = self._analyze_techniques(
-                extracted_features,
-                GuitaristStyle(best_match)
-            )
+            # Repeated analyses of the same track hit the cache
+            key, vector = self._feature_key(x, scales, intervals)
+            cached = self._lookup_cached(key, vector)
+            if cached is None:
+                cached = self._detect_uncached(x, scales, intervals)
+                self._store_cached(key, vector, cached)
+                analysis = {
+                    'techniques': cached['techniques_detected'],
+                    'characteristics': cached['style_characteristics']
+                }
+            else:
+                # Cache keys are rounded and near hits come from another input, so the
+                # threshold rules are re-evaluated on this input's own features
+                analysis = self._analyze_techniques(x, GuitaristStyle(cached['detected_style']))
             
             return {
-                'detected_style': best_match,
-                'confidence': confidence,
-                'similarities': similarities,
-                'techniques_detected': analysis['techniques'],
-                'style_characteristics': analysis['characteristics'],
-                'recommendations': self._get_practice_recommendations(best_match)
+                **cached,
+                'similarities': dict(cached['similarities']),
+                'techniques_detected': list(analysis['techniques']),
+                'style_characteristics': list(analysis['characteristics']),
+                'recommendations': list(cached['recommendations'])
             }
             
         except Exception as e:
             print(f"Style detection error: {e}")
             raise
     
-    def _extract_style_features(self, audio_features: Dict) -> StyleFeatures:
-        """Extract style-relevant features from audio analysis"""
-        # This would analyze the actual audio features
-        # For now, return placeholder
-        return StyleFeatures(
-            speed_bpm=audio_features.get('tempo', 120),
-            note_density=audio_features.get('note_density', 0.5),
-            vibrato_rate=audio_features.get('vibrato_rate', 4.0),
-            bend_frequency=audio_features.get('bend_frequency', 0.3),
-            palm_mute_ratio=audio_features.get('palm_mute_ratio', 0.3),
-            legato_ratio=audio_features.get('legato_ratio', 0.3),
-            scale_patterns=audio_features.get('scale_patterns', []),
-            common_intervals=audio_features.get('intervals', []),
-            rhythm_complexity=audio_features.get('rhythm_complexity', 0.5),
-            harmonic_complexity=audio_features.get('harmonic_complexity', 0.5)
-        )
+    def _detect_uncached(self, x: np.ndarray, scales: List[str], intervals: List[int]) -> Dict:
+        """Run the full similarity pipeline for extracted features"""
+        # Compare with all known profiles at once
+        return self._build_result(x, self._score_all(x, scales, intervals))
     
-    def _calculate_similarity(
-        self,
-        features1: StyleFeatures,
-        features2: StyleFeatures
-    ) -> float:
-        """Calculate similarity between two style profiles"""
-        # Weighted similarity calculation
-        weights = {
-            'speed': 0.15,
-            'note_density': 0.15,
-            'vibrato': 0.10,
-            'bending': 0.10,
-            'palm_mute': 0.10,
-            'legato': 0.10,
-            'scales': 0.15,
-            'intervals': 0.10,
-            'rhythm': 0.05
-        }
+    def detect_batch(self, batch: List[AudioFeatures]) -> List[Dict]:
+        """
+        Detect styles for many tracks at once
         
-        similarities = {
-            'speed': 1.0 - abs(features1.speed_bpm - features2.speed_bpm) / 200,
-            'note_density': 1.0 - abs(features1.note_density - features2.note_density),
-            'vibrato': 1.0 - abs(features1.vibrato_rate - features2.vibrato_rate) / 10,
-            'bending': 1.0 - abs(features1.bend_frequency - features2.bend_frequency),
-            'palm_mute': 1.0 - abs(features1.palm_mute_ratio - features2.palm_mute_ratio),
-            'legato': 1.0 - abs(features1.legato_ratio - features2.legato_ratio),
-            'scales': self._scale_similarity(features1.scale_patterns, features2.scale_patterns),
-            'intervals': self._interval_similarity(features1.common_intervals, features2.common_intervals),
-            'rhythm': 1.0 - abs(features1.rhythm_complexity - features2.rhythm_complexity)
-        }
+        Args:
+            batch: Extracted audio features per track
+            
+        Returns:
+            Style detection results in input order
+        """
+        if not batch:
+            return []
         
-        # Weighted average
-        total_similarity = sum(
-            similarities[key] * weights[key]
-            for key in weights
+        extracted = [self._extract_feature_vector(audio_features) for audio_features in batch]
+        X = np.stack([x for x, _, _ in extracted])
+        scores = self._score_batch(
+            X,
+            [scales for _, scales, _ in extracted],
+            [intervals for _, _, intervals in extracted]
         )
         
-        return min(max(total_similarity, 0.0), 1.0)
+        return [self._build_result(x, track_scores) for x, track_scores in zip(X, scores)]
     
-    def _scale_similarity(self, scales1: List[str], scales2: List[str]) -> float:
-        """Calculate similarity between scale usage"""
-        if not scales1 or not scales2:
-            return 0.0
+    def _build_result(self, x: np.ndarray, scores: np.ndarray) -> Dict:
+        """Assemble a detection result from one track's profile scores"""
+        # Find best match; rounding noise must not break ties between equal profiles
+        best_index = int(np.flatnonzero(scores >= scores.max() - _TIE_TOLERANCE)[0])
+        best_match = self._style_names[best_index]
+        confidence = float(scores[best_index])
+        similarities = dict(zip(self._style_names, scores.tolist()))
         
-        common = set(scales1).intersection(set(scales2))
-        total = set(scales1).union(set(scales2))
+        # Get detailed analysis
+        analysis = self._analyze_techniques(x, GuitaristStyle(best_match))
         
-        return len(common) / len(total) if total else 0.0
+        return {
+            'detected_style': best_match,
+            'confidence': confidence,
+            'similarities': similarities,
+            'techniques_detected': analysis['techniques'],
+            'style_characteristics': analysis['characteristics'],
+            'recommendations': list(self._get_practice_recommendations(best_match))
+        }
     
-    def _interval_similarity(self, intervals1: List[int], intervals2: List[int]) -> float:
-        """Calculate similarity between interval usage"""
-        if not intervals1 or not intervals2:
-            return 0.0
-        
-        # Compare interval distributions
-        hist1 = np.histogram(intervals1, bins=12)[0]
-        hist2 = np.histogram(intervals2, bins=12)[0]
+    def _feature_key(
+        self,
+        x: np.ndarray,
+        scales: List[str],
+        intervals: List[int]
+    ) -> Tuple[Tuple, np.ndarray]:
+        """Quantized cache key plus the normalized numeric vector used for near hits"""
+        speed, *ratios = x.tolist()
+        key = (
+            round(speed),
+            *(round(value, 2) for value in ratios),
+            tuple(sorted(set(scales))),
+            tuple(sorted(intervals))
+        )
+        return key, x / _SCALAR_NORMS
+    
+    def _lookup_cached(self, key: Tuple, vector: np.ndarray) -> Optional[Dict]:
+        """Exact LRU hit, or a recent result whose numeric features are nearly equal"""
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return cached
+            
+            for recent_vector, recent_key in self._recent_keys:
+                # Scales and intervals must match exactly
+                if (recent_key[-2:] == key[-2:]
+                        and np.linalg.norm(recent_vector - vector) < self.NEAR_HIT_DISTANCE):
+                    return self._result_cache.get(recent_key)
+            return None
+    
+    def _store_cached(self, key: Tuple, vector: np.ndarray, result: Dict):
+        """Insert a detection result, evicting the least recently used one"""
+        with self._cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+            self._recent_keys.append((vector, key))
+    
+    def _extract_feature_vector(self, audio_features: AudioFeatures) -> Tuple[np.ndarray, List[str], List[int]]:
+        """Extract the scalar feature vector plus scales and intervals from audio analysis"""
+        merged = {**_FEATURE_DEFAULTS, **audio_features}
+        # float64 so threshold checks match the input values exactly
+        x = np.array(_get_scalar_fields(merged), dtype=np.float64)
+        return x, merged['scale_patterns'], merged['intervals']
+    
+    def _score_all(self, x: np.ndarray, scales: List[str], intervals: List[int]) -> np.ndarray:
+        """Similarity of the extracted features against every profile in one fused pass"""
+        return self._score_batch(x[None, :], [scales], [intervals])[0]
+    
+    def _score_batch(
+        self,
+        X: np.ndarray,
+        scales_list: List[List[str]],
+        intervals_list: List[List[int]]
+    ) -> np.ndarray:
+        """(n_tracks, n_profiles) similarity matrix for stacked feature vectors"""
+        # sum_k w_k * (1 - d_k) == q * (sum(w_q) - d @ w_q), d_k = |p_k - x_k| / norm_k
+        diffs = np.abs(X[:, None, :] - self._profile_mat[None, :, :]) * _INV_NORMS
+        scores = _SCALAR_WEIGHT_SUM_Q - np.einsum('npk,k->np', diffs, _SCALAR_WEIGHTS_Q)
         
-        # Normalize
-        hist1 = hist1 / (hist1.sum() + 1e-10)
-        hist2 = hist2 / (hist2.sum() + 1e-10)
+        scores += _SCALE_WEIGHT_Q * np.array([self._scale_sims(scales) for scales in scales_list])
+        scores += _INTERVAL_WEIGHT_Q * np.array([
+            self._interval_sims(intervals) for intervals in intervals_list
+        ])
         
-        # Calculate correlation
-        return np.corrcoef(hist1, hist2)[0, 1]
+        return np.clip(scores * _WEIGHT_QUANTUM, 0.0, 1.0)
+    
+    def _scale_sims(self, scales: List[str]) -> np.ndarray:
+        """Scale similarity against every profile"""
+        if not scales:
+            return self._zero_sims
+        # Jaccard over bitmasks: popcount(a & b) / popcount(a | b)
+        mask, unknown = self._scale_mask(scales)
+        common = _popcount(self._scale_masks & np.uint32(mask))
+        total = _popcount(self._scale_masks | np.uint32(mask)) + len(unknown)
+        return common / np.maximum(total, 1)
+    
+    def _interval_sims(self, intervals: List[int]) -> np.ndarray:
+        """Interval similarity against every profile"""
+        # Tracks without interval data skip the per-profile kernel calls
+        if len(intervals) == 0:
+            return self._zero_sims
+        intervals = np.asarray(intervals, dtype=np.int64)
+        return np.array([
+            _interval_sim(intervals, profile_intervals)
+            for profile_intervals in self._interval_arrays
+        ])
+    
+    def _scale_mask(self, scales: List[str]) -> Tuple[int, Set[str]]:
+        """Fold scale names into a bitmask plus the names outside the profile set"""
+        mask = 0
+        unknown = set()
+        for name in scales:
+            bit = self._scale_bit.get(name)
+            if bit is not None:
+                mask |= bit
+            elif name == 'all':
+                mask |= self._all_scales_mask
+            else:
+                unknown.add(name)
+        return mask, unknown
     
     def _analyze_techniques(
         self,
-        features: StyleFeatures,
+        x: np.ndarray,
         style: GuitaristStyle
     ) -> Dict:
         """Analyze specific techniques used"""
         techniques = []
         characteristics = []
         
-        # Speed-based techniques
-        if features.speed_bpm > 160:
-            techniques.append("Fast alternate picking")
-            if style == GuitaristStyle.YNGWIE_MALMSTEEN:
-                techniques.append("Sweep picking")
-        
-        # Vibrato analysis
-        if features.vibrato_rate > 5:
-            characteristics.append("Wide, fast vibrato")
-        elif features.vibrato_rate > 3:
-            characteristics.append("Moderate vibrato")
-        
-        # Bending analysis
-        if features.bend_frequency > 0.4:
-            techniques.append("Frequent string bending")
-            characteristics.append("Blues influence")
+        # Evaluate every rule threshold at once
+        values = x[_RULE_FEATURES]
+        fired = (values > _RULE_LOWER) & (values <= _RULE_UPPER)
         
-        # Palm muting
-        if features.palm_mute_ratio > 0.5:
-            techniques.append("Heavy palm muting")
-            characteristics.append("Rhythm-focused")
-        
-        # Legato
-        if features.legato_ratio > 0.6:
-            techniques.append("Legato phrasing")
+        for (_, _, _, technique, characteristic), hit in zip(_TECHNIQUE_RULES, fired.tolist()):
+            if not hit:
+                continue
+            if technique:
+                techniques.append(technique)
+                extra = _STYLE_TECHNIQUES.get((style, technique))
+                if extra:
+                    techniques.append(extra)
+            if characteristic:
+                characteristics.append(characteristic)
         
         return {
             'techniques': techniques,
             'characteristics': characteristics
         }
     
-    def _get_practice_recommendations(self, style: str) -> List[str]:
+    def _get_practice_recommendations(self, style: str) -> Tuple[str, ...]:
         """Get practice recommendations for detected style"""
-        recommendations = {
-            GuitaristStyle.YNGWIE_MALMSTEEN.value: [
-                "Practice harmonic minor scales in all positions",
-                "Work on sweep picking arpeggios",
-                "Study Bach violin pieces",
-                "Focus on pedal point exercises"
-            ],
-            GuitaristStyle.RANDY_RHOADS.value: [
-                "Study classical guitar pieces",
-                "Practice natural and harmonic minor scales",
-                "Work on combining classical and rock techniques",
-                "Analyze modal progressions"
-            ],
-            GuitaristStyle.JAMES_HETFIELD.value: [
-                "Develop downpicking endurance",
-                "Practice palm muting techniques",
-                "Study chromatic riffs",
-                "Work on tight rhythm playing"
-            ],
-            GuitaristStyle.JOHN_PETRUCCI.value: [
-                "Practice odd time signatures",
-                "Study all modes and scales",
-                "Work on technical exercises",
-                "Analyze complex progressions"
-            ],
-            GuitaristStyle.ERIC_CLAPTON.value: [
-                "Master pentatonic scales",
-                "Practice string bending accuracy",
-                "Study blues turnarounds",
-                "Work on call-and-response phrasing"
-            ]
-        }
-        
-        return recommendations.get(style, ["Continue practicing fundamentals"])
+        return _RECOMMENDATIONS.get(style, _DEFAULT_RECOMMENDATIONS)
 
-    def __init__(self):
-        """Initialize empty __init__.py file"""
-        pass
+
+@functools.cache
+def get_detector() -> StyleDetector:
+    """Shared detector instance; profile tables are read-only after init"""
+    return StyleDetector()
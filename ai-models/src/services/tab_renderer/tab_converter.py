@@ -14,7 +14,7 @@ Features:
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set, Any, Union
+from typing import List, Dict, FrozenSet, Tuple, Optional, Set, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
@@ -23,9 +23,127 @@ from collections import defaultdict
 from itertools import combinations
 import music21
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from .._compat import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 
+# Highest fret on a standard guitar neck
+MAX_FRET = 24
+
+# 프렛 -> 손 포지션 (0: 개방, 1: 1-4, 5: 5-7, 8: 8-10, 12: 11-14, 15: 15+)
+_HAND_POSITION_LUT = np.empty(MAX_FRET + 1, dtype=np.int8)
+_HAND_POSITION_LUT[0] = 0
+_HAND_POSITION_LUT[1:5] = 1
+_HAND_POSITION_LUT[5:8] = 5
+_HAND_POSITION_LUT[8:11] = 8
+_HAND_POSITION_LUT[11:15] = 12
+_HAND_POSITION_LUT[15:] = 15
+_HAND_POSITION_LUT.flags.writeable = False
+
+
+def _difficulty(string: int, fret: int) -> float:
+    """포지션의 난이도 계산 (0-1)"""
+    # Open strings are easiest
+    if fret == 0:
+        return 0.0
+    
+    # Base difficulty increases with fret position
+    difficulty = fret / 24.0 * 0.3
+    
+    # High frets are harder
+    if fret > 12:
+        difficulty += (fret - 12) / 12.0 * 0.3
+    
+    # Extreme strings slightly harder
+    if string == 1 or string == 6:
+        difficulty += 0.1
+    
+    # Very high frets on low strings are hardest
+    if string <= 3 and fret > 15:
+        difficulty += 0.2
+    
+    return min(difficulty, 1.0)
+
+
+# (줄 0-6, 프렛 0-24) -> 난이도; 입력이 175가지뿐이라 import 시 전부 계산 (0번 줄은 미사용)
+_DIFFICULTY_LUT = np.array([
+    [_difficulty(string, fret) for fret in range(MAX_FRET + 1)]
+    for string in range(7)
+])
+_DIFFICULTY_LUT.flags.writeable = False
+
+
+@njit(cache=True)
+def _assign_positions_kernel(frets, difficulty, hand_positions, keep, strings,
+                             new_measure, prefer_open, prefer_low):
+    """노트별 (N, 6) 후보 중 점수가 가장 높은 줄 인덱스 (후보가 없으면 -1)
+    
+    이전 노트와의 이동 비용은 같은 마디 안에서만 계산한다.
+    hand_positions는 후보 프렛을 _HAND_POSITION_LUT으로 변환한 (N, 6) 배열이다.
+    """
+    n, k = frets.shape
+    chosen = np.full(n, -1, dtype=np.int64)
+    last_fret, last_string, last_position = -1, 0, 0
+    for i in range(n):
+        if new_measure[i]:
+            last_fret = -1
+        
+        best_j, best_score = -1, -1e18
+        for j in range(k):
+            if not keep[i, j]:
+                continue
+            score = 0.0
+            
+            # Prefer open strings
+            if prefer_open and frets[i, j] == 0:
+                score += 2.0
+            
+            # Prefer low positions
+            if prefer_low:
+                score += (12 - frets[i, j]) / 12.0
+            
+            # Minimize position changes
+            if last_fret >= 0:
+                score -= abs(hand_positions[i, j] - last_position) * 0.5
+                score -= abs(strings[j] - last_string) * 0.2
+            
+            # Consider difficulty
+            score -= difficulty[i, j] * 2.0
+            
+            # 동점이면 앞쪽 후보 유지
+            if score > best_score:
+                best_score, best_j = score, j
+        
+        chosen[i] = best_j
+        if best_j >= 0:
+            last_fret, last_string = frets[i, best_j], strings[best_j]
+            last_position = hand_positions[i, best_j]
+    return chosen
+
+
+# 한 포지션 후보의 레이아웃 (struct-of-arrays로 저장)
+_POSITION_DTYPE = np.dtype([
+    ('string', 'i1'),
+    ('fret', 'i1'),
+    ('difficulty', 'f8'),
+    ('is_open', '?'),
+    ('position', 'i1'),
+])
+
+
 class PlayingTechnique(Enum):
     """기타 연주 기법"""
     NORMAL = "normal"
@@ -43,17 +161,17 @@ class PlayingTechnique(Enum):
 
 class Tuning(Enum):
     """기타 튜닝 프리셋"""
-    STANDARD = [40, 45, 50, 55, 59, 64]  # E A D G B E
-    DROP_D = [38, 45, 50, 55, 59, 64]    # D A D G B E
-    HALF_STEP_DOWN = [39, 44, 49, 54, 58, 63]  # Eb Ab Db Gb Bb Eb
-    DROP_C = [36, 43, 48, 53, 57, 62]    # C G C F A D
-    OPEN_G = [38, 43, 50, 55, 59, 62]    # D G D G B D
-    DADGAD = [38, 45, 50, 55, 45, 62]    # D A D G A D
-    OPEN_D = [38, 45, 50, 54, 57, 62]    # D A D F# A D
-    BARITONE = [28, 33, 38, 43, 47, 52]  # B E A D F# B
+    STANDARD = (40, 45, 50, 55, 59, 64)  # E A D G B E
+    DROP_D = (38, 45, 50, 55, 59, 64)    # D A D G B E
+    HALF_STEP_DOWN = (39, 44, 49, 54, 58, 63)  # Eb Ab Db Gb Bb Eb
+    DROP_C = (36, 43, 48, 53, 57, 62)    # C G C F A D
+    OPEN_G = (38, 43, 50, 55, 59, 62)    # D G D G B D
+    DADGAD = (38, 45, 50, 55, 45, 62)    # D A D G A D
+    OPEN_D = (38, 45, 50, 54, 57, 62)    # D A D F# A D
+    BARITONE = (28, 33, 38, 43, 47, 52)  # B E A D F# B
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GuitarNote:
     """기타 노트 정보"""
     pitch: int  # MIDI pitch
@@ -68,21 +186,56 @@ class GuitarNote:
     difficulty: float = 0.0
 
 
-@dataclass
+# Structure-of-arrays layout for measure notes (one row per note, time-ordered)
+NOTE_DTYPE = np.dtype([
+    ('pitch', 'i2'),
+    ('start', 'f8'),
+    ('end', 'f8'),
+    ('string', 'i1'),      # 1-6
+    ('fret', 'i1'),        # 0-24
+    ('velocity', 'i2'),
+    ('difficulty', 'f8'),
+])
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TabMeasure:
     """탭 마디 정보"""
     number: int
     time_signature: Tuple[int, int]
     tempo: float
-    notes: List[GuitarNote] = field(default_factory=list)
+    note_data: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=NOTE_DTYPE))
+    techniques: Dict[int, List[PlayingTechnique]] = field(default_factory=dict)  # sparse, by note row
     chords: List[Dict] = field(default_factory=list)
     lyrics: Optional[str] = None
+    
+    @property
+    def notes(self) -> List[GuitarNote]:
+        """note_data 행을 GuitarNote로 변환 (접근 시 생성되는 사본)"""
+        data = self.note_data
+        return [
+            GuitarNote(
+                pitch=pitch,
+                start_time=start,
+                end_time=end,
+                string=string,
+                fret=fret,
+                velocity=velocity,
+                techniques=list(self.techniques.get(i, ())),
+                difficulty=difficulty
+            )
+            for i, (pitch, start, end, string, fret, velocity, difficulty) in enumerate(zip(
+                data['pitch'].tolist(), data['start'].tolist(), data['end'].tolist(),
+                data['string'].tolist(), data['fret'].tolist(), data['velocity'].tolist(),
+                data['difficulty'].tolist()
+            ))
+        ]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TabConfiguration:
     """탭 변환 설정"""
-    tuning: List[int] = field(default_factory=lambda: Tuning.STANDARD.value)
+    tuning: Tuple[int, ...] = Tuning.STANDARD.value
     capo_position: int = 0
     max_fret_span: int = 4  # Maximum fret span for one hand position
     prefer_open_strings: bool = True
@@ -95,29 +248,42 @@ class TabConfiguration:
     difficulty_threshold: float = 0.7  # 0-1, filter out too difficult positions
 
 
+def _preprocess_shapes(
+    shapes: Dict[str, FrozenSet[Tuple[int, int]]]
+) -> Dict[int, Tuple[Tuple[str, int, FrozenSet[Tuple[int, int]]], ...]]:
+    """코드 모양을 노트 수별 (이름, 최저 눌린 프렛, 포지션 집합) 튜플로 정리 (정의 순서 유지)"""
+    by_length = defaultdict(list)
+    for name, shape in shapes.items():
+        by_length[len(shape)].append((name, min(f for _, f in shape if f > 0), shape))
+    return {length: tuple(entries) for length, entries in by_length.items()}
+
+
 class ChordShapeDetector:
     """코드 모양 감지기"""
     
     COMMON_SHAPES = {
         # Major chords
-        "C": [(1, 0), (2, 1), (3, 0), (4, 2), (5, 3)],
-        "G": [(1, 3), (2, 0), (3, 0), (4, 0), (5, 2), (6, 3)],
-        "D": [(1, 2), (2, 3), (3, 2), (4, 0)],
-        "A": [(1, 0), (2, 2), (3, 2), (4, 2), (5, 0)],
-        "E": [(1, 0), (2, 0), (3, 1), (4, 2), (5, 2), (6, 0)],
-        "F": [(1, 1), (2, 1), (3, 2), (4, 3), (5, 3), (6, 1)],
+        "C": frozenset({(1, 0), (2, 1), (3, 0), (4, 2), (5, 3)}),
+        "G": frozenset({(1, 3), (2, 0), (3, 0), (4, 0), (5, 2), (6, 3)}),
+        "D": frozenset({(1, 2), (2, 3), (3, 2), (4, 0)}),
+        "A": frozenset({(1, 0), (2, 2), (3, 2), (4, 2), (5, 0)}),
+        "E": frozenset({(1, 0), (2, 0), (3, 1), (4, 2), (5, 2), (6, 0)}),
+        "F": frozenset({(1, 1), (2, 1), (3, 2), (4, 3), (5, 3), (6, 1)}),
         
         # Minor chords
-        "Am": [(1, 0), (2, 1), (3, 2), (4, 2), (5, 0)],
-        "Em": [(1, 0), (2, 0), (3, 0), (4, 2), (5, 2), (6, 0)],
-        "Dm": [(1, 1), (2, 3), (3, 2), (4, 0)],
+        "Am": frozenset({(1, 0), (2, 1), (3, 2), (4, 2), (5, 0)}),
+        "Em": frozenset({(1, 0), (2, 0), (3, 0), (4, 2), (5, 2), (6, 0)}),
+        "Dm": frozenset({(1, 1), (2, 3), (3, 2), (4, 0)}),
         
         # 7th chords
-        "G7": [(1, 1), (2, 0), (3, 0), (4, 0), (5, 2), (6, 3)],
-        "C7": [(1, 0), (2, 1), (3, 3), (4, 2), (5, 3)],
-        "D7": [(1, 2), (2, 1), (3, 2), (4, 0)],
+        "G7": frozenset({(1, 1), (2, 0), (3, 0), (4, 0), (5, 2), (6, 3)}),
+        "C7": frozenset({(1, 0), (2, 1), (3, 3), (4, 2), (5, 3)}),
+        "D7": frozenset({(1, 2), (2, 1), (3, 2), (4, 0)}),
     }
     
+    # 길이가 다른 모양은 오프셋 계산 전에 제외
+    _PREPROCESSED_SHAPES = _preprocess_shapes(COMMON_SHAPES)
+    
     def detect_chord_shape(self, notes: List[GuitarNote]) -> Optional[str]:
         """노트 그룹에서 코드 모양 감지"""
         if len(notes) < 3:
@@ -125,32 +291,35 @@ class ChordShapeDetector:
             
         positions = [(n.string, n.fret) for n in notes]
         
-        # Check against known shapes
-        for chord_name, shape in self.COMMON_SHAPES.items():
-            if self._matches_shape(positions, shape):
+        # 모양과 무관한 값은 루프 밖에서 한 번만 계산
+        min_fret_positions = min((f for _, f in positions if f > 0), default=0)
+        if min_fret_positions == 0:
+            # 개방현만으로는 어떤 모양과도 일치하지 않음
+            return None
+        position_set = frozenset(positions)
+        
+        # Check against known shapes with the same note count
+        for chord_name, min_fret_shape, shape in self._PREPROCESSED_SHAPES.get(len(positions), ()):
+            # Allow for barre chords (same shape moved up the neck)
+            offset = min_fret_positions - min_fret_shape
+            if self._matches_shape(position_set, shape, offset):
                 return chord_name
         
         return None
     
-    def _matches_shape(self, positions: List[Tuple[int, int]], shape: List[Tuple[int, int]]) -> bool:
-        """포지션이 코드 모양과 일치하는지 확인"""
-        # Allow for barre chords (same shape moved up the neck)
-        if len(positions) != len(shape):
-            return False
-            
-        # Find the offset (for barre chords)
-        min_fret_positions = min(p[1] for p in positions if p[1] > 0)
-        min_fret_shape = min(s[1] for s in shape if s[1] > 0)
-        offset = min_fret_positions - min_fret_shape
-        
-        # Check if all positions match with offset
-        for pos in positions:
-            string, fret = pos
-            adjusted_shape = [(s, f + offset if f > 0 else 0) for s, f in shape]
-            if pos not in adjusted_shape:
-                return False
-        
-        return True
+    def _matches_shape(
+        self,
+        positions: FrozenSet[Tuple[int, int]],
+        shape: FrozenSet[Tuple[int, int]],
+        offset: int
+    ) -> bool:
+        """포지션이 (offset만큼 이동한) 코드 모양과 일치하는지 확인"""
+        if offset == 0:
+            return positions <= shape
+        
+        # Check if all positions match with offset (for barre chords)
+        shifted_shape = frozenset((s, f + offset if f > 0 else 0) for s, f in shape)
+        return positions <= shifted_shape
 
 
 class TabConverter:
@@ -159,7 +328,48 @@ class TabConverter:
     def __init__(self, config: Optional[TabConfiguration] = None):
         self.config = config or TabConfiguration()
         self.chord_detector = ChordShapeDetector()
-        self.position_cache = {}  # Cache for position calculations
+        self._tuning_arr = np.asarray(self.config.tuning, dtype=np.int32)
+        self._string_idx = np.arange(1, len(self.config.tuning) + 1, dtype=np.int32)
+        self._build_position_tables()
+    
+    def _build_position_tables(self):
+        """MIDI 피치(0-127) x 줄 조회 테이블을 한 번에 생성"""
+        frets = np.arange(128, dtype=np.int32)[:, None] - self._tuning_arr[None, :]
+        valid = (frets >= 0) & (frets <= MAX_FRET)  # Standard guitar range
+        strings = np.broadcast_to(self._string_idx, frets.shape)
+        
+        # 불가능한 칸은 -1
+        self._fret_lut = np.where(valid, frets, -1).astype(np.int8)
+        self._diff_lut = np.where(valid, _DIFFICULTY_LUT[strings, np.clip(frets, 0, MAX_FRET)], 0.0)
+        
+        # 피치별 후보 배열
+        self._position_table = []
+        for pitch in range(128):
+            row_valid = valid[pitch]
+            row_frets = frets[pitch][row_valid]
+            positions = np.zeros(len(row_frets), dtype=_POSITION_DTYPE)
+            positions['string'] = self._string_idx[row_valid]
+            positions['fret'] = row_frets
+            positions['difficulty'] = self._diff_lut[pitch][row_valid]
+            positions['is_open'] = row_frets == 0
+            positions['position'] = _HAND_POSITION_LUT[row_frets]
+            self._position_table.append(positions)
+        self._no_positions = np.zeros(0, dtype=_POSITION_DTYPE)
+        
+        # 핑거링 최적화용: (피치, 목표 손 포지션) -> 목표에서 max_fret_span 이내인 첫 후보 행 (-1: 없음)
+        self._relocation_lut = np.full((128, MAX_FRET + 1), -1, dtype=np.int8)
+        targets = np.unique(_HAND_POSITION_LUT)
+        for pitch, positions in enumerate(self._position_table):
+            if len(positions) == 0:
+                continue
+            reachable = np.abs(positions['position'][None, :] - targets[:, None]) <= self.config.max_fret_span
+            has_any = reachable.any(axis=1)
+            self._relocation_lut[pitch, targets[has_any]] = reachable[has_any].argmax(axis=1)
+        
+        # 조회 결과는 복사 없이 공유하므로 읽기 전용으로 고정
+        for table in (self._fret_lut, self._diff_lut, self._relocation_lut, self._no_positions,
+                      *self._position_table):
+            table.flags.writeable = False
         
     def convert_midi_to_tab(
         self,
@@ -173,26 +383,52 @@ class TabConverter:
         # 1. Group notes into measures
         measures = self._group_into_measures(midi_notes, time_signature, tempo)
         
-        # 2. Convert each measure
+        if not measures:
+            return []
+        
+        # 2. 모든 노트를 한 테이블에 모으고 포지션을 한 번에 계산
+        notes = [note for measure in measures for note in measure]
+        new_measure = np.zeros(len(notes), dtype=np.bool_)
+        new_measure[np.cumsum([0] + [len(m) for m in measures[:-1]])] = True
+        
+        table = np.zeros(len(notes), dtype=NOTE_DTYPE)
+        table['pitch'] = [n['pitch'] for n in notes]
+        table['start'] = [n['start'] for n in notes]
+        table['end'] = [n['end'] for n in notes]
+        table['velocity'] = [n.get('velocity', 80) for n in notes]
+        strings, frets, difficulty = self._assign_positions(table['pitch'], new_measure)
+        table['string'] = strings
+        table['fret'] = frets
+        table['difficulty'] = difficulty
+        found = strings >= 0
+        if not found.all():
+            # 노트마다 경고하지 않고 변환 단위로 한 번만 기록
+            missing = table['pitch'][~found]
+            logger.warning(
+                "No valid position found for %d notes (pitches: %s)",
+                len(missing), sorted(set(missing.tolist()))
+            )
+        
+        # 3. Convert each measure
         tab_measures = []
+        offset = 0
         for measure_num, measure_notes in enumerate(measures):
+            # 마디 노트는 이미 시작 시간 순
+            end = offset + len(measure_notes)
             tab_measure = TabMeasure(
                 number=measure_num + 1,
                 time_signature=time_signature,
-                tempo=tempo
+                tempo=tempo,
+                note_data=table[offset:end][found[offset:end]]
             )
+            offset = end
             
-            # 3. Detect chords if enabled
+            # 4. Detect chords if enabled
             if self.config.detect_chords:
                 chord_groups = self._detect_chord_groups(measure_notes)
                 for group in chord_groups:
                     self._assign_chord_fingerings(group)
             
-            # 4. Convert individual notes
-            for note_data in measure_notes:
-                guitar_notes = self._convert_note(note_data, tab_measure)
-                tab_measure.notes.extend(guitar_notes)
-            
             # 5. Optimize fingering if enabled
             if self.config.optimize_fingering:
                 self._optimize_measure_fingering(tab_measure)
@@ -205,175 +441,59 @@ class TabConverter:
         
         return tab_measures
     
-    def _convert_note(self, note_data: Dict, measure: TabMeasure) -> List[GuitarNote]:
-        """단일 노트를 기타 포지션으로 변환"""
-        pitch = note_data['pitch']
-        
+    def _assign_positions(
+        self,
+        pitches: np.ndarray,
+        new_measure: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """모든 노트의 (줄, 프렛, 난이도)를 일괄 계산 (후보가 없는 노트는 줄 -1)"""
         # Apply capo adjustment
-        adjusted_pitch = pitch - self.config.capo_position
-        
-        # Find all possible positions
-        positions = self._find_positions(adjusted_pitch)
-        
-        # Filter by configuration
-        positions = self._filter_positions(positions)
-        
-        if not positions:
-            logger.warning(f"No valid position found for pitch {pitch}")
-            return []
-        
-        # Select optimal position
-        optimal_pos = self._select_optimal_position(
-            positions,
-            measure.notes,
-            note_data
+        pitches = pitches.astype(np.int64) - self.config.capo_position
+        in_range = (pitches >= 0) & (pitches < 128)
+        rows = np.where(in_range, pitches, 0)
+        
+        # (N, 6) 후보 테이블
+        cand_frets = self._fret_lut[rows]
+        cand_diff = self._diff_lut[rows]
+        keep = self._candidate_mask(cand_frets, cand_diff) & in_range[:, None]
+        hand_positions = _HAND_POSITION_LUT[np.clip(cand_frets, 0, MAX_FRET)]
+        
+        # 마디 첫 노트(new_measure)에서 이전 노트 문맥 초기화
+        chosen = _assign_positions_kernel(
+            cand_frets, cand_diff, hand_positions, keep, self._string_idx,
+            new_measure, self.config.prefer_open_strings, self.config.prefer_low_positions
         )
         
-        guitar_note = GuitarNote(
-            pitch=pitch,
-            start_time=note_data['start'],
-            end_time=note_data['end'],
-            string=optimal_pos['string'],
-            fret=optimal_pos['fret'],
-            velocity=note_data.get('velocity', 80),
-            difficulty=optimal_pos['difficulty']
-        )
-        
-        return [guitar_note]
-    
-    def _find_positions(self, pitch: int) -> List[Dict]:
-        """주어진 피치에 대한 모든 가능한 포지션 찾기"""
-        
-        # Check cache
-        if pitch in self.position_cache:
-            return self.position_cache[pitch].copy()
-        
-        positions = []
-        
-        for string_idx, open_pitch in enumerate(self.config.tuning):
-            fret = pitch - open_pitch
-            
-            if 0 <= fret <= 24:  # Standard guitar range
-                difficulty = self._calculate_difficulty(string_idx + 1, fret)
-                
-                positions.append({
-                    'string': string_idx + 1,
-                    'fret': fret,
-                    'difficulty': difficulty,
-                    'is_open': fret == 0,
-                    'position': self._get_hand_position(fret)
-                })
-        
-        # Cache the result
-        self.position_cache[pitch] = positions.copy()
-        
-        return positions
+        found = chosen >= 0
+        idx = np.flatnonzero(found)
+        strings = np.full(len(pitches), -1, dtype=np.int64)
+        frets = np.zeros(len(pitches), dtype=np.int64)
+        difficulty = np.zeros(len(pitches), dtype=np.float64)
+        strings[found] = self._string_idx[chosen[found]]
+        frets[found] = cand_frets[idx, chosen[found]]
+        difficulty[found] = cand_diff[idx, chosen[found]]
+        return strings, frets, difficulty
     
-    def _filter_positions(self, positions: List[Dict]) -> List[Dict]:
-        """설정에 따라 포지션 필터링"""
-        filtered = []
-        
-        for pos in positions:
-            # Skip positions beyond preference
-            if pos['fret'] > self.config.max_position and not pos['is_open']:
-                continue
-            
-            # Skip too difficult positions
-            if pos['difficulty'] > self.config.difficulty_threshold:
-                continue
-            
-            filtered.append(pos)
-        
-        return filtered
+    def _find_positions(self, pitch: int) -> np.ndarray:
+        """주어진 피치에 대한 모든 가능한 포지션 찾기 (읽기 전용 _POSITION_DTYPE 배열)"""
+        if not 0 <= pitch < 128:
+            return self._no_positions
+        return self._position_table[pitch]
     
-    def _select_optimal_position(
-        self,
-        positions: List[Dict],
-        previous_notes: List[GuitarNote],
-        note_data: Dict
-    ) -> Dict:
-        """최적의 포지션 선택"""
-        
-        if not positions:
-            return None
-        
-        # If only one position, return it
-        if len(positions) == 1:
-            return positions[0]
-        
-        # Calculate scores for each position
-        scored_positions = []
-        
-        for pos in positions:
-            score = 0.0
-            
-            # Prefer open strings
-            if self.config.prefer_open_strings and pos['is_open']:
-                score += 2.0
-            
-            # Prefer low positions
-            if self.config.prefer_low_positions:
-                score += (12 - pos['fret']) / 12.0
-            
-            # Minimize position changes
-            if previous_notes:
-                last_note = previous_notes[-1]
-                position_change = abs(pos['position'] - self._get_hand_position(last_note.fret))
-                string_change = abs(pos['string'] - last_note.string)
-                
-                score -= position_change * 0.5
-                score -= string_change * 0.2
-            
-            # Consider difficulty
-            score -= pos['difficulty'] * 2.0
-            
-            # Store score
-            scored_positions.append((score, pos))
-        
-        # Sort by score (highest first)
-        scored_positions.sort(key=lambda x: x[0], reverse=True)
-        
-        return scored_positions[0][1]
+    def _candidate_mask(self, frets: np.ndarray, difficulty: np.ndarray) -> np.ndarray:
+        """설정에 따라 사용할 수 있는 후보 마스크 (불가능한 칸은 프렛 -1)"""
+        # Skip positions beyond preference, skip too difficult positions
+        return (
+            (frets >= 0)
+            & ((frets <= self.config.max_position) | (frets == 0))
+            & (difficulty <= self.config.difficulty_threshold)
+        )
     
     def _calculate_difficulty(self, string: int, fret: int) -> float:
         """포지션의 난이도 계산 (0-1)"""
-        difficulty = 0.0
-        
-        # Open strings are easiest
-        if fret == 0:
-            return 0.0
-        
-        # Base difficulty increases with fret position
-        difficulty += fret / 24.0 * 0.3
-        
-        # High frets are harder
-        if fret > 12:
-            difficulty += (fret - 12) / 12.0 * 0.3
-        
-        # Extreme strings slightly harder
-        if string == 1 or string == 6:
-            difficulty += 0.1
-        
-        # Very high frets on low strings are hardest
-        if string <= 3 and fret > 15:
-            difficulty += 0.2
-        
-        return min(difficulty, 1.0)
-    
-    def _get_hand_position(self, fret: int) -> int:
-        """프렛에서 손 포지션 계산"""
-        if fret == 0:
-            return 0
-        elif fret <= 4:
-            return 1
-        elif fret <= 7:
-            return 5
-        elif fret <= 10:
-            return 8
-        elif fret <= 14:
-            return 12
-        else:
-            return 15
+        if 0 <= string < _DIFFICULTY_LUT.shape[0] and 0 <= fret <= MAX_FRET:
+            return float(_DIFFICULTY_LUT[string, fret])
+        return _difficulty(string, fret)
     
     def _group_into_measures(
         self,
@@ -381,7 +501,7 @@ class TabConverter:
         time_signature: Tuple[int, int],
         tempo: float
     ) -> List[List[Dict]]:
-        """노트를 마디로 그룹화"""
+        """노트를 마디로 그룹화 (각 마디의 노트는 시작 시간 순으로 정렬)"""
         
         if not notes:
             return []
@@ -391,55 +511,40 @@ class TabConverter:
         beat_duration = 60.0 / tempo
         measure_duration = beats_per_measure * beat_duration
         
-        measures = []
-        current_measure = []
-        measure_start_time = 0.0
-        
-        for note in sorted(notes, key=lambda n: n['start']):
-            # Check if note starts in current measure
-            if note['start'] >= measure_start_time + measure_duration:
-                # Start new measure
-                if current_measure:
-                    measures.append(current_measure)
-                current_measure = []
-                measure_start_time += measure_duration
-            
-            current_measure.append(note)
-        
-        # Add last measure
-        if current_measure:
-            measures.append(current_measure)
+        # 시작 시간 기준 안정 정렬 후 마디 번호로 버킷팅
+        starts = np.fromiter((n['start'] for n in notes), dtype=np.float64, count=len(notes))
+        order = np.argsort(starts, kind='stable')
+        buckets = np.floor(starts[order] / measure_duration).astype(np.int64)
+        splits = np.flatnonzero(np.diff(buckets)) + 1
         
-        return measures
+        return [[notes[i] for i in group] for group in np.split(order, splits)]
     
     def _detect_chord_groups(self, notes: List[Dict]) -> List[List[Dict]]:
-        """동시에 연주되는 노트 그룹 감지"""
-        chord_groups = []
+        """동시에 연주되는 노트 그룹 감지 (notes는 시작 시간 순으로 정렬된 상태)"""
         tolerance = 0.05  # 50ms tolerance for "simultaneous"
         
-        # Sort by start time
-        sorted_notes = sorted(notes, key=lambda n: n['start'])
-        
-        current_group = []
-        group_start = None
-        
-        for note in sorted_notes:
-            if group_start is None:
-                group_start = note['start']
-                current_group = [note]
-            elif abs(note['start'] - group_start) <= tolerance:
-                current_group.append(note)
-            else:
-                if len(current_group) >= 2:  # At least 2 notes for a chord
-                    chord_groups.append(current_group)
-                group_start = note['start']
-                current_group = [note]
-        
-        # Add last group
-        if len(current_group) >= 2:
-            chord_groups.append(current_group)
-        
-        return chord_groups
+        if len(notes) < 2:
+            return []
+        
+        # 각 노트에서 시작한 그룹이 끝나는 위치 (start + tolerance 이내)를 한 번에 계산
+        starts = np.fromiter((n['start'] for n in notes), dtype=np.float64, count=len(notes))
+        group_end = np.searchsorted(starts, starts + tolerance, side='right')
+        
+        # 부동소수 경계 보정: 판정 기준은 (start - 그룹 시작) <= tolerance
+        edge = np.minimum(group_end, len(notes) - 1)
+        include = (group_end < len(notes)) & (starts[edge] - starts <= tolerance)
+        group_end = np.where(include, np.searchsorted(starts, starts[edge], side='right'), group_end)
+        last = group_end - 1
+        exclude = starts[last] - starts > tolerance
+        group_end = np.where(exclude, np.searchsorted(starts, starts[last], side='left'), group_end).tolist()
+        
+        # 그룹 첫 노트 기준으로 묶어 연쇄적인 드리프트 방지
+        bounds = [0]
+        while bounds[-1] < len(notes):
+            bounds.append(group_end[bounds[-1]])
+        
+        # At least 2 notes for a chord
+        return [notes[a:b] for a, b in zip(bounds, bounds[1:]) if b - a >= 2]
     
     def _assign_chord_fingerings(self, chord_notes: List[Dict]):
         """코드 노트에 최적의 핑거링 할당"""
@@ -447,14 +552,14 @@ class TabConverter:
         temp_notes = []
         for note in chord_notes:
             positions = self._find_positions(note['pitch'])
-            if positions:
+            if len(positions):
                 # Use first position temporarily
                 temp_notes.append(GuitarNote(
                     pitch=note['pitch'],
                     start_time=note['start'],
                     end_time=note['end'],
-                    string=positions[0]['string'],
-                    fret=positions[0]['fret'],
+                    string=int(positions['string'][0]),
+                    fret=int(positions['fret'][0]),
                     velocity=note.get('velocity', 80)
                 ))
         
@@ -463,107 +568,109 @@ class TabConverter:
         
         if chord_shape:
             # Apply known chord fingering
-            logger.info(f"Detected chord shape: {chord_shape}")
+            logger.info("Detected chord shape: %s", chord_shape)
             for note in chord_notes:
                 note['chord_shape'] = chord_shape
                 note['is_chord_tone'] = True
     
     def _optimize_measure_fingering(self, measure: TabMeasure):
         """마디 내 핑거링 최적화"""
-        if len(measure.notes) < 2:
+        if len(measure.note_data) < 2:
             return
         
         # Group notes by time proximity
-        note_groups = self._group_by_time_proximity(measure.notes)
+        note_groups = self._group_by_time_proximity(measure.note_data)
         
         for group in note_groups:
             if len(group) > 1:
-                self._optimize_group_fingering(group)
+                self._optimize_group_fingering(measure.note_data, group)
     
     def _group_by_time_proximity(
         self,
-        notes: List[GuitarNote],
+        notes: np.ndarray,
         threshold: float = 0.5
-    ) -> List[List[GuitarNote]]:
-        """시간적으로 가까운 노트들을 그룹화"""
-        groups = []
-        current_group = []
-        
-        for note in sorted(notes, key=lambda n: n.start_time):
-            if not current_group:
-                current_group = [note]
-            elif note.start_time - current_group[-1].end_time <= threshold:
-                current_group.append(note)
-            else:
-                groups.append(current_group)
-                current_group = [note]
-        
-        if current_group:
-            groups.append(current_group)
-        
-        return groups
+    ) -> List[np.ndarray]:
+        """시간적으로 가까운 노트들의 행 번호 그룹 (notes는 시작 시간 순으로 정렬된 상태)"""
+        # 직전 노트가 끝난 뒤 threshold보다 늦게 시작하면 새 그룹
+        gaps = notes['start'][1:] - notes['end'][:-1]
+        return np.split(np.arange(len(notes)), np.flatnonzero(gaps > threshold) + 1)
     
-    def _optimize_group_fingering(self, notes: List[GuitarNote]):
-        """노트 그룹의 핑거링 최적화"""
+    def _optimize_group_fingering(self, notes: np.ndarray, group: np.ndarray):
+        """노트 그룹의 핑거링 최적화 (notes의 group 행을 직접 수정)"""
         # Calculate average position
-        avg_fret = sum(n.fret for n in notes) / len(notes)
-        target_position = self._get_hand_position(int(avg_fret))
+        frets = notes['fret'][group].astype(np.int64)
+        avg_fret = frets.sum() / len(group)
+        target_position = int(_HAND_POSITION_LUT[min(int(avg_fret), MAX_FRET)])
+        current_positions = _HAND_POSITION_LUT[np.clip(frets, 0, MAX_FRET)]
         
         # Try to keep all notes within one position
-        for note in notes:
-            current_position = self._get_hand_position(note.fret)
+        for i, current_position in zip(group.tolist(), current_positions.tolist()):
             if abs(current_position - target_position) > self.config.max_fret_span:
-                # Find alternative position
-                alternatives = self._find_positions(note.pitch)
-                for alt in alternatives:
-                    alt_position = self._get_hand_position(alt['fret'])
-                    if abs(alt_position - target_position) <= self.config.max_fret_span:
-                        note.string = alt['string']
-                        note.fret = alt['fret']
-                        note.difficulty = alt['difficulty']
-                        break
+                # Find alternative position (미리 계산한 대체 후보 조회)
+                pitch = int(notes['pitch'][i])
+                if not 0 <= pitch < 128:
+                    continue
+                alt_index = self._relocation_lut[pitch, target_position]
+                if alt_index >= 0:
+                    alt = self._position_table[pitch][alt_index]
+                    notes['string'][i] = alt['string']
+                    notes['fret'][i] = alt['fret']
+                    notes['difficulty'][i] = alt['difficulty']
     
     def _detect_techniques(self, measure: TabMeasure):
-        """연주 기법 감지"""
-        notes = sorted(measure.notes, key=lambda n: n.start_time)
+        """연주 기법 감지 (measure.techniques에 행 번호별로 기록)"""
+        notes = measure.note_data
+        n = len(notes)
+        if n == 0:
+            return
         
-        for i in range(len(notes)):
-            current = notes[i]
-            
-            # Check for hammer-on/pull-off
-            if i > 0:
-                prev = notes[i - 1]
-                if (current.string == prev.string and
-                    abs(current.start_time - prev.end_time) < 0.05):
-                    
-                    if current.fret > prev.fret:
-                        current.techniques.append(PlayingTechnique.HAMMER_ON)
-                    elif current.fret < prev.fret:
-                        current.techniques.append(PlayingTechnique.PULL_OFF)
-            
-            # Check for slides
-            if i < len(notes) - 1:
-                next_note = notes[i + 1]
-                if (current.string == next_note.string and
-                    current.end_time >= next_note.start_time and
-                    abs(current.fret - next_note.fret) >= 2):
-                    
-                    if next_note.fret > current.fret:
-                        current.techniques.append(PlayingTechnique.SLIDE_UP)
-                    else:
-                        current.techniques.append(PlayingTechnique.SLIDE_DOWN)
-            
-            # Check for bends (based on pitch bend data if available)
-            # This would need pitch bend information from MIDI
-            
-            # Check for palm mutes (low velocity)
-            if current.velocity < 40:
-                current.techniques.append(PlayingTechnique.PALM_MUTE)
-            
-            # Check for harmonics (specific fret positions)
-            harmonic_frets = [12, 7, 5, 4, 3]
-            if current.fret in harmonic_frets and current.velocity > 100:
-                current.techniques.append(PlayingTechnique.HARMONIC)
+        strings = notes['string']
+        frets = notes['fret'].astype(np.int64)
+        starts = notes['start']
+        ends = notes['end']
+        velocities = notes['velocity']
+        
+        # Check for hammer-on/pull-off (이전 노트 기준, 첫 노트 제외)
+        hammer = np.zeros(n, dtype=np.bool_)
+        pull = np.zeros(n, dtype=np.bool_)
+        legato = (strings[1:] == strings[:-1]) & (np.abs(starts[1:] - ends[:-1]) < 0.05)
+        hammer[1:] = legato & (frets[1:] > frets[:-1])
+        pull[1:] = legato & (frets[1:] < frets[:-1])
+        
+        # Check for slides (다음 노트 기준, 마지막 노트 제외)
+        slide_up = np.zeros(n, dtype=np.bool_)
+        slide_down = np.zeros(n, dtype=np.bool_)
+        slide = (
+            (strings[:-1] == strings[1:])
+            & (ends[:-1] >= starts[1:])
+            & (np.abs(frets[:-1] - frets[1:]) >= 2)
+        )
+        slide_up[:-1] = slide & (frets[1:] > frets[:-1])
+        slide_down[:-1] = slide & (frets[1:] <= frets[:-1])
+        
+        # Check for bends (based on pitch bend data if available)
+        # This would need pitch bend information from MIDI
+        
+        # Check for palm mutes (low velocity)
+        palm_mute = velocities < 40
+        
+        # Check for harmonics (specific fret positions)
+        harmonic = np.isin(frets, (12, 7, 5, 4, 3)) & (velocities > 100)
+        
+        # 기법이 있는 행만 리스트로 변환 (기존 추가 순서 유지)
+        flags = (
+            (hammer, PlayingTechnique.HAMMER_ON),
+            (pull, PlayingTechnique.PULL_OFF),
+            (slide_up, PlayingTechnique.SLIDE_UP),
+            (slide_down, PlayingTechnique.SLIDE_DOWN),
+            (palm_mute, PlayingTechnique.PALM_MUTE),
+            (harmonic, PlayingTechnique.HARMONIC),
+        )
+        mask = np.stack([flag for flag, _ in flags], axis=1)
+        for i in np.flatnonzero(mask.any(axis=1)).tolist():
+            measure.techniques[i] = [
+                technique for hit, (_, technique) in zip(mask[i].tolist(), flags) if hit
+            ]
 
 
 def convert_midi_to_tab(
@@ -582,6 +689,7 @@ __all__ = [
     'TabConfiguration',
     'TabMeasure',
     'GuitarNote',
+    'NOTE_DTYPE',
     'PlayingTechnique',
     'Tuning',
     'convert_midi_to_tab'
@@ -14,11 +14,33 @@ Features:
 
 import json
 import logging
-from typing import List, Dict, Optional, Tuple, Any
+from bisect import bisect_right
+from collections import defaultdict
+from typing import List, Dict, Optional, Tuple, Any, BinaryIO
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import asyncio
 
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 from .tab_converter import (
     TabMeasure, GuitarNote, PlayingTechnique,
     TabConfiguration, Tuning
@@ -26,6 +48,80 @@ from .tab_converter import (
 
 logger = logging.getLogger(__name__)
 
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dumps(obj: Any) -> str:
+    """JSON 문자열로 직렬화 (orjson이 있으면 C 구현 사용)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """UTF-8 JSON 바이트로 직렬화"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json_array(f: BinaryIO, items: List[Any]) -> None:
+    """JSON 배열을 원소 단위로 기록 (메모리에는 원소 하나만 유지)"""
+    f.write(b'[')
+    for item_idx, item in enumerate(items):
+        if item_idx:
+            f.write(b',')
+        f.write(_dumps_bytes(item))
+    f.write(b']')
+
+
+def _r2(value: float) -> float:
+    """출력용 실수 값을 소수점 둘째 자리로 제한"""
+    return round(float(value), 2)
+
+
+@njit(cache=True)
+def _barres_kernel(strings, frets):
+    """프렛별 줄 수/최소/최대 줄을 한 번에 집계하여 바레 (3줄 이상) 반환
+    
+    결과는 프렛이 처음 등장한 순서를 따른다.
+    """
+    counts = np.zeros(128, dtype=np.int64)
+    min_s = np.zeros(128, dtype=np.int64)
+    max_s = np.zeros(128, dtype=np.int64)
+    order = np.empty(frets.shape[0], dtype=np.int64)
+    n_frets = 0
+    
+    for i in range(frets.shape[0]):
+        fret = frets[i]
+        if fret <= 0:
+            continue
+        string = strings[i]
+        if counts[fret] == 0:
+            order[n_frets] = fret
+            n_frets += 1
+            min_s[fret] = string
+            max_s[fret] = string
+        else:
+            min_s[fret] = min(min_s[fret], string)
+            max_s[fret] = max(max_s[fret], string)
+        counts[fret] += 1
+    
+    from_s = np.empty(n_frets, dtype=np.int64)
+    to_s = np.empty(n_frets, dtype=np.int64)
+    barre_frets = np.empty(n_frets, dtype=np.int64)
+    n_barres = 0
+    for j in range(n_frets):
+        fret = order[j]
+        if counts[fret] >= 3:
+            from_s[n_barres] = max_s[fret]
+            to_s[n_barres] = min_s[fret]
+            barre_frets[n_barres] = fret
+            n_barres += 1
+    
+    return from_s[:n_barres], to_s[:n_barres], barre_frets[:n_barres]
+
 
 @dataclass
 class RenderConfiguration:
@@ -58,6 +154,17 @@ class RenderConfiguration:
     dpi: int = 300
 
 
+@dataclass
+class NoteArrays:
+    """마디 노트의 구조 배열(SoA) 뷰 (행 = 노트)"""
+    starts: np.ndarray     # float64
+    ends: np.ndarray       # float64
+    strings: np.ndarray    # int8, 1-6
+    frets: np.ndarray      # int8
+    shapes: np.ndarray     # object, chord_shape 또는 None
+    techniques: Dict[int, List[PlayingTechnique]]  # sparse, by note row
+
+
 class VexFlowFormatter:
     """VexFlow 포맷터"""
     
@@ -75,6 +182,12 @@ class VexFlowFormatter:
         PlayingTechnique.DEAD_NOTE: "X"
     }
     
+    # 주법별 annotation modifier를 미리 만들어 모든 노트가 공유 (읽기 전용으로 취급)
+    _TECH_MODIFIERS = {
+        tech: {"type": "annotation", "text": symbol, "position": "above"}
+        for tech, symbol in TECHNIQUE_SYMBOLS.items()
+    }
+    
     # Note duration mappings
     DURATION_MAP = {
         4.0: "w",      # whole note
@@ -85,6 +198,13 @@ class VexFlowFormatter:
         0.125: "32",   # thirty-second note
     }
     
+    # DURATION_MAP을 짧은 음표부터 정렬한 기호와, 이웃한 두 길이의 중간점
+    # (중간점에서는 DURATION_MAP 순서대로 긴 음표가 우선)
+    _DURATION_SYMBOLS = tuple(symbol for _, symbol in sorted(DURATION_MAP.items()))
+    _DURATION_BOUNDS = tuple(
+        (a + b) / 2 for a, b in zip(sorted(DURATION_MAP), sorted(DURATION_MAP)[1:])
+    )
+    
     @staticmethod
     def format_tab_note(note: GuitarNote, measure_duration: float) -> Dict:
         """기타 노트를 VexFlow 형식으로 변환"""
@@ -94,72 +214,57 @@ class VexFlowFormatter:
         # Basic note object
         vexflow_note = {
             "positions": [{
-                "str": 6 - note.string + 1,  # VexFlow uses reverse string numbering
-                "fret": note.fret
+                "str": 7 - int(note.string),  # VexFlow uses reverse string numbering
+                "fret": int(note.fret)
             }],
             "duration": vexflow_duration
         }
         
         # Add techniques
         if note.techniques:
-            modifiers = []
-            for tech in note.techniques:
-                if tech in VexFlowFormatter.TECHNIQUE_SYMBOLS:
-                    modifiers.append({
-                        "type": "annotation",
-                        "text": VexFlowFormatter.TECHNIQUE_SYMBOLS[tech],
-                        "position": "above"
-                    })
-            vexflow_note["modifiers"] = modifiers
+            vexflow_note["modifiers"] = VexFlowFormatter._technique_modifiers(note.techniques)
         
         return vexflow_note
     
+    @staticmethod
+    def _technique_modifiers(techniques: List[PlayingTechnique]) -> List[Dict]:
+        """주법을 VexFlow annotation modifier로 변환"""
+        lookup = VexFlowFormatter._TECH_MODIFIERS.get
+        return [modifier for modifier in map(lookup, techniques) if modifier is not None]
+    
     @staticmethod
     def _get_vexflow_duration(duration: float, measure_duration: float) -> str:
         """시간을 VexFlow duration으로 변환"""
         # Calculate relative duration
         relative_duration = duration / measure_duration * 4  # Assuming 4/4 time
         
-        # Find closest duration
-        closest_duration = min(
-            VexFlowFormatter.DURATION_MAP.keys(),
-            key=lambda x: abs(x - relative_duration)
-        )
-        
-        return VexFlowFormatter.DURATION_MAP[closest_duration]
+        # Find closest duration (중간점 경계 이진 탐색)
+        index = bisect_right(VexFlowFormatter._DURATION_BOUNDS, relative_duration)
+        return VexFlowFormatter._DURATION_SYMBOLS[index]
     
     @staticmethod
     def format_chord_diagram(chord_shape: str, positions: List[Tuple[int, int]]) -> Dict:
         """코드 다이어그램 생성"""
         return {
             "chord": chord_shape,
-            "positions": [{"str": s, "fret": f} for s, f in positions],
+            "positions": [{"str": int(s), "fret": int(f)} for s, f in positions],
             "barres": VexFlowFormatter._detect_barres(positions)
         }
     
     @staticmethod
     def _detect_barres(positions: List[Tuple[int, int]]) -> List[Dict]:
         """바레 코드 감지"""
-        barres = []
-        fret_groups = {}
-        
-        # Group by fret
-        for string, fret in positions:
-            if fret > 0:
-                if fret not in fret_groups:
-                    fret_groups[fret] = []
-                fret_groups[fret].append(string)
+        if len(positions) < 3:
+            return []
         
         # Detect barres (3+ strings on same fret)
-        for fret, strings in fret_groups.items():
-            if len(strings) >= 3:
-                barres.append({
-                    "from_string": max(strings),
-                    "to_string": min(strings),
-                    "fret": fret
-                })
+        positions = np.asarray(positions, dtype=np.int8).reshape(-1, 2)
+        from_s, to_s, frets = _barres_kernel(positions[:, 0], positions[:, 1])
         
-        return barres
+        return [
+            {"from_string": from_string, "to_string": to_string, "fret": fret}
+            for from_string, to_string, fret in zip(from_s.tolist(), to_s.tolist(), frets.tolist())
+        ]
 
 
 class TabRenderer:
@@ -175,7 +280,7 @@ class TabRenderer:
             "config": asdict(self.config),
             "staves": [],
             "chord_diagrams": [],
-            "tempo": measures[0].tempo if measures else 120,
+            "tempo": _r2(measures[0].tempo) if measures else 120,
             "time_signature": measures[0].time_signature if measures else [4, 4]
         }
         
@@ -213,16 +318,18 @@ class TabRenderer:
             "chord_diagrams": []
         }
         
-        y_position = system_idx * (self.config.system_spacing + 100)
+        # 좌표는 정수 픽셀로 출력
+        y_position = int(system_idx * (self.config.system_spacing + 100))
+        measure_width = int(self.config.width // self.config.measures_per_line)
         
         for measure_idx, measure in enumerate(measures):
-            x_position = measure_idx * (self.config.width // self.config.measures_per_line)
+            x_position = measure_idx * measure_width
             
             # Create stave
             stave_data = {
                 "x": x_position + 10,
                 "y": y_position,
-                "width": (self.config.width // self.config.measures_per_line) - 20,
+                "width": measure_width - 20,
                 "options": {
                     "num_lines": 6,
                     "spacing_between_lines_px": self.config.tab_line_spacing
@@ -240,75 +347,112 @@ class TabRenderer:
                         "bpm": int(measure.tempo)
                     }
             
+            # 노트 속성을 마디당 한 번 배열로 모아 이후 단계에서 공유
+            note_arrays = self._notes_to_soa(measure)
+            
             # Add notes
-            stave_data["notes"] = self._render_measure_notes(measure)
+            stave_data["notes"] = self._render_measure_notes(measure, note_arrays)
             
             # Add chord diagrams
-            chord_diagrams = self._extract_chord_diagrams(measure)
+            chord_diagrams = self._extract_chord_diagrams(measure, note_arrays)
             if chord_diagrams and self.config.show_chord_diagrams:
                 for diagram in chord_diagrams:
                     diagram["x"] = x_position + 10
-                    diagram["y"] = y_position - self.config.chord_diagram_size - 10
+                    diagram["y"] = y_position - int(self.config.chord_diagram_size) - 10
                     system_data["chord_diagrams"].append(diagram)
             
             system_data["staves"].append(stave_data)
         
         return system_data
     
-    def _render_measure_notes(self, measure: TabMeasure) -> List[Dict]:
+    def _notes_to_soa(self, measure: TabMeasure) -> NoteArrays:
+        """마디 노트를 구조 배열 뷰로 변환"""
+        note_data = getattr(measure, 'note_data', None)
+        if note_data is not None:
+            # TabMeasure는 이미 구조 배열을 보유 (코드 모양은 노트 단위로 저장되지 않음)
+            return NoteArrays(
+                starts=note_data['start'],
+                ends=note_data['end'],
+                strings=note_data['string'],
+                frets=note_data['fret'],
+                shapes=np.full(len(note_data), None, dtype=object),
+                techniques=measure.techniques
+            )
+        
+        notes = measure.notes
+        count = len(notes)
+        shapes = np.empty(count, dtype=object)
+        shapes[:] = [note.chord_shape for note in notes]
+        return NoteArrays(
+            starts=np.fromiter((note.start_time for note in notes), dtype=np.float64, count=count),
+            ends=np.fromiter((note.end_time for note in notes), dtype=np.float64, count=count),
+            strings=np.fromiter((note.string for note in notes), dtype=np.int8, count=count),
+            frets=np.fromiter((note.fret for note in notes), dtype=np.int8, count=count),
+            shapes=shapes,
+            techniques={i: note.techniques for i, note in enumerate(notes) if note.techniques}
+        )
+    
+    def _render_measure_notes(self, measure: TabMeasure,
+                              note_arrays: Optional[NoteArrays] = None) -> List[Dict]:
         """마디의 노트 렌더링"""
+        if note_arrays is None:
+            note_arrays = self._notes_to_soa(measure)
+        
         vexflow_notes = []
+        measure_duration = self._calculate_measure_duration(measure)
+        
+        # VexFlow uses reverse string numbering
+        vf_strings = (7 - note_arrays.strings.astype(np.int64)).tolist()
+        frets = note_arrays.frets.tolist()
+        durations = (note_arrays.ends - note_arrays.starts).tolist()
         
         # Group simultaneous notes (chords)
-        note_groups = self._group_simultaneous_notes(measure.notes)
+        note_groups = self._group_simultaneous_notes(note_arrays.starts)
         
         for group in note_groups:
+            first = group[0]
+            duration = self.formatter._get_vexflow_duration(durations[first], measure_duration)
+            
             if len(group) == 1:
                 # Single note
-                vexflow_note = self.formatter.format_tab_note(
-                    group[0],
-                    self._calculate_measure_duration(measure)
-                )
+                vexflow_note = {
+                    "positions": [{"str": vf_strings[first], "fret": frets[first]}],
+                    "duration": duration
+                }
+                
+                # 주법이 있는 노트만 modifier 생성
+                techniques = note_arrays.techniques.get(first)
+                if techniques:
+                    vexflow_note["modifiers"] = self.formatter._technique_modifiers(techniques)
                 vexflow_notes.append(vexflow_note)
             else:
                 # Chord
-                positions = []
-                for note in group:
-                    positions.append({
-                        "str": 6 - note.string + 1,
-                        "fret": note.fret
-                    })
-                
-                chord_note = {
-                    "positions": positions,
-                    "duration": self.formatter._get_vexflow_duration(
-                        group[0].end_time - group[0].start_time,
-                        self._calculate_measure_duration(measure)
-                    )
-                }
-                vexflow_notes.append(chord_note)
+                vexflow_notes.append({
+                    "positions": [{"str": vf_strings[i], "fret": frets[i]} for i in group],
+                    "duration": duration
+                })
         
         return vexflow_notes
     
-    def _group_simultaneous_notes(self, notes: List[GuitarNote]) -> List[List[GuitarNote]]:
-        """동시 노트 그룹화"""
-        if not notes:
+    def _group_simultaneous_notes(self, starts: np.ndarray) -> List[List[int]]:
+        """동시 노트 그룹화 (시작 시간 배열 -> 노트 인덱스 그룹)"""
+        count = len(starts)
+        if not count:
             return []
         
-        groups = []
-        sorted_notes = sorted(notes, key=lambda n: n.start_time)
-        current_group = [sorted_notes[0]]
-        
-        for note in sorted_notes[1:]:
-            # Check if note starts at same time (within tolerance)
-            if abs(note.start_time - current_group[0].start_time) < 0.01:
-                current_group.append(note)
-            else:
-                groups.append(current_group)
-                current_group = [note]
+        tolerance = 0.01
+        order = np.argsort(starts, kind='stable')
+        sorted_starts = np.asarray(starts, dtype=np.float64)[order].tolist()
+        order = order.tolist()
         
-        if current_group:
-            groups.append(current_group)
+        # Check if note starts at same time as the group's first note (within tolerance)
+        groups = []
+        begin = 0
+        for i in range(1, count):
+            if sorted_starts[i] - sorted_starts[begin] >= tolerance:
+                groups.append(order[begin:i])
+                begin = i
+        groups.append(order[begin:])
         
         return groups
     
@@ -318,31 +462,78 @@ class TabRenderer:
         beat_duration = 60.0 / measure.tempo
         return beats_per_measure * beat_duration
     
-    def _extract_chord_diagrams(self, measure: TabMeasure) -> List[Dict]:
+    def _extract_chord_diagrams(self, measure: TabMeasure,
+                                note_arrays: Optional[NoteArrays] = None) -> List[Dict]:
         """마디에서 코드 다이어그램 추출"""
-        diagrams = []
-        seen_shapes = set()
-        
-        for note in measure.notes:
-            if note.chord_shape and note.chord_shape not in seen_shapes:
-                # Get all notes with this chord shape
-                chord_notes = [n for n in measure.notes if n.chord_shape == note.chord_shape]
-                positions = [(n.string, n.fret) for n in chord_notes]
-                
-                diagram = self.formatter.format_chord_diagram(note.chord_shape, positions)
-                diagrams.append(diagram)
-                seen_shapes.add(note.chord_shape)
+        if note_arrays is None:
+            note_arrays = self._notes_to_soa(measure)
         
-        return diagrams
+        # 코드 모양이 지정된 노트만 선택
+        rows = np.flatnonzero(note_arrays.shapes.astype(bool))
+        if not len(rows):
+            return []
+        
+        # Group note positions by chord shape (처음 등장한 순서 유지)
+        shape_positions = defaultdict(list)
+        for shape, string, fret in zip(note_arrays.shapes[rows].tolist(),
+                                       note_arrays.strings[rows].tolist(),
+                                       note_arrays.frets[rows].tolist()):
+            shape_positions[shape].append((string, fret))
+        
+        return [
+            self.formatter.format_chord_diagram(chord_shape, positions)
+            for chord_shape, positions in shape_positions.items()
+        ]
     
     def export_to_json(self, vexflow_data: Dict, output_path: Path) -> None:
-        """VexFlow 데이터를 JSON으로 내보내기"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(vexflow_data, f, indent=2, ensure_ascii=False)
+        """VexFlow 데이터를 JSON으로 내보내기
+        
+        staves 같은 큰 배열은 원소 단위로 기록하여 전체 문서를 메모리에 만들지 않는다.
+        """
+        with open(output_path, 'wb') as f:
+            f.write(b'{')
+            for key_idx, (key, value) in enumerate(vexflow_data.items()):
+                if key_idx:
+                    f.write(b',')
+                f.write(_dumps_bytes(str(key)))
+                f.write(b':')
+                
+                if isinstance(value, list):
+                    _write_json_array(f, value)
+                else:
+                    f.write(_dumps_bytes(value))
+            f.write(b'}')
+    
+    def export_to_script(self, vexflow_data: Dict, output_path: Path) -> None:
+        """VexFlow JavaScript 파일로 내보내기"""
+        with open(output_path, 'wb') as f:
+            self.generate_vexflow_script(vexflow_data, f)
+    
+    def generate_vexflow_script(self, vexflow_data: Dict,
+                                file: Optional[BinaryIO] = None) -> Optional[str]:
+        """VexFlow JavaScript 코드 생성
+        
+        file (바이너리 모드)이 주어지면 staves를 원소 단위로 바로 기록하고 None을 반환한다.
+        """
+        head, middle, tail = self._script_template(vexflow_data)
+        
+        if file is None:
+            return (
+                head + _dumps(vexflow_data['staves'])
+                + middle + _dumps(vexflow_data['chord_diagrams'])
+                + tail
+            )
+        
+        file.write(head.encode('utf-8'))
+        _write_json_array(file, vexflow_data['staves'])
+        file.write(middle.encode('utf-8'))
+        _write_json_array(file, vexflow_data['chord_diagrams'])
+        file.write(tail.encode('utf-8'))
+        return None
     
-    def generate_vexflow_script(self, vexflow_data: Dict) -> str:
-        """VexFlow JavaScript 코드 생성"""
-        script = f"""
+    def _script_template(self, vexflow_data: Dict) -> Tuple[str, str, str]:
+        """스크립트의 고정 부분 (staves 앞, staves와 chordDiagrams 사이, 끝)"""
+        head = f"""
 // Generated VexFlow Tab Script
 const VF = Vex.Flow;
 
@@ -353,8 +544,10 @@ renderer.resize({self.config.width}, {self.config.height});
 const context = renderer.getContext();
 
 // Render staves
-const staves = {json.dumps(vexflow_data['staves'])};
-const chordDiagrams = {json.dumps(vexflow_data['chord_diagrams'])};
+const staves = """
+        middle = """;
+const chordDiagrams = """
+        tail = f""";
 
 staves.forEach((staveData, index) => {{
     // Create stave
@@ -415,7 +608,7 @@ chordDiagrams.forEach(diagram => {{
     // This would require additional VexFlow chord diagram code
 }});
 """
-        return script
+        return head, middle, tail
 
 
 # API Integration functions
@@ -443,15 +636,13 @@ async def render_tab_to_file(
     output_path: Path,
     format: str = "json"
 ) -> None:
-    """탭을 파일로 렌더링"""
+    """탭을 파일로 렌더링 (파일 I/O는 이벤트 루프를 막지 않도록 스레드에서 수행)"""
     renderer = TabRenderer()
     
     if format == "json":
-        renderer.export_to_json(vexflow_data, output_path)
+        await asyncio.to_thread(renderer.export_to_json, vexflow_data, output_path)
     elif format == "js":
-        script = renderer.generate_vexflow_script(vexflow_data)
-        with open(output_path, 'w') as f:
-            f.write(script)
+        await asyncio.to_thread(renderer.export_to_script, vexflow_data, output_path)
     else:
         raise ValueError(f"Unsupported format: {format}")
 
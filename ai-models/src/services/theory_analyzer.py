@@ -4,11 +4,63 @@ Analyzes music theory aspects including chord progressions,
 modal interchange, and secondary dominants
 """
 
+import asyncio
+import functools
+import os
+from concurrent.futures.process import BrokenProcessPool
+
 import music21
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+from .process_pool import discard_process_pool, get_process_pool
+
+
+# Pieces shorter than this are analyzed in-process (pickling measures costs more)
+_PARALLEL_MIN_MEASURES = 64
+
+
+@functools.lru_cache(maxsize=256)
+def _pitch_class(name: str) -> Optional[int]:
+    """Pitch class of a note name (None if music21 cannot parse it)"""
+    try:
+        return music21.pitch.Pitch(name).pitchClass
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _key(key: str) -> music21.key.Key:
+    """Shared music21 Key object per key string"""
+    return music21.key.Key(key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _roman_numeral(root: str, key: str) -> str:
+    """Roman numeral of the chord built on root in key"""
+    chord_obj = music21.chord.Chord([root + '3', root + '5'])
+    rn = music21.roman.romanNumeralFromChord(chord_obj, _key(key))
+    return str(rn.romanNumeral)
+
+
 class TheoryAnalyzer:
+    # Pitch class of every standard spelling (music21 names, '-' = flat)
+    _NAME_TO_PC = {
+        letter + accidental: (pc + shift) % 12
+        for letter, pc in {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}.items()
+        for accidental, shift in {'': 0, '#': 1, '##': 2, '-': -1, '--': -2}.items()
+    }
+    
+    # Chord quality candidate by pitch-class set relative to the root, with the
+    # music21 check that confirms it (in the order the checks are tried)
+    _QUALITIES = {
+        frozenset((0, 4, 7)): ('maj', 'isMajorTriad'),
+        frozenset((0, 3, 7)): ('min', 'isMinorTriad'),
+        frozenset((0, 4, 7, 10)): ('7', 'isDominantSeventh'),
+        frozenset((0, 3, 6, 9)): ('dim7', 'isDiminishedSeventh'),
+        frozenset((0, 3, 6, 10)): ('m7b5', 'isHalfDiminishedSeventh'),
+    }
+    
     def __init__(self):
         self.ready = True
         
@@ -33,12 +85,9 @@ class TheoryAnalyzer:
             # Analyze key
             key_analysis = self._analyze_key(stream)
             
-            # Extract chord progression
-            chord_progression = self._extract_chords(stream)
-            
-            # Analyze roman numerals
-            roman_numerals = self._analyze_roman_numerals(
-                chord_progression,
+            # Extract chord progression and analyze roman numerals
+            chord_progression, roman_numerals = await self._analyze_chords(
+                stream,
                 key_analysis['key']
             )
             
@@ -107,25 +156,82 @@ class TheoryAnalyzer:
             'confidence': key.correlationCoefficient
         }
     
+    async def _analyze_chords(
+        self,
+        stream: music21.stream.Stream,
+        key: str
+    ) -> Tuple[List[Dict], List[str]]:
+        """Chord progression and roman numerals, split across processes for long pieces"""
+        measures = self._measures_with_offsets(stream)
+        workers = os.cpu_count() or 1
+        
+        # Only streams that already contain measures can use the pool (flat streams yield none)
+        if len(measures) < _PARALLEL_MIN_MEASURES or workers < 2:
+            chord_progression = self._chords_from_measures(measures)
+            return chord_progression, self._analyze_roman_numerals(chord_progression, key)
+        
+        # Measures are independent: one contiguous range per core, results kept in order
+        chunk_size = -(-len(measures) // workers)
+        pool = get_process_pool()
+        loop = asyncio.get_running_loop()
+        try:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool,
+                    _analyze_measure_chunk,
+                    measures[start:start + chunk_size],
+                    key
+                )
+                for start in range(0, len(measures), chunk_size)
+            ))
+        except BrokenProcessPool:
+            # A worker died; replace the pool for later calls and finish in-process
+            discard_process_pool(pool)
+            chord_progression = self._chords_from_measures(measures)
+            return chord_progression, self._analyze_roman_numerals(chord_progression, key)
+        
+        chord_progression = [chord for chunk_chords, _ in results for chord in chunk_chords]
+        roman_numerals = [rn for _, chunk_numerals in results for rn in chunk_numerals]
+        return chord_progression, roman_numerals
+    
+    def _measures_with_offsets(
+        self,
+        stream: music21.stream.Stream
+    ) -> List[Tuple[float, music21.stream.Measure]]:
+        """Measures paired with their offsets (offsets do not survive pickling)"""
+        return [
+            (measure.offset, measure)
+            for measure in stream.getElementsByClass(music21.stream.Measure)
+        ]
+    
     def _extract_chords(self, stream: music21.stream.Stream) -> List[Dict]:
         """Extract chord progression from stream"""
+        return self._chords_from_measures(self._measures_with_offsets(stream))
+    
+    def _chords_from_measures(
+        self,
+        measures: List[Tuple[float, music21.stream.Measure]]
+    ) -> List[Dict]:
+        """Extract one chord per measure"""
         chords = []
         
         # Segment stream into beats/measures
         # Simplified chord extraction
-        for measure in stream.getElementsByClass(music21.stream.Measure):
-            chord_tones = []
-            
-            for element in measure.flatten().notes:
-                if isinstance(element, music21.note.Note):
-                    chord_tones.append(element.pitch)
+        for offset, measure in measures:
+            if measure.hasVoices():
+                # Voices need a time-ordered merge, which flatten() provides
+                notes = measure.flatten().getElementsByClass(music21.note.Note)
+            else:
+                # Walk the measure in place instead of building a flattened copy
+                notes = measure.recurse().getElementsByClass(music21.note.Note)
+            chord_tones = [n.pitch for n in notes]
             
             if chord_tones:
                 chord = music21.chord.Chord(chord_tones)
                 chords.append({
                     'root': chord.root().name if chord.root() else 'N/A',
                     'quality': self._determine_chord_quality(chord),
-                    'beat': measure.offset,
+                    'beat': offset,
                     'bass': chord.bass().name if chord.bass() else None
                 })
         
@@ -133,19 +239,20 @@ class TheoryAnalyzer:
     
     def _determine_chord_quality(self, chord: music21.chord.Chord) -> str:
         """Determine chord quality (major, minor, etc.)"""
-        if chord.isMajorTriad():
-            return 'maj'
-        elif chord.isMinorTriad():
-            return 'min'
-        elif chord.isDominantSeventh():
-            return '7'
-        elif chord.isDiminishedSeventh():
-            return 'dim7'
-        elif chord.isHalfDiminishedSeventh():
-            return 'm7b5'
-        else:
-            # More complex chord identification
-            return chord.commonName if hasattr(chord, 'commonName') else 'unknown'
+        # Pitch classes usually select the one check that can succeed
+        root_pc = chord.root().pitchClass
+        signature = frozenset((pc - root_pc) % 12 for pc in chord.pitchClasses)
+        candidate = self._QUALITIES.get(signature)
+        if candidate is not None and getattr(chord, candidate[1])():
+            return candidate[0]
+        
+        # music21 checks are spelling-based, so enharmonic chords need the full chain
+        for quality, check in self._QUALITIES.values():
+            if getattr(chord, check)():
+                return quality
+        
+        # More complex chord identification
+        return chord.commonName if hasattr(chord, 'commonName') else 'unknown'
     
     def _analyze_roman_numerals(
         self,
@@ -154,21 +261,12 @@ class TheoryAnalyzer:
     ) -> List[str]:
         """Convert chord progression to Roman numeral analysis"""
         roman_numerals = []
-        key_obj = music21.key.Key(key)
+        _key(key)  # Validate the key up front
         
         for chord in chord_progression:
             try:
-                # Create chord object
-                chord_obj = music21.chord.Chord(
-                    [chord['root'] + '3', chord['root'] + '5']
-                )
-                
-                # Get Roman numeral
-                rn = music21.roman.romanNumeralFromChord(
-                    chord_obj,
-                    key_obj
-                )
-                roman_numerals.append(str(rn.romanNumeral))
+                # Get Roman numeral (cached per root and key)
+                roman_numerals.append(_roman_numeral(chord['root'], key))
                 
             except:
                 roman_numerals.append('?')
@@ -216,34 +314,42 @@ class TheoryAnalyzer:
     ) -> List[Dict]:
         """Detect secondary dominant chords (V/x)"""
         secondary_dominants = []
+        if len(chord_progression) < 2:
+            return secondary_dominants
+        
+        # Root pitch classes of the whole progression (-1 = unknown)
+        pcs = np.fromiter(
+            (self._root_pitch_class(chord) for chord in chord_progression),
+            dtype=np.int8,
+            count=len(chord_progression)
+        )
+        
+        # Check if each chord is dominant of the next chord (perfect fifth above)
+        current_pcs, next_pcs = pcs[:-1], pcs[1:]
+        is_dominant = (current_pcs >= 0) & (next_pcs >= 0) & ((current_pcs - next_pcs) % 12 == 7)
         
-        for i in range(len(chord_progression) - 1):
+        for i in np.flatnonzero(is_dominant).tolist():
             current = chord_progression[i]
             next_chord = chord_progression[i + 1]
-            
-            # Check if current chord is dominant of next chord
-            if self._is_dominant_of(current, next_chord):
-                secondary_dominants.append({
-                    'chord': f"{current['root']}7",
-                    'target_chord': next_chord['root'],
-                    'measure': i + 1,
-                    'type': f"V/{next_chord['root']}"
-                })
+            secondary_dominants.append({
+                'chord': f"{current['root']}7",
+                'target_chord': next_chord['root'],
+                'measure': i + 1,
+                'type': f"V/{next_chord['root']}"
+            })
         
         return secondary_dominants
     
-    def _is_dominant_of(self, chord1: Dict, chord2: Dict) -> bool:
-        """Check if chord1 is dominant of chord2"""
-        # Simplified check - in production would be more thorough
+    def _root_pitch_class(self, chord: Dict) -> int:
+        """Pitch class of the chord root (-1 if unknown)"""
         try:
-            # Get pitch classes
-            pc1 = music21.pitch.Pitch(chord1['root']).pitchClass
-            pc2 = music21.pitch.Pitch(chord2['root']).pitchClass
-            
-            # Check if chord1 is perfect fifth above chord2
-            return (pc1 - pc2) % 12 == 7
+            # music21 only for non-standard spellings
+            pc = self._NAME_TO_PC.get(chord['root'])
+            if pc is None:
+                pc = _pitch_class(chord['root'])
+            return -1 if pc is None else pc
         except:
-            return False
+            return -1
     
     def _determine_minor_type(
         self,
@@ -265,3 +371,13 @@ class TheoryAnalyzer:
         # TODO: Implement sliding window key detection
         
         return modulations
+
+
+def _analyze_measure_chunk(
+    measures: List[Tuple[float, music21.stream.Measure]],
+    key: str
+) -> Tuple[List[Dict], List[str]]:
+    """Process pool worker: chords and roman numerals for a range of measures"""
+    analyzer = TheoryAnalyzer()
+    chord_progression = analyzer._chords_from_measures(measures)
+    return chord_progression, analyzer._analyze_roman_numerals(chord_progression, key)
@@ -11,9 +11,14 @@ Genesis Music - AI 기반 기타 학습 플랫폼
 """
 
 import asyncio
+import copy
+import hashlib
+import itertools
 import logging
 import json
 import uuid
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, Optional, Any, Union, Callable
 from datetime import datetime
@@ -22,7 +27,9 @@ from enum import Enum
 # Service imports
 from .basic_pitch_service import BasicPitchService, TranscriptionConfig, TranscriptionResult
 from .midi_to_tab_converter import MidiToTabConverter, TabConfig, Tuning
+from .process_pool import discard_process_pool, get_process_pool, shutdown_process_pool
 from ..processors.youtube_processor import YouTubeProcessor, DownloadConfig, DownloadProgress
+from core.config import settings
 
 # Music analysis
 try:
@@ -36,6 +43,133 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 메모리에 유지할 이론 분석 결과 수 (디스크 캐시는 temp 디렉터리에 무제한)
+THEORY_CACHE_SIZE = 256
+
+# 코드 진행으로 보고할 앞부분 코드 수
+CHORD_PROGRESSION_LIMIT = 20
+
+
+def _midi_digest(midi_path: str) -> Optional[str]:
+    """MIDI 파일 내용의 BLAKE2b 해시 (읽을 수 없으면 None)"""
+    try:
+        with open(midi_path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _read_theory_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """디스크 캐시 읽기 (없거나 손상되면 None)"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_theory_cache(cache_path: Path, result: Dict[str, Any]) -> None:
+    """디스크 캐시 쓰기"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+    except OSError as e:
+        logger.warning(f"Failed to write theory cache {cache_path}: {e}")
+
+
+def _first_chords(score, limit: int = CHORD_PROGRESSION_LIMIT) -> list:
+    """악보 앞부분의 코드 limit개
+    
+    chordify는 전체 악보의 세로 단면을 모두 만들기 때문에, 필요한 만큼의
+    마디만 잘라서 chordify하고 코드가 모자라면 범위를 두 배로 늘린다.
+    (chordify는 마디 단위로 나누므로 앞 마디의 결과는 동일)
+    """
+    measure_count = max(
+        (len(part.getElementsByClass('Measure')) for part in score.parts),
+        default=0
+    )
+    if not measure_count:
+        chords = score.chordify().recurse().getElementsByClass('Chord')
+        return list(itertools.islice(chords, limit))
+    
+    end = limit
+    while True:
+        excerpt = score.measures(0, end, indicesNotNumbers=True)
+        chords = excerpt.chordify().recurse().getElementsByClass('Chord')
+        chord_list = list(itertools.islice(chords, limit))
+        if len(chord_list) >= limit or end >= measure_count:
+            return chord_list
+        end *= 2
+
+
+def _analyze_theory_worker(midi_path: str) -> Dict[str, Any]:
+    """음악 이론 분석 (프로세스 풀 워커, JSON 직렬화 가능한 dict만 반환)"""
+    try:
+        # Load MIDI with music21
+        score = converter.parse(midi_path)
+        
+        analysis_result = {
+            'key': None,
+            'time_signature': None,
+            'chord_progression': [],
+            'scale_suggestions': []
+        }
+        
+        # Key analysis
+        try:
+            analyzed_key = score.analyze('key')
+            analysis_result['key'] = {
+                'tonic': str(analyzed_key.tonic),
+                'mode': analyzed_key.mode,
+                'confidence': analyzed_key.correlationCoefficient
+            }
+        except:
+            pass
+        
+        # Time signature
+        try:
+            ts = score.getTimeSignatures()[0]
+            analysis_result['time_signature'] = f"{ts.numerator}/{ts.denominator}"
+        except:
+            pass
+        
+        # Basic chord analysis (simplified)
+        try:
+            chord_list = []
+            for c in _first_chords(score):  # First 20 chords
+                chord_list.append({
+                    'chord': c.pitchedCommonName,
+                    'offset': float(c.offset)
+                })
+            analysis_result['chord_progression'] = chord_list
+        except:
+            pass
+        
+        # Scale suggestions based on key
+        if analysis_result['key']:
+            tonic = analysis_result['key']['tonic']
+            mode = analysis_result['key']['mode']
+            
+            if mode == 'major':
+                analysis_result['scale_suggestions'] = [
+                    f"{tonic} Major (Ionian)",
+                    f"{tonic} Mixolydian",
+                    f"{tonic} Major Pentatonic"
+                ]
+            else:
+                analysis_result['scale_suggestions'] = [
+                    f"{tonic} Natural Minor (Aeolian)",
+                    f"{tonic} Dorian",
+                    f"{tonic} Minor Pentatonic"
+                ]
+        
+        return analysis_result
+        
+    except Exception as e:
+        logger.error(f"Theory analysis failed: {e}")
+        return {'error': str(e)}
+
 
 class ProcessingStage(Enum):
     """처리 단계"""
@@ -82,6 +216,10 @@ class TranscriptionService:
         self.is_initialized = False
         self.active_jobs = {}  # job_id -> TranscriptionJob
         
+        # MIDI 내용 해시 -> 이론 분석 결과 (메모리 LRU + 디스크)
+        self._theory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.theory_cache_dir = Path(settings.TEMP_DIR) / "theory_cache"
+        
     async def initialize(self):
         """서비스 초기화"""
         try:
@@ -114,6 +252,12 @@ class TranscriptionService:
             logger.error(f"Failed to initialize transcription service: {e}")
             raise
     
+    async def shutdown(self):
+        """서비스 종료 (이론 분석 프로세스 풀 정리)"""
+        await asyncio.to_thread(shutdown_process_pool)
+        self.is_initialized = False
+        logger.info("Transcription service shut down")
+    
     async def process_youtube_url(
         self,
         url: str,
@@ -265,7 +409,7 @@ class TranscriptionService:
         if progress_callback:
             progress_callback(job.progress, job.message)
         
-        tab_result = await self.midi_to_tab_converter.convert_midi_to_tab(
+        tab_result = await self.midi_to_tab_converter.convert_midi_to_tab_async(
             transcription_result.midi_data
         )
         
@@ -300,75 +444,62 @@ class TranscriptionService:
         logger.info(f"Job {job.job_id} completed successfully")
     
     async def _analyze_theory(self, midi_path: Path) -> Dict[str, Any]:
-        """음악 이론 분석"""
+        """음악 이론 분석 (music21 작업은 프로세스 풀에서 실행)"""
         if not HAS_MUSIC21:
             return {'error': 'music21 not installed'}
-            
+        
+        # 같은 MIDI 내용이면 캐시된 결과 사용 (파싱 생략)
+        digest = await asyncio.to_thread(_midi_digest, str(midi_path))
+        if digest is not None:
+            cached = await self._get_cached_theory(digest)
+            if cached is not None:
+                return cached
+        
+        # music21 분석은 CPU 작업이므로 공유 프로세스 풀에서 실행
+        pool = get_process_pool()
+        loop = asyncio.get_running_loop()
         try:
-            # Load MIDI with music21
-            score = converter.parse(str(midi_path))
-            
-            analysis_result = {
-                'key': None,
-                'time_signature': None,
-                'chord_progression': [],
-                'scale_suggestions': []
-            }
-            
-            # Key analysis
-            try:
-                analyzed_key = score.analyze('key')
-                analysis_result['key'] = {
-                    'tonic': str(analyzed_key.tonic),
-                    'mode': analyzed_key.mode,
-                    'confidence': analyzed_key.correlationCoefficient
-                }
-            except:
-                pass
-            
-            # Time signature
-            try:
-                ts = score.getTimeSignatures()[0]
-                analysis_result['time_signature'] = f"{ts.numerator}/{ts.denominator}"
-            except:
-                pass
-            
-            # Basic chord analysis (simplified)
-            try:
-                chords = score.chordify()
-                chord_list = []
-                for c in chords.recurse().getElementsByClass('Chord')[:20]:  # First 20 chords
-                    chord_list.append({
-                        'chord': c.pitchedCommonName,
-                        'offset': float(c.offset)
-                    })
-                analysis_result['chord_progression'] = chord_list
-            except:
-                pass
-            
-            # Scale suggestions based on key
-            if analysis_result['key']:
-                tonic = analysis_result['key']['tonic']
-                mode = analysis_result['key']['mode']
-                
-                if mode == 'major':
-                    analysis_result['scale_suggestions'] = [
-                        f"{tonic} Major (Ionian)",
-                        f"{tonic} Mixolydian",
-                        f"{tonic} Major Pentatonic"
-                    ]
-                else:
-                    analysis_result['scale_suggestions'] = [
-                        f"{tonic} Natural Minor (Aeolian)",
-                        f"{tonic} Dorian",
-                        f"{tonic} Minor Pentatonic"
-                    ]
-            
-            return analysis_result
-            
+            result = await loop.run_in_executor(pool, _analyze_theory_worker, str(midi_path))
+        except BrokenProcessPool as e:
+            # 워커가 죽은 풀은 재사용할 수 없으므로 다음 호출에서 새로 생성
+            discard_process_pool(pool)
+            logger.error(f"Theory analysis worker crashed: {e}")
+            return {'error': str(e)}
         except Exception as e:
+            # 결과 직렬화 실패 등 워커 밖에서 발생한 오류
             logger.error(f"Theory analysis failed: {e}")
             return {'error': str(e)}
+        
+        if digest is not None and 'error' not in result:
+            self._remember_theory(digest, result)
+            await asyncio.to_thread(
+                _write_theory_cache, self.theory_cache_dir / f"{digest}.json", result
+            )
+        
+        return copy.deepcopy(result)
+    
+    async def _get_cached_theory(self, digest: str) -> Optional[Dict[str, Any]]:
+        """캐시된 이론 분석 결과 조회 (메모리 -> 디스크 순)"""
+        result = self._theory_cache.get(digest)
+        if result is not None:
+            self._theory_cache.move_to_end(digest)
+        else:
+            result = await asyncio.to_thread(
+                _read_theory_cache, self.theory_cache_dir / f"{digest}.json"
+            )
+            if result is None:
+                return None
+            self._remember_theory(digest, result)
+        
+        logger.info(f"Theory analysis cache hit: {digest}")
+        return copy.deepcopy(result)
+    
+    def _remember_theory(self, digest: str, result: Dict[str, Any]):
+        """메모리 LRU 캐시에 결과 저장"""
+        self._theory_cache[digest] = result
+        self._theory_cache.move_to_end(digest)
+        while len(self._theory_cache) > THEORY_CACHE_SIZE:
+            self._theory_cache.popitem(last=False)
     
     async def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """작업 상태 조회"""
@@ -446,6 +577,8 @@ if __name__ == "__main__":
         )
         
         print(f"Started YouTube job: {job_id}")
+        
+        await service.shutdown()
     
     # 비동기 실행
     asyncio.run(test_service())
\ No newline at end of file
@@ -4,6 +4,7 @@ Test suite for AI Service components
 
 import pytest
 import numpy as np
+import music21
 from unittest.mock import Mock, patch, MagicMock
 import sys
 from pathlib import Path
@@ -14,6 +15,18 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 from services.basic_pitch_service import BasicPitchService
 from services.transcription import TranscriptionService
 from services.youtube_processor import YouTubeProcessor
+from services.style_detector import StyleDetector, _bin12, _interval_sim_np
+from services._style_kernels_aot import interval_sim
+from services.guitar_learning_engine import (
+    GuitarLearningEngine, GuitarExercise, GuitarTechnique, FretboardPosition,
+    TECHNIQUE_LEGATO, _evaluate_all
+)
+from services.midi_to_tab_converter import (
+    MidiToTabConverter, TabConfig, Technique, TECHNIQUE_CODES, TAB_NOTE_DTYPE
+)
+from services.tab_renderer.tab_converter import TabConverter
+from services.tab_renderer.tab_renderer import TabRenderer
+from services.theory_analyzer import TheoryAnalyzer
 
 
 class TestBasicPitchService:
@@ -56,6 +69,47 @@ class TestTranscriptionService:
         service = TranscriptionService()
         service.set_job_id("test-job-123")
         assert service.job_id == "test-job-123"
+    
+    @pytest.mark.asyncio
+    async def test_theory_cache_hit_returns_copy(self, tmp_path):
+        """Test a cache hit skips the worker and returns an independent copy"""
+        midi_path = tmp_path / "song.mid"
+        midi_path.write_bytes(b"MThd")
+        service = TranscriptionService()
+        service.theory_cache_dir = tmp_path / "theory_cache"
+        worker = Mock(return_value={'key': {'tonic': 'C', 'mode': 'major'}, 'chord_progression': []})
+        
+        # No process pool: run_in_executor uses the default thread pool, so the mock is seen
+        with patch('services.transcription.HAS_MUSIC21', True), \
+                patch('services.transcription.get_process_pool', return_value=None), \
+                patch('services.transcription._analyze_theory_worker', worker):
+            first = await service._analyze_theory(midi_path)
+            first['key']['tonic'] = 'G'
+            second = await service._analyze_theory(midi_path)
+        
+        assert worker.call_count == 1
+        assert second['key']['tonic'] == 'C'
+    
+    @pytest.mark.asyncio
+    async def test_theory_errors_not_cached(self, tmp_path):
+        """Test a failed analysis is retried instead of served from the cache"""
+        midi_path = tmp_path / "song.mid"
+        midi_path.write_bytes(b"MThd")
+        service = TranscriptionService()
+        service.theory_cache_dir = tmp_path / "theory_cache"
+        worker = Mock(side_effect=[{'error': 'parse failed'}, {'key': None, 'chord_progression': []}])
+        
+        with patch('services.transcription.HAS_MUSIC21', True), \
+                patch('services.transcription.get_process_pool', return_value=None), \
+                patch('services.transcription._analyze_theory_worker', worker):
+            first = await service._analyze_theory(midi_path)
+            assert not service._theory_cache
+            assert not list(service.theory_cache_dir.glob('*.json'))
+            second = await service._analyze_theory(midi_path)
+        
+        assert first == {'error': 'parse failed'}
+        assert second == {'key': None, 'chord_progression': []}
+        assert worker.call_count == 2
 
 
 class TestYouTubeProcessor:
@@ -88,4 +142,233 @@ class TestYouTubeProcessor:
         ]
         
         for url in invalid_urls:
-            assert processor.validate_url(url) == False
\ No newline at end of file
+            assert processor.validate_url(url) == False
+
+
+class TestStyleDetector:
+    """Test Style detector"""
+    
+    def test_initialization(self):
+        """Test detector initialization"""
+        detector = StyleDetector()
+        assert detector.is_ready()
+        assert detector.style_profiles
+    
+    def test_bin12_uses_interval_class_axis(self):
+        """Test both histograms share the same 12 semitone bins"""
+        hist1 = _bin12(np.array([3, 4, 5, 7, 12]))
+        hist2 = _bin12(np.array([1, 2, 5, 7, 12]))
+        
+        assert hist1.shape == hist2.shape == (12,)
+        assert np.flatnonzero(hist1).tolist() == [0, 3, 4, 5, 7]
+        assert np.flatnonzero(hist2).tolist() == [0, 1, 2, 5, 7]
+    
+    def test_interval_sim_kernels(self):
+        """Test the interval kernels compute the Pearson correlation of the histograms"""
+        a = np.array([3, 4, 5, 7, 12])
+        b = np.array([1, 2, 5, 7, 12])
+        expected = np.corrcoef(_bin12(a), _bin12(b))[0, 1]
+        
+        assert interval_sim(a, b) == pytest.approx(expected)
+        assert _interval_sim_np(a, b) == pytest.approx(expected)
+    
+    def test_interval_sims(self):
+        """Test interval similarity against every profile"""
+        detector = StyleDetector()
+        intervals = [3, 4, 5, 7, 12]
+        expected = np.array([
+            np.corrcoef(_bin12(np.array(intervals)), _bin12(np.array(p.common_intervals)))[0, 1]
+            for p in detector.style_profiles.values()
+        ])
+        
+        assert detector._interval_sims(intervals) == pytest.approx(expected)
+    
+    def test_interval_sims_constant_histogram(self):
+        """Test a constant histogram gives 0.0 instead of NaN"""
+        detector = StyleDetector()
+        every_class = list(range(12))
+        
+        assert interval_sim(np.array(every_class), np.array([3, 4])) == 0.0
+        assert _interval_sim_np(np.array(every_class), np.array([3, 4])) == 0.0
+        assert detector._interval_sims(every_class).tolist() == [0.0] * len(detector.style_profiles)
+    
+    def test_scale_sims_all_pattern(self):
+        """Test 'all' scores like listing every known scale"""
+        detector = StyleDetector()
+        known = sorted(detector._scale_bit)
+        sims = detector._scale_sims(['all'])
+        
+        assert sims.tolist() == detector._scale_sims(known).tolist()
+        for style, similarity in zip(detector.style_profiles, sims):
+            patterns = detector.style_profiles[style].scale_patterns
+            expected = 1.0 if patterns == ['all'] else len(patterns) / len(known)
+            assert similarity == pytest.approx(expected)
+    
+    def test_score_batch_ranks_own_profile_first(self):
+        """Test each profile's own features score highest against that profile"""
+        detector = StyleDetector()
+        profiles = list(detector.style_profiles.values())
+        
+        scores = detector._score_batch(
+            detector._profile_mat,
+            [p.scale_patterns for p in profiles],
+            [p.common_intervals for p in profiles]
+        )
+        assert scores.argmax(axis=1).tolist() == list(range(len(profiles)))
+        assert np.diag(scores) == pytest.approx(1.0)
+
+class TestGuitarLearningEngine:
+    """Test guitar learning engine evaluation"""
+    
+    @staticmethod
+    def _exercise(technique=GuitarTechnique.ALTERNATE_PICKING):
+        return GuitarExercise(
+            name="Test Arpeggio",
+            technique=technique,
+            difficulty=3,
+            tempo_bpm=120,
+            duration_bars=1,
+            tab_notation="e|-----8--|\nB|--5-----|\nG|5-------|",
+            fingering=[1, 1, 4],
+            position=FretboardPosition.FIFTH,
+            tips=()
+        )
+    
+    def test_exercise_targets(self):
+        """Test tab columns become one target note per beat"""
+        engine = GuitarLearningEngine()
+        target_times, target_pitches = engine._exercise_targets(self._exercise())
+        
+        assert target_times.tolist() == [0.0, 0.5, 1.0]
+        assert target_pitches.tolist() == [60.0, 64.0, 72.0]
+    
+    def test_evaluate_performance_perfect_take(self):
+        """Test an exact, evenly picked take scores full marks"""
+        engine = GuitarLearningEngine()
+        recorded = [
+            {"time": 1.0, "pitch": 72, "velocity": 90},
+            {"time": 0.0, "pitch": 60, "velocity": 90},
+            {"time": 0.5, "pitch": 64, "velocity": 90},
+        ]
+        
+        evaluation = engine.evaluate_performance(recorded, self._exercise())
+        assert evaluation["overall_accuracy"] == 1.0
+        assert evaluation["timing_accuracy"] == 1.0
+        assert evaluation["technique_quality"] == 1.0
+        assert evaluation["score"] == 100
+        assert evaluation["improvement_areas"] == []
+    
+    def test_evaluate_all_single_pass(self):
+        """Test pitch, timing and legato scores from one kernel call"""
+        # [onset, pitch, velocity]: late second note, wrong third pitch, fading velocity
+        recorded = np.array([
+            [0.0, 60.0, 100.0],
+            [0.7, 64.0, 80.0],
+            [1.0, 71.0, 60.0],
+        ])
+        target_times = np.array([0.0, 0.5, 1.0])
+        target_pitches = np.array([60.0, 64.0, 72.0])
+        
+        pitch_acc, timing_acc, technique_score = _evaluate_all(
+            recorded, target_times, target_pitches, TECHNIQUE_LEGATO
+        )
+        assert pitch_acc == pytest.approx(2 / 3)
+        assert timing_acc == pytest.approx(1 - 0.4 / 3)
+        assert technique_score == 1.0
+
+
+class TestMidiToTabConverter:
+    """Test MIDI to Tab converter"""
+    
+    @staticmethod
+    def _tab_notes(rows):
+        """(string, fret, start, velocity) rows as a TAB_NOTE_DTYPE array"""
+        notes = np.zeros(len(rows), dtype=TAB_NOTE_DTYPE)
+        for i, (string, fret, start, velocity) in enumerate(rows):
+            notes[i] = (string, fret, start, 0.1, 0, velocity)
+        return notes
+    
+    def test_organize_measures_after_silence(self):
+        """Test notes after a multi-measure rest land in their own measure"""
+        converter = MidiToTabConverter()
+        tab_notes = self._tab_notes([(1, 0, 0.0, 80), (1, 2, 0.5, 80), (2, 3, 9.0, 80)])
+        chords = [{'name': 'C', 'time': 9.1}]
+        
+        # 120 BPM in 4/4: two seconds per measure
+        measures = converter._organize_measures(
+            tab_notes, [()] * 3, chords, {'tempo': 120, 'time_signatures': [(4, 4)]}
+        )
+        assert [m.measure_number for m in measures] == [1, 2, 3, 4, 5]
+        assert [len(m.notes) for m in measures] == [2, 0, 0, 0, 1]
+        assert measures[4].notes['start'].tolist() == [9.0]
+        assert measures[4].chords == chords
+    
+    def test_hammer_on_needs_velocity_drop(self):
+        """Test velocity jitter below the threshold is not read as legato"""
+        converter = MidiToTabConverter(TabConfig(hammer_vel_drop=10))
+        # Same string, 50 ms apart, one fret up: only the velocity drop differs
+        jitter = converter._detect_techniques(self._tab_notes([(1, 5, 0.0, 80), (1, 6, 0.05, 75)]))
+        hammer = converter._detect_techniques(self._tab_notes([(1, 5, 0.0, 80), (1, 6, 0.05, 70)]))
+        
+        assert jitter['technique'][1] == TECHNIQUE_CODES[Technique.NORMAL]
+        assert hammer['technique'][1] == TECHNIQUE_CODES[Technique.HAMMER_ON]
+
+
+class TestTabConverter:
+    """Test tab renderer converter"""
+    
+    def test_group_into_measures_after_silence(self):
+        """Test unsorted notes are grouped by measure, skipping silent measures"""
+        converter = TabConverter()
+        notes = [
+            {'pitch': 67, 'start': 9.0, 'end': 9.5},
+            {'pitch': 64, 'start': 0.5, 'end': 1.0},
+            {'pitch': 60, 'start': 0.0, 'end': 0.5},
+            {'pitch': 65, 'start': 0.5, 'end': 1.0},
+        ]
+        
+        # 120 BPM in 4/4: two seconds per measure
+        measures = converter._group_into_measures(notes, (4, 4), 120.0)
+        assert [[n['pitch'] for n in m] for m in measures] == [[60, 64, 65], [67]]
+
+class TestTabRenderer:
+    """Test tab renderer"""
+    
+    def test_group_simultaneous_notes(self):
+        """Test grouping is anchored on each group's first note"""
+        renderer = TabRenderer()
+        group = renderer._group_simultaneous_notes
+        
+        # Exactly the 10 ms tolerance apart: separate groups
+        assert group(np.array([0.0, 0.01])) == [[0], [1]]
+        # Steps under 10 ms must not chain into one group
+        assert group(np.array([0.0, 0.006, 0.012, 0.018])) == [[0, 1], [2, 3]]
+        # Unsorted input: groups in time order, indices into the input
+        assert group(np.array([0.5, 0.0, 0.504, 0.002])) == [[1, 3], [0, 2]]
+        assert group(np.array([])) == []
+
+
+class TestTheoryAnalyzer:
+    """Test theory analyzer"""
+    
+    @pytest.mark.parametrize("pitches, quality", [
+        (["C4", "E4", "G4"], "maj"),
+        (["A3", "C4", "E4"], "min"),
+        (["G3", "B3", "D4", "F4"], "7"),
+        (["B3", "D4", "F4", "A4"], "m7b5"),
+        # Diminished seventh spelled enharmonically (A instead of B double-flat)
+        (["C4", "E-4", "G-4", "A4"], "dim7"),
+    ])
+    def test_determine_chord_quality(self, pitches, quality):
+        """Test the pitch-class candidate confirmed by music21's spelling check"""
+        analyzer = TheoryAnalyzer()
+        assert analyzer._determine_chord_quality(music21.chord.Chord(pitches)) == quality
+    
+    def test_determine_chord_quality_enharmonic_fallback(self):
+        """Test a candidate rejected by the spelling check falls back to music21's name"""
+        analyzer = TheoryAnalyzer()
+        # Minor-triad pitch classes, but D# is not a minor third above C
+        chord = music21.chord.Chord(["C4", "D#4", "G4"])
+        
+        assert analyzer._determine_chord_quality(chord) == chord.commonName
+        assert analyzer._determine_chord_quality(chord) != "min"